@@ -90,6 +90,10 @@ class LruTtlCache(Generic[K, V]):
             self._data.popitem(last=False)  # evict least-recently-used
             self.evictions += 1
 
+    def discard(self, key: K) -> None:
+        """Drop one entry if present (explicit invalidation)."""
+        self._data.pop(key, None)
+
     def clear(self) -> None:
         """Drop all entries (counters are preserved for observability)."""
         self._data.clear()
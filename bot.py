@@ -11,6 +11,7 @@ from datetime import datetime, timezone
 from typing import Optional, Set
 import os
 import sys
+import time
 from pathlib import Path
 import traceback
 import aiohttp
@@ -36,11 +37,12 @@ from utils.i18n import i18n
 # Slash command name/description localization (see docs/COMMAND_LOCALIZATION.md)
 from utils.command_translator import ModdyCommandTranslator
 # Import du système de permissions staff
-from utils.staff_permissions import setup_staff_permissions
+from utils.staff_permissions import setup_staff_permissions, StaffRole
 # Import du système de logging staff
 from utils.staff_logger import init_staff_logger
 # Import du gestionnaire de modules
 from modules.module_manager import ModuleManager
+from automod.cache import LruTtlCache, MISS
 # Import du système de configuration des annonces
 from utils.announcement_setup import setup_announcement_channel
 
@@ -106,7 +108,10 @@ class ModdyBot(commands.Bot):
 
         # Internal variables
         self.launch_time = datetime.now(timezone.utc)
+        self._launch_monotonic = time.monotonic()  # uptime without datetime math
+        self._cache_counts = (0, 0, float('-inf'))  # (guilds, users, monotonic timestamp)
         self._start_time = None  # Set in setup_hook once event loop is running
+        self._shutdown_task: Optional[asyncio.Task] = None  # Shared by concurrent close() calls
         self.db = None  # ModdyDatabase instance
         from services.case_service import CaseService
         self.cases = CaseService(self)  # scalable sanction -> case entry point
@@ -123,8 +128,8 @@ class ModdyBot(commands.Bot):
         self.maintenance_mode = False
         self.version = None  # Bot version from GitHub releases
 
-        # Cache for server prefixes
-        self.prefix_cache = {}
+        # Cache for server prefixes (bounded: one entry per guild that spoke)
+        self.prefix_cache = LruTtlCache(max_entries=10_000)
 
         # Gestionnaire de modules
         self.module_manager = None
@@ -753,8 +758,7 @@ class ModdyBot(commands.Bot):
         self.start_internal_api_server()
 
         # Set start time for /status uptime metric
-        import time as _time
-        self._start_time = _time.time()
+        self._start_time = time.time()
 
         # Connect to Redis
         if REDIS_URL:
@@ -852,7 +856,7 @@ class ModdyBot(commands.Bot):
                 if not hasattr(command, 'parent') or not command.parent:
                     try:
                         self.tree.remove_command(command.name)
-                    except:
+                    except Exception:
                         pass  # Déjà retiré (cas des groupes)
 
             # Synchroniser les commandes globales uniquement (accessibles partout)
@@ -990,7 +994,7 @@ class ModdyBot(commands.Bot):
                     # Try to send a followup message first (preferred)
                     try:
                         await interaction.followup.send(view=FallbackErrorView(), ephemeral=True)
-                    except:
+                    except Exception:
                         # If followup fails, edit the original response as fallback
                         await interaction.edit_original_response(content=None, view=FallbackErrorView())
                 else:
@@ -1027,6 +1031,23 @@ class ModdyBot(commands.Bot):
             if DEVELOPER_IDS:
                 self._dev_team_ids = set(DEVELOPER_IDS)
 
+    def uptime_seconds(self) -> int:
+        """Seconds since the bot was created"""
+        return int(time.monotonic() - self._launch_monotonic)
+
+    def cache_counts(self, max_age: float = 5.0) -> tuple:
+        """(guilds, users) counts from the cache, recomputed at most every max_age seconds
+
+        `guilds` and `users` copy the whole cache into a list on each access;
+        display paths (/ping, /status, stats) only need an approximate count.
+        """
+        guilds, users, ts = self._cache_counts
+        now = time.monotonic()
+        if now - ts > max_age:
+            guilds, users = len(self.guilds), len(self.users)
+            self._cache_counts = (guilds, users, now)
+        return guilds, users
+
     def is_developer(self, user_id: int) -> bool:
         """Checks if a user is a developer"""
         return user_id in self._dev_team_ids
@@ -1039,24 +1060,27 @@ class ModdyBot(commands.Bot):
 
         # Check the cache
         guild_id = message.guild.id
-        if guild_id in self.prefix_cache:
-            prefix = self.prefix_cache[guild_id]
-        else:
+        prefix = self.prefix_cache.get(guild_id)
+        if prefix is MISS:
             # Fetch from DB or use default
             prefix = await self.get_guild_prefix(guild_id) or DEFAULT_PREFIX
-            self.prefix_cache[guild_id] = prefix
+            self.prefix_cache.set(guild_id, prefix)
 
         # Return the prefix and mentions
         return [prefix, f'<@{self.user.id}> ', f'<@!{self.user.id}> ']
 
+    def invalidate_prefix(self, guild_id: int):
+        """Drops a server's cached prefix so the next message re-reads it"""
+        self.prefix_cache.discard(guild_id)
+
     async def get_guild_prefix(self, guild_id: int) -> Optional[str]:
         """Gets a server's prefix from the DB"""
         if not self.db:
             return None
 
         try:
-            guild_data = await self.db.get_guild(guild_id)
-            return guild_data['data'].get('config', {}).get('prefix')
+            prefix = await self.db.get_guild_data_value(guild_id, 'config.prefix')
+            return prefix if isinstance(prefix, str) else None
         except Exception as e:
             logger.error(f"DB Error (prefix): {e}")
             return None
@@ -1191,7 +1215,6 @@ class ModdyBot(commands.Bot):
                     logger.info(f"TEAM attribute set for {dev_id}")
 
                     # Auto-assign Manager + Dev roles for dev team members
-                    from utils.staff_permissions import StaffRole
                     perms = await self.db.get_staff_permissions(dev_id)
                     roles = perms['roles']
 
@@ -1218,7 +1241,7 @@ class ModdyBot(commands.Bot):
             try:
                 stats = await self.db.get_stats()
                 logger.info(f"DB: {stats['users']} users, {stats['guilds']} guilds, {stats['errors']} errors")
-            except:
+            except Exception:
                 pass
 
         # Load modules for all guilds
@@ -1312,10 +1335,9 @@ class ModdyBot(commands.Bot):
 
         # 7. Technical log: bot startup health report (webhook)
         if getattr(self, "tech_logger", None):
-            import time as _time
             boot_seconds = None
             if self._start_time:
-                boot_seconds = _time.time() - self._start_time
+                boot_seconds = time.time() - self._start_time
             await self.tech_logger.log_startup(
                 results,
                 version=self.version,
@@ -1370,7 +1392,7 @@ class ModdyBot(commands.Bot):
                         ))
 
                         await guild.owner.send(embed=embed, view=view)
-                    except:
+                    except Exception:
                         pass
 
                     # Leave the server
@@ -1450,7 +1472,7 @@ class ModdyBot(commands.Bot):
         logger.info(f"Server left: {guild.name} ({guild.id})")
 
         # Clean the cache
-        self.prefix_cache.pop(guild.id, None)
+        self.invalidate_prefix(guild.id)
 
         # Technical log: bot removed from a server
         if getattr(self, "tech_logger", None):
@@ -1599,7 +1621,7 @@ class ModdyBot(commands.Bot):
                             view=view,
                             ephemeral=True
                         )
-                    except:
+                    except Exception:
                         pass
                 except Exception as e:
                     logger.error(f"Error sending blacklist message: {e}")
@@ -1741,7 +1763,17 @@ class ModdyBot(commands.Bot):
         await self.wait_until_ready()
 
     async def close(self):
-        """Cleanly closing the bot"""
+        """Cleanly closing the bot
+
+        Idempotent: /dev shutdown and a SIGTERM can both ask for it, every
+        caller awaits the same shutdown sequence.
+        """
+        if self._shutdown_task is None:
+            self._shutdown_task = asyncio.create_task(self._shutdown())
+        await self._shutdown_task
+
+    async def _shutdown(self):
+        """Shutdown sequence behind close()"""
         logger.info("Shutting down...")
 
         # Technical log: bot shutting down (best-effort, before sessions close)
@@ -1752,14 +1784,14 @@ class ModdyBot(commands.Bot):
             except Exception as e:
                 logger.error(f"[FAIL] Error sending shutdown log: {e}")
 
-        # Stop tasks BEFORE closing
-        if self.status_update.is_running():
-            self.status_update.cancel()
-        if self.case_expiry.is_running():
-            self.case_expiry.cancel()
-
-        # Wait a bit for tasks to finish
-        await asyncio.sleep(0.1)
+        # Stop tasks BEFORE closing, and wait for them to actually unwind
+        # (bounded) rather than sleeping and hoping they are done
+        running = [loop for loop in (self.status_update, self.case_expiry) if loop.is_running()]
+        for loop in running:
+            loop.cancel()
+        pending = [task for task in (loop.get_task() for loop in running) if task]
+        if pending:
+            await asyncio.wait(pending, timeout=5)
 
         # Stop API gateway (flushes log buffer)
         await self.gateway.stop()
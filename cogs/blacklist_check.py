@@ -40,10 +40,10 @@ class BlacklistCheck(commands.Cog):
             # Vérifie si le message commence par un préfixe (commande ou mention)
             prefixes = await self.bot.get_prefix(message)
             if isinstance(prefixes, str):
-                prefixes = [prefixes]
+                prefixes = (prefixes,)
 
             # Vérifie si le message commence par un des préfixes
-            is_command = any(message.content.startswith(prefix) for prefix in prefixes)
+            is_command = message.content.startswith(tuple(prefixes))
 
             # Si ce n'est pas une commande, laisse passer sans vérifier la blacklist
             if not is_command:
@@ -59,12 +59,12 @@ class BlacklistCheck(commands.Cog):
                         view=view,
                         mention_author=False
                     )
-                except:
+                except Exception:
                     try:
                         await message.channel.send(
                             view=view
                         )
-                    except:
+                    except Exception:
                         pass
 
                 # Log l'interaction bloquée
@@ -80,7 +80,7 @@ class BlacklistCheck(commands.Cog):
                             ),
                             ping_dev=False
                         )
-                    except:
+                    except Exception:
                         pass
 
                 # NE PAS traiter la commande
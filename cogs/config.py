@@ -287,7 +287,7 @@ class Config(commands.Cog):
             try:
                 user_pref = await self.bot.db.get_attribute('user', interaction.user.id, 'DEFAULT_INCOGNITO')
                 ephemeral = True if user_pref is None else user_pref
-            except:
+            except Exception:
                 ephemeral = True
         else:
             ephemeral = incognito if incognito is not None else True
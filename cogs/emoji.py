@@ -92,7 +92,7 @@ class EmojiNavigationView(BaseView):
         self.bot = bot
         self.emoji_list = emoji_list
         self.locale = locale
-        self.author = author
+        self.author_id = author.id
         self.current_index = 0
 
         # Build the view
@@ -199,7 +199,7 @@ class EmojiNavigationView(BaseView):
 
     async def interaction_check(self, interaction: discord.Interaction) -> bool:
         """Ensures only the author can use the navigation"""
-        if interaction.user != self.author:
+        if interaction.user.id != self.author_id:
             error_msg = i18n.get("commands.emoji.context_menu.author_only", locale=self.locale)
             await interaction.response.send_message(error_msg, ephemeral=True)
             return False
@@ -313,7 +313,7 @@ class Emoji(commands.Cog):
                     # Discord returns {"message": "Invalid resource..."} for non-animated emojis
                     if "message" in data and "Invalid resource" in data["message"]:
                         return False
-                except:
+                except Exception:
                     pass
 
                 return False
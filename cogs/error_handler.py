@@ -292,7 +292,7 @@ class BaseView(ui.LayoutView):
                 if interaction.response.is_done():
                     try:
                         await interaction.followup.send(view=error_view, ephemeral=True)
-                    except:
+                    except Exception:
                         try:
                             await interaction.edit_original_response(view=error_view)
                         except Exception as edit_error:
@@ -395,10 +395,10 @@ class BaseModal(ui.Modal):
                 if interaction.response.is_done():
                     try:
                         await interaction.followup.send(view=error_view, ephemeral=True)
-                    except:
+                    except Exception:
                         try:
                             await interaction.edit_original_response(view=error_view)
-                        except:
+                        except Exception:
                             pass
                 else:
                     await interaction.response.send_message(view=error_view, ephemeral=True)
@@ -453,6 +453,61 @@ class ErrorView(ui.LayoutView):
         self.add_item(btn_row)
 
 
+# Inline app-command error views. Defined once here rather than inside
+# on_app_command_error, which would rebuild the classes on every error.
+
+class PermissionErrorView(ui.LayoutView):
+    """Missing permissions notice"""
+
+    def __init__(self):
+        super().__init__(timeout=None)
+        container = ui.Container()
+        container.add_item(
+            ui.TextDisplay(f"### <:error:1519790252594827264> Insufficient Permissions")
+        )
+        container.add_item(
+            ui.TextDisplay("You don't have the necessary permissions to execute this command.")
+        )
+        button_row = ui.ActionRow()
+        support_btn = ui.Button(
+            label="Support Server",
+            style=discord.ButtonStyle.link,
+            url="https://moddy.app/support"
+        )
+        button_row.add_item(support_btn)
+        container.add_item(button_row)
+        self.add_item(container)
+
+
+class CooldownErrorView(ui.LayoutView):
+    """Command cooldown notice"""
+
+    def __init__(self, retry_after: float):
+        super().__init__(timeout=None)
+        container = ui.Container()
+        container.add_item(
+            ui.TextDisplay(f"### ⏱️ Cooldown Active")
+        )
+        container.add_item(
+            ui.TextDisplay(f"Please try again in `{retry_after:.1f}` seconds.")
+        )
+        self.add_item(container)
+
+
+class NotFoundView(ui.LayoutView):
+    """Unresolvable member/user argument notice"""
+
+    def __init__(self, value):
+        super().__init__(timeout=None)
+        container = ui.Container()
+        container.add_item(ui.TextDisplay(
+            f"### <:warning:1519789903100121139> Couldn't find that"))
+        container.add_item(ui.TextDisplay(
+            f"`{str(value)[:80]}` doesn't match a member or user I can see. "
+            f"Try mentioning them or using their ID."))
+        self.add_item(container)
+
+
 class ErrorTracker(commands.Cog):
     """Error tracking and management system"""
 
@@ -782,7 +837,7 @@ class ErrorTracker(commands.Cog):
                     # Try to send a followup message first (preferred)
                     try:
                         await ctx.interaction.followup.send(view=error_view, ephemeral=True)
-                    except:
+                    except Exception:
                         # If followup fails, edit the original response as fallback
                         await ctx.interaction.edit_original_response(content=None, view=error_view)
                 else:
@@ -795,7 +850,7 @@ class ErrorTracker(commands.Cog):
             # If we can't send in the channel, try DMs
             try:
                 await ctx.author.send(view=error_view)
-            except:
+            except Exception:
                 # Last resort: log the failure
                 import logging
                 logger = logging.getLogger('moddy')
@@ -857,56 +912,22 @@ class ErrorTracker(commands.Cog):
 
         # Errors with specific handling
         if isinstance(error, discord.app_commands.MissingPermissions):
-            # Create inline view for permissions error
-            class PermissionErrorView(ui.LayoutView):
-                def __init__(self):
-                    super().__init__(timeout=None)
-                    container = ui.Container()
-                    container.add_item(
-                        ui.TextDisplay(f"### <:error:1519790252594827264> Insufficient Permissions")
-                    )
-                    container.add_item(
-                        ui.TextDisplay("You don't have the necessary permissions to execute this command.")
-                    )
-                    button_row = ui.ActionRow()
-                    support_btn = ui.Button(
-                        label="Support Server",
-                        style=discord.ButtonStyle.link,
-                        url="https://moddy.app/support"
-                    )
-                    button_row.add_item(support_btn)
-                    container.add_item(button_row)
-                    self.add_item(container)
-
             try:
                 if interaction.response.is_done():
                     await interaction.followup.send(view=PermissionErrorView(), ephemeral=True)
                 else:
                     await interaction.response.send_message(view=PermissionErrorView(), ephemeral=True)
-            except:
+            except Exception:
                 pass
             return
 
         if isinstance(error, discord.app_commands.CommandOnCooldown):
-            # Create inline view for cooldown error
-            class CooldownErrorView(ui.LayoutView):
-                def __init__(self, retry_after: float):
-                    super().__init__(timeout=None)
-                    container = ui.Container()
-                    container.add_item(
-                        ui.TextDisplay(f"### ⏱️ Cooldown Active")
-                    )
-                    container.add_item(
-                        ui.TextDisplay(f"Please try again in `{retry_after:.1f}` seconds.")
-                    )
-                    self.add_item(container)
-
             try:
                 if interaction.response.is_done():
                     await interaction.followup.send(view=CooldownErrorView(error.retry_after), ephemeral=True)
                 else:
                     await interaction.response.send_message(view=CooldownErrorView(error.retry_after), ephemeral=True)
-            except:
+            except Exception:
                 pass
             return
 
@@ -914,22 +935,11 @@ class ErrorTracker(commands.Cog):
         # Member/User is expected) — a user mistake, not a bug. Show a friendly
         # message instead of an error code.
         if isinstance(error, discord.app_commands.TransformerError):
-            class NotFoundView(ui.LayoutView):
-                def __init__(self):
-                    super().__init__(timeout=None)
-                    container = ui.Container()
-                    container.add_item(ui.TextDisplay(
-                        f"### <:warning:1519789903100121139> Couldn't find that"))
-                    container.add_item(ui.TextDisplay(
-                        f"`{str(error.value)[:80]}` doesn't match a member or user I can see. "
-                        f"Try mentioning them or using their ID."))
-                    self.add_item(container)
-
             try:
                 if interaction.response.is_done():
-                    await interaction.followup.send(view=NotFoundView(), ephemeral=True)
+                    await interaction.followup.send(view=NotFoundView(error.value), ephemeral=True)
                 else:
-                    await interaction.response.send_message(view=NotFoundView(), ephemeral=True)
+                    await interaction.response.send_message(view=NotFoundView(error.value), ephemeral=True)
             except discord.HTTPException:
                 pass
             return
@@ -989,7 +999,7 @@ class ErrorTracker(commands.Cog):
                 # Try to send a followup message first (preferred)
                 try:
                     await interaction.followup.send(view=error_view, ephemeral=True)
-                except:
+                except Exception:
                     # If followup fails, edit the original response as fallback
                     await interaction.edit_original_response(content=None, view=error_view)
             else:
@@ -9,12 +9,13 @@ from cogs.error_handler import BaseView
 from discord.ext import commands
 from typing import Optional, Dict, Any
 import aiohttp
-import json
+import orjson
 import io
 from datetime import datetime
 
 from utils.i18n import i18n, t
 from utils.emojis import EMOJIS
+from utils import emojis
 
 
 class InviteView(BaseView):
@@ -63,7 +64,7 @@ class InviteView(BaseView):
         """Add buttons for guild invite (outside container, below)"""
         button_row = ui.ActionRow()
         server_info_btn = ui.Button(
-            emoji=discord.PartialEmoji.from_str("<:server:1519788576420921476>"),
+            emoji=discord.PartialEmoji.from_str(emojis.SERVER),
             label=t('commands.invite.view.guild.show_server_info', locale=self.locale),
             style=discord.ButtonStyle.primary
         )
@@ -72,7 +73,7 @@ class InviteView(BaseView):
 
         # TEMP: Raw data button for debugging
         raw_btn = ui.Button(
-            emoji=discord.PartialEmoji.from_str("<:code:1519794490750271641>"),
+            emoji=discord.PartialEmoji.from_str(emojis.CODE),
             label="Raw Data",
             style=discord.ButtonStyle.secondary
         )
@@ -85,7 +86,7 @@ class InviteView(BaseView):
         """Add raw data button only (for non-guild invites)"""
         button_row = ui.ActionRow()
         raw_btn = ui.Button(
-            emoji=discord.PartialEmoji.from_str("<:code:1519794490750271641>"),
+            emoji=discord.PartialEmoji.from_str(emojis.CODE),
             label="Raw Data",
             style=discord.ButtonStyle.secondary
         )
@@ -103,7 +104,7 @@ class InviteView(BaseView):
 
         # Title
         container.add_item(ui.TextDisplay(
-            f"### <:search:1519790418290675822> {t('commands.invite.view.guild.title', locale=self.locale)}"
+            f"### {emojis.SEARCH} {t('commands.invite.view.guild.title', locale=self.locale)}"
         ))
 
         container.add_item(ui.Separator(spacing=discord.SeparatorSpacing.small))
@@ -147,7 +148,7 @@ class InviteView(BaseView):
                 expires_dt = datetime.fromisoformat(expires_at.replace('Z', '+00:00'))
                 expires_ts = int(expires_dt.timestamp())
                 info_lines.append(f"**{t('commands.invite.view.guild.expires', locale=self.locale)}:** <t:{expires_ts}:F> (<t:{expires_ts}:R>)")
-            except:
+            except Exception:
                 pass
 
         # Add all info as a single text block
@@ -160,11 +161,13 @@ class InviteView(BaseView):
 
     async def on_show_raw_data(self, interaction: discord.Interaction):
         """TEMP: Show raw API response data"""
-        raw_json = json.dumps(self.invite_data, indent=2, ensure_ascii=False)
+        # orjson returns the final UTF-8 bytes; BytesIO wraps them without a
+        # copy (no str -> encode round trip)
+        raw_json = orjson.dumps(self.invite_data, option=orjson.OPT_INDENT_2)
 
         # Send as file (safer for any size)
         file = discord.File(
-            fp=io.BytesIO(raw_json.encode('utf-8')),
+            fp=io.BytesIO(raw_json),
             filename="invite_raw_data.json"
         )
         await interaction.response.send_message("Raw API response:", file=file, ephemeral=True)
@@ -177,7 +180,7 @@ class InviteView(BaseView):
 
         # Title
         container.add_item(ui.TextDisplay(
-            f"### <:message:1519790643784843416> {t('commands.invite.view.group_dm.title', locale=self.locale)}"
+            f"### {emojis.MESSAGE} {t('commands.invite.view.group_dm.title', locale=self.locale)}"
         ))
 
         container.add_item(ui.Separator(spacing=discord.SeparatorSpacing.small))
@@ -212,7 +215,7 @@ class InviteView(BaseView):
                 expires_dt = datetime.fromisoformat(expires_at.replace('Z', '+00:00'))
                 expires_ts = int(expires_dt.timestamp())
                 info_lines.append(f"**{t('commands.invite.view.guild.expires', locale=self.locale)}:** <t:{expires_ts}:F> (<t:{expires_ts}:R>)")
-            except:
+            except Exception:
                 pass
 
         container.add_item(ui.TextDisplay("\n".join(info_lines)))
@@ -228,7 +231,7 @@ class InviteView(BaseView):
 
         # Title
         container.add_item(ui.TextDisplay(
-            f"### <:user:1519798911517196511> {t('commands.invite.view.friend.title', locale=self.locale)}"
+            f"### {emojis.USER} {t('commands.invite.view.friend.title', locale=self.locale)}"
         ))
 
         container.add_item(ui.Separator(spacing=discord.SeparatorSpacing.small))
@@ -246,7 +249,7 @@ class InviteView(BaseView):
                 expires_dt = datetime.fromisoformat(expires_at.replace('Z', '+00:00'))
                 expires_ts = int(expires_dt.timestamp())
                 info_lines.append(f"**{t('commands.invite.view.guild.expires', locale=self.locale)}:** <t:{expires_ts}:F> (<t:{expires_ts}:R>)")
-            except:
+            except Exception:
                 pass
 
         container.add_item(ui.TextDisplay("\n".join(info_lines)))
@@ -394,7 +397,7 @@ class ServerInfoView(BaseView):
 
         # Title
         container.add_item(ui.TextDisplay(
-            f"### <:server:1519788576420921476> {t('commands.invite.view.server_info.title', locale=self.locale)}"
+            f"### {emojis.SERVER} {t('commands.invite.view.server_info.title', locale=self.locale)}"
         ))
 
         container.add_item(ui.Separator(spacing=discord.SeparatorSpacing.small))
@@ -487,7 +490,7 @@ class ServerInfoView(BaseView):
         # Add back button (outside container, below)
         button_row = ui.ActionRow()
         back_btn = ui.Button(
-            emoji=discord.PartialEmoji.from_str("<:back:1519795556665397431>"),
+            emoji=discord.PartialEmoji.from_str(emojis.BACK),
             label=t('commands.invite.view.server_info.back', locale=self.locale),
             style=discord.ButtonStyle.secondary
         )
@@ -540,7 +543,7 @@ class Invite(commands.Cog):
             try:
                 user_pref = await self.bot.db.get_attribute('user', interaction.user.id, 'DEFAULT_INCOGNITO')
                 ephemeral = True if user_pref is None else user_pref
-            except:
+            except Exception:
                 ephemeral = True
         else:
             ephemeral = incognito if incognito is not None else True
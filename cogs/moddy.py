@@ -215,8 +215,7 @@ class ModdyMainView(BaseView):
         # skip this since it requires runtime state.
         if self.bot is not None:
             version = self.bot.version or "Unknown"
-            server_count = len(self.bot.guilds)
-            user_count = len(self.bot.users)
+            server_count, user_count = self.bot.cache_counts()
 
             container.add_item(ui.TextDisplay(
                 f"**{t('commands.moddy.bot_info.title', locale=self.locale)}**\n"
@@ -319,7 +318,7 @@ class Moddy(commands.Cog):
             try:
                 user_pref = await self.bot.db.get_attribute('user', interaction.user.id, 'DEFAULT_INCOGNITO')
                 ephemeral = True if user_pref is None else user_pref
-            except:
+            except Exception:
                 ephemeral = True
         else:
             ephemeral = incognito if incognito is not None else True
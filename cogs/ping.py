@@ -3,7 +3,6 @@ Commande ping publique avec Components V2
 """
 import asyncio
 import time
-from datetime import datetime
 from typing import Optional
 
 import discord
@@ -15,6 +14,7 @@ from discord import SeparatorSpacing
 from config import COLORS
 from utils.emojis import GREEN_STATUS, YELLOW_STATUS, RED_STATUS
 from utils.i18n import i18n, t
+from utils.uptime import format_uptime
 
 
 class PublicPing(commands.Cog):
@@ -40,7 +40,7 @@ class PublicPing(commands.Cog):
             try:
                 user_pref = await self.bot.db.get_attribute('user', interaction.user.id, 'DEFAULT_INCOGNITO')
                 ephemeral = True if user_pref is None else user_pref
-            except:
+            except Exception:
                 ephemeral = True
         else:
             ephemeral = incognito if incognito is not None else True
@@ -65,23 +65,8 @@ class PublicPing(commands.Cog):
         # Récupérer le texte du statut traduit
         status_text = t(f"commands.ping.status.{status_key}", interaction)
 
-        # Calculer l'uptime
-        uptime_delta = datetime.now(datetime.now().astimezone().tzinfo) - self.bot.launch_time.astimezone()
-        days = uptime_delta.days
-        hours, remainder = divmod(uptime_delta.seconds, 3600)
-        minutes, seconds = divmod(remainder, 60)
-
-        # Format de l'uptime
-        uptime_parts = []
-        if days > 0:
-            uptime_parts.append(f"{days}d")
-        if hours > 0:
-            uptime_parts.append(f"{hours}h")
-        if minutes > 0:
-            uptime_parts.append(f"{minutes}m")
-        if seconds > 0 or not uptime_parts:
-            uptime_parts.append(f"{seconds}s")
-        uptime_str = " ".join(uptime_parts)
+        # Uptime
+        uptime_str = format_uptime(self.bot.uptime_seconds())
 
         # Uptime timestamp
         uptime_timestamp = f"<t:{int(self.bot.launch_time.timestamp())}:R>"
@@ -113,9 +98,11 @@ class PublicPing(commands.Cog):
             api_latency=api_latency,
             message_latency=t("common.loading", interaction)
         )
-        container.add_item(TextDisplay(main_info))
+        main_info_display = TextDisplay(main_info)
+        container.add_item(main_info_display)
 
         # Détails système
+        guild_count, user_count = self.bot.cache_counts()
         system_details = t(
             "commands.ping.response.system_details",
             interaction,
@@ -124,8 +111,8 @@ class PublicPing(commands.Cog):
             uptime=uptime_str,
             uptime_timestamp=uptime_timestamp,
             version=version,
-            guild_count=len(self.bot.guilds),
-            user_count=len(self.bot.users)
+            guild_count=guild_count,
+            user_count=user_count
         )
         container.add_item(TextDisplay(system_details))
 
@@ -157,16 +144,8 @@ class PublicPing(commands.Cog):
         end = time.perf_counter()
         message_latency = round((end - start) * 1000)
 
-        # Créer le message mis à jour avec la latence réelle
-        view_updated = LayoutView()
-        container_updated = Container()
-
-        # Header
-        container_updated.add_item(TextDisplay(f"### {title}"))
-        container_updated.add_item(Separator(spacing=SeparatorSpacing.small))
-
-        # Info principale avec latence mise à jour
-        main_info_updated = t(
+        # Seule la ligne de latence change : le reste de la vue est réutilisé
+        main_info_display.content = t(
             "commands.ping.response.main_info",
             interaction,
             status_emoji=status_emoji,
@@ -174,34 +153,9 @@ class PublicPing(commands.Cog):
             api_latency=api_latency,
             message_latency=f"`{message_latency}ms`"
         )
-        container_updated.add_item(TextDisplay(main_info_updated))
-
-        # Détails système
-        container_updated.add_item(TextDisplay(system_details))
-
-        view_updated.add_item(container_updated)
-
-        # Liens (recréer les boutons en dehors du container)
-        links_row_updated = ActionRow()
-
-        support_btn_updated = Button(
-            label=t("commands.ping.buttons.support", interaction),
-            style=discord.ButtonStyle.link,
-            url="https://moddy.app/support"
-        )
-        links_row_updated.add_item(support_btn_updated)
-
-        status_btn_updated = Button(
-            label=t("commands.ping.buttons.status", interaction),
-            style=discord.ButtonStyle.link,
-            url="https://moddy.app/status"
-        )
-        links_row_updated.add_item(status_btn_updated)
-
-        view_updated.add_item(links_row_updated)
 
         # Modifier le message avec la latence réelle
-        await interaction.edit_original_response(view=view_updated)
+        await interaction.edit_original_response(view=view)
 
 
 async def setup(bot):
@@ -13,12 +13,14 @@ from cogs.error_handler import BaseView
 from typing import Optional, List, Dict, Any
 from datetime import datetime
 import logging
-import json
 import io
 
+import orjson
+
 from utils.components_v2 import create_error_message
 from utils.i18n import i18n, t
 from utils.incognito import get_incognito_setting
+from utils import emojis
 
 logger = logging.getLogger('moddy.saved_messages')
 
@@ -224,8 +226,7 @@ async def _refresh_library_card(bot, owner_id: int, locale: str,
         )
     else:
         offset = page * 10
-        messages = await bot.db.get_saved_messages(owner_id, limit=10, offset=offset)
-        total_count = await bot.db.count_saved_messages(owner_id)
+        messages, total_count = await bot.db.get_saved_messages_page(owner_id, limit=10, offset=offset)
         view = SavedMessagesLibraryView(
             bot, owner_id, messages, locale, page=page, total_count=total_count,
         )
@@ -479,7 +480,7 @@ class SavedMessagesLibraryView(BaseView):
                         note_preview = msg['note'][:80]
                         if len(msg['note']) > 80:
                             note_preview += "..."
-                        msg_line += f"\n-# <:note:1519790932663468184> {note_preview}"
+                        msg_line += f"\n-# {emojis.NOTE} {note_preview}"
                     else:
                         msg_line += f"\n-# ID Discord: `{msg['message_id']}`"
 
@@ -531,9 +532,9 @@ class SavedMessagesListButton(ui.DynamicItem[ui.Button], template=_CID_LIST_TEMP
         "pageinfo": discord.ButtonStyle.secondary,
     }
     _EMOJI = {
-        "view": "<:search:1519790418290675822>",
-        "prev": "<:back:1519795556665397431>",
-        "next": "<:next:1519791619526754354>",
+        "view": emojis.SEARCH,
+        "prev": emojis.BACK,
+        "next": emojis.NEXT,
     }
     _LABEL_KEY = {
         "view": "commands.saved_messages.buttons.view_message",
@@ -585,8 +586,7 @@ class SavedMessagesListButton(ui.DynamicItem[ui.Button], template=_CID_LIST_TEMP
 
         # prev / next: self.page already IS the target page (baked in at render time).
         offset = self.page * 10
-        messages = await bot.db.get_saved_messages(owner_id, limit=10, offset=offset)
-        total_count = await bot.db.count_saved_messages(owner_id)
+        messages, total_count = await bot.db.get_saved_messages_page(owner_id, limit=10, offset=offset)
         view = SavedMessagesLibraryView(bot, owner_id, messages, locale, page=self.page, total_count=total_count)
         await interaction.response.edit_message(view=view)
 
@@ -601,10 +601,10 @@ class SavedMessagesDetailButton(ui.DynamicItem[ui.Button], template=_CID_DETAIL_
         "delete":    discord.ButtonStyle.danger,
     }
     _EMOJI = {
-        "back":      "<:back:1519795556665397431>",
-        "edit_note": "<:edit:1519795936568676383>",
-        "export":    "<:data_object:1519795407453159474>",
-        "delete":    "<:delete:1519795753164210447>",
+        "back":      emojis.BACK,
+        "edit_note": emojis.EDIT,
+        "export":    emojis.DATA_OBJECT,
+        "delete":    emojis.DELETE,
     }
     _LABEL_KEY = {
         "back":      "commands.saved_messages.buttons.back",
@@ -645,8 +645,7 @@ class SavedMessagesDetailButton(ui.DynamicItem[ui.Button], template=_CID_DETAIL_
 
         if self.action == "back":
             offset = self.page * 10
-            messages = await bot.db.get_saved_messages(owner_id, limit=10, offset=offset)
-            total_count = await bot.db.count_saved_messages(owner_id)
+            messages, total_count = await bot.db.get_saved_messages_page(owner_id, limit=10, offset=offset)
             view = SavedMessagesLibraryView(bot, owner_id, messages, locale, page=self.page, total_count=total_count)
             await interaction.response.edit_message(view=view)
             return
@@ -664,9 +663,10 @@ class SavedMessagesDetailButton(ui.DynamicItem[ui.Button], template=_CID_DETAIL_
 
         if self.action == "export":
             if detail_msg.get('raw_message_data'):
-                json_data = json.dumps(detail_msg['raw_message_data'], indent=2, ensure_ascii=False)
+                # orjson writes UTF-8 bytes directly: no intermediate str to re-encode
+                json_data = orjson.dumps(detail_msg['raw_message_data'], option=orjson.OPT_INDENT_2)
                 file = discord.File(
-                    io.BytesIO(json_data.encode('utf-8')),
+                    io.BytesIO(json_data),
                     filename=f"message_{detail_msg['id']}_raw_data.json"
                 )
                 await interaction.response.send_message(
@@ -740,14 +740,13 @@ class SavedMessages(commands.Cog):
             try:
                 user_pref = await self.bot.db.get_attribute('user', interaction.user.id, 'DEFAULT_INCOGNITO')
                 ephemeral = True if user_pref is None else user_pref
-            except:
+            except Exception:
                 ephemeral = True
         else:
             ephemeral = incognito if incognito is not None else True
 
         # Get saved messages
-        messages = await self.bot.db.get_saved_messages(interaction.user.id, limit=10, offset=0)
-        total_count = await self.bot.db.count_saved_messages(interaction.user.id)
+        messages, total_count = await self.bot.db.get_saved_messages_page(interaction.user.id, limit=10, offset=0)
 
         # Create view
         view = SavedMessagesLibraryView(
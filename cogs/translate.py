@@ -29,7 +29,7 @@ class TranslateView(BaseView):
         self.from_lang = from_lang
         self.current_to_lang = current_to_lang
         self.locale = locale
-        self.author = author
+        self.author_id = author.id
 
         # Create the container
         self.build_view()
@@ -134,7 +134,7 @@ class TranslateView(BaseView):
 
     async def interaction_check(self, interaction: discord.Interaction) -> bool:
         """Checks that it's the author using the menu"""
-        if interaction.user != self.author:
+        if interaction.user.id != self.author_id:
             locale = i18n.get_user_locale(interaction)
             error_msg = i18n.get("commands.translate.view.author_only", locale=locale)
             await interaction.response.send_message(error_msg, ephemeral=True)
@@ -135,7 +135,7 @@ class UserInfoView(BaseView):
             timestamp = ((snowflake_id >> 22) + 1420070400000) // 1000
             created_label = i18n.get("commands.user.view.created", locale=self.locale)
             info_lines.append(f"> **{created_label}:** <t:{timestamp}:R>")
-        except:
+        except Exception:
             pass
 
         # Banner color
@@ -353,7 +353,7 @@ class UserInfoView(BaseView):
                             if "discord.gg/" in invite_url:
                                 result["invite_code"] = invite_url.split("discord.gg/")[-1]
                         return result
-            except:
+            except Exception:
                 pass
 
             # Try 2: Guild Preview (requires bot token, works for Discovery servers)
@@ -367,7 +367,7 @@ class UserInfoView(BaseView):
                         preview_data = await resp.json()
                         result["name"] = preview_data.get("name")
                         return result
-            except:
+            except Exception:
                 pass
 
         return result
@@ -683,7 +683,7 @@ class User(commands.Cog):
             try:
                 user_pref = await self.bot.db.get_attribute('user', interaction.user.id, 'DEFAULT_INCOGNITO')
                 ephemeral = True if user_pref is None else user_pref
-            except:
+            except Exception:
                 ephemeral = True
         else:
             ephemeral = incognito if incognito is not None else True
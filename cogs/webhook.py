@@ -22,7 +22,7 @@ class WebhookView(BaseView):
     def __init__(self, webhook_data: dict, author: discord.User, locale: str):
         super().__init__(timeout=300)
         self.webhook_data = webhook_data
-        self.author = author
+        self.author_id = author.id
         self.locale = locale
         self.build_view()
 
@@ -33,9 +33,9 @@ class WebhookView(BaseView):
         # Create main container
         container = ui.Container()
 
-        # Webhook info display
-        webhook_info = self.format_webhook_info()
-        container.add_item(ui.TextDisplay(webhook_info))
+        # Webhook info display (kept so refreshes only update its text)
+        self.info_display = ui.TextDisplay(self.format_webhook_info())
+        container.add_item(self.info_display)
 
         # Add separator
         container.add_item(ui.Separator(spacing=discord.SeparatorSpacing.small))
@@ -87,9 +87,14 @@ class WebhookView(BaseView):
         button_row.add_item(send_btn)
         button_row.add_item(refresh_btn)
 
-        # Add button row to the view
+        # Add button row to the view (kept so it can be disabled without a scan)
+        self.button_row = button_row
         self.add_item(button_row)
 
+    def refresh_info(self):
+        """Re-renders the info text after webhook_data changed; buttons are kept as-is"""
+        self.info_display.content = self.format_webhook_info()
+
     def format_webhook_info(self) -> str:
         """Formats webhook information for display"""
         data = self.webhook_data
@@ -123,7 +128,7 @@ class WebhookView(BaseView):
 
     async def interaction_check(self, interaction: discord.Interaction) -> bool:
         """Checks that it's the author using the buttons"""
-        if interaction.user != self.author:
+        if interaction.user.id != self.author_id:
             await interaction.response.send_message(
                 i18n.get("commands.webhook.errors.author_only", locale=self.locale),
                 ephemeral=True
@@ -156,12 +161,9 @@ class WebhookView(BaseView):
                         success_desc = i18n.get("commands.webhook.delete.success.description", locale=self.locale, name=self.webhook_data.get('name'))
                         success_embed = ModdyResponse.success(success_title, success_desc)
 
-                        # Disable all buttons (they're inside an ActionRow)
-                        for item in self.children:
-                            if isinstance(item, ui.ActionRow):
-                                for button in item.children:
-                                    if isinstance(button, ui.Button):
-                                        button.disabled = True
+                        # Disable all buttons
+                        for button in self.button_row.children:
+                            button.disabled = True
 
                         await interaction.edit_original_response(view=self)
                         await interaction.followup.send(embed=success_embed, ephemeral=True)
@@ -207,7 +209,7 @@ class WebhookView(BaseView):
                 async with session.get(webhook_url) as response:
                     if response.status == 200:
                         self.webhook_data = await response.json()
-                        self.build_view()
+                        self.refresh_info()
                         await interaction.edit_original_response(view=self)
 
                         success_title = i18n.get("commands.webhook.refresh.success.title", locale=self.locale)
@@ -270,7 +272,7 @@ class EditWebhookModal(BaseModal):
                     if response.status == 200:
                         updated_data = await response.json()
                         self.view.webhook_data = updated_data
-                        self.view.build_view()
+                        self.view.refresh_info()
 
                         await interaction.edit_original_response(view=self.view)
 
@@ -6,12 +6,12 @@ ModdyDatabase inherits from all repository mixins.
 import asyncio
 import asyncpg
 import json
-import copy
 import logging
+import orjson
 from typing import Optional, Dict, Any, List
 
 from config import DB_POOL_MIN_SIZE, DB_POOL_MAX_SIZE
-from db.repositories._utils import set_nested_value
+from db.repositories._utils import nested_set_sql, split_data_path
 from db.repositories.errors import ErrorRepository
 from db.repositories.users import UserRepository
 from db.repositories.guilds import GuildRepository
@@ -42,6 +42,32 @@ logger = logging.getLogger('moddy.database')
 POOL_MIN_SIZE = DB_POOL_MIN_SIZE
 POOL_MAX_SIZE = DB_POOL_MAX_SIZE
 COMMAND_TIMEOUT = 60
+# asyncpg prepares every query and caches the statement per connection, keyed
+# by SQL text. The default (100) is below the number of distinct queries in the
+# repositories (~270 call sites), so cold queries evicted hot ones and those
+# were parsed and planned again on their next use.
+STATEMENT_CACHE_SIZE = 512
+
+# What asyncpg would normally send when a connection goes back to the pool.
+# Only needed after running arbitrary SQL (see ModdyConnection).
+SESSION_RESET_QUERY = "SELECT pg_advisory_unlock_all(); CLOSE ALL; UNLISTEN *; RESET ALL;"
+
+
+class ModdyConnection(asyncpg.Connection):
+    """Pooled connection that skips asyncpg's session reset on release.
+
+    Moddy never LISTENs, takes advisory locks, keeps cursors open or changes
+    session settings, so the reset query sent on every release is a wasted
+    round trip on each ``pool.acquire()`` — almost all of which are short
+    reads. Open transactions are still rolled back by the pool. Code that runs
+    arbitrary SQL must send :data:`SESSION_RESET_QUERY` itself.
+    """
+
+    def get_reset_query(self):
+        return ""
+
+    # asyncpg < 0.30 (the pinned 0.29) only knows the private spelling
+    _get_reset_query = get_reset_query
 
 
 class ModdyDatabase(
@@ -78,6 +104,9 @@ class ModdyDatabase(
         #            on_data_change(table, entity_id, path, value)
         self.on_attribute_change = None
         self.on_data_change = None
+        # Synchronous hook fired after every staff_permissions write, used to
+        # invalidate the permission cache. Signature: (user_id)
+        self.on_staff_permissions_change = None
 
     def _parse_jsonb(self, value: Any) -> dict:
         """Parse JSONB value that can be either a dict or a JSON string"""
@@ -86,9 +115,10 @@ class ModdyDatabase(
         if isinstance(value, dict):
             return value
         if isinstance(value, str):
+            # orjson: every JSONB column read from asyncpg comes through here as text
             try:
-                return json.loads(value)
-            except (json.JSONDecodeError, TypeError):
+                return orjson.loads(value)
+            except orjson.JSONDecodeError:
                 return {}
         return {}
 
@@ -100,9 +130,9 @@ class ModdyDatabase(
             return value
         if isinstance(value, str):
             try:
-                result = json.loads(value)
+                result = orjson.loads(value)
                 return result if isinstance(result, list) else []
-            except (json.JSONDecodeError, TypeError):
+            except orjson.JSONDecodeError:
                 return []
         return []
 
@@ -114,6 +144,8 @@ class ModdyDatabase(
                 min_size=POOL_MIN_SIZE,
                 max_size=POOL_MAX_SIZE,
                 command_timeout=COMMAND_TIMEOUT,
+                statement_cache_size=STATEMENT_CACHE_SIZE,
+                connection_class=ModdyConnection,
                 server_settings={
                     'application_name': 'Moddy Bot',
                     'jit': 'off'
@@ -133,75 +165,42 @@ class ModdyDatabase(
         if self.pool:
             await self.pool.close()
 
-    async def _update_entity_data(self, table: str, id_column: str, entity_id: int, path: str, value: Any):
-        """Update a specific part of an entity's data (shared by update_user_data and update_guild_data)"""
+    async def _update_entity_data(self, table: str, id_column: str, entity_id: int, path: str, value: Any) -> Any:
+        """Update a specific part of an entity's data (shared by update_user_data and update_guild_data)
+
+        Returns the value as stored, so callers holding a cache can refresh it
+        instead of invalidating and re-reading.
+        """
+        logger.debug(f"[DB] Updating path '{path}' for {id_column} {entity_id} with value {json.dumps(value)}")
+
+        # One upsert patches only the targeted key server-side: it creates the
+        # entity if needed and returns the written path as verification
+        path_parts = split_data_path(path)
+        new_data = nested_set_sql("'{}'::jsonb", len(path_parts), '$2::text[]', '$3::jsonb')
+        patched_data = nested_set_sql(f'{table}.data', len(path_parts), '$2::text[]', '$3::jsonb')
         async with self.pool.acquire() as conn:
-            # First, ensure the entity exists
-            await conn.execute(f"""
+            saved = await conn.fetchrow(f"""
                 INSERT INTO {table} ({id_column}, data, attributes, created_at, updated_at)
-                VALUES ($1, '{{}}'::jsonb, '{{}}'::jsonb, NOW(), NOW())
-                ON CONFLICT ({id_column}) DO NOTHING
-            """, entity_id)
-
-            # Get current data
-            row = await conn.fetchrow(f"SELECT data FROM {table} WHERE {id_column} = $1", entity_id)
-
-            # Handle both dict and string JSON responses from PostgreSQL
-            if row and row['data']:
-                if isinstance(row['data'], str):
-                    current_data = json.loads(row['data'])
-                elif isinstance(row['data'], dict):
-                    current_data = row['data']
-                else:
-                    current_data = {}
-            else:
-                current_data = {}
-
-            logger.debug(f"[DB] Before update for {id_column} {entity_id}: {current_data}")
-            logger.debug(f"[DB] Updating path '{path}' with value {json.dumps(value)}")
-
-            # Build the nested structure in Python
-            path_parts = path.split('.')
-
-            # Update the data structure (use deepcopy to avoid modifying original)
-            updated_data = set_nested_value(copy.deepcopy(current_data), path_parts, value)
-
-            # Save the complete updated structure
-            result = await conn.execute(f"""
-                UPDATE {table}
-                SET data = $1::jsonb,
+                VALUES ($1, {new_data}, '{{}}'::jsonb, NOW(), NOW())
+                ON CONFLICT ({id_column}) DO UPDATE
+                SET data = {patched_data},
                     updated_at = NOW()
-                WHERE {id_column} = $2
+                RETURNING data #> $2::text[] AS value
             """,
-                json.dumps(updated_data),
-                entity_id
+                entity_id,
+                path_parts,
+                json.dumps(value)
             )
 
-            # Verify the data was saved
-            after = await conn.fetchrow(f"SELECT data FROM {table} WHERE {id_column} = $1", entity_id)
-            logger.debug(f"[DB] After update for {id_column} {entity_id}: {after['data'] if after else 'None'}")
-            logger.debug(f"[DB] Update result: {result}")
-
-            # Verify the path exists - handle both dict and string JSON
-            if after and after['data']:
-                # Convert to dict if it's a string
-                if isinstance(after['data'], str):
-                    saved_data = json.loads(after['data'])
-                else:
-                    saved_data = after['data']
-
-                current = saved_data
-                for part in path_parts:
-                    if isinstance(current, dict) and part in current:
-                        current = current[part]
-                    else:
-                        logger.error(f"[DB] [ERROR] Verification failed! Path {path} not found in saved data")
-                        raise Exception(f"Data verification failed: path {path} not found after update")
-
-                logger.debug(f"[DB] [OK] Verification successful: data correctly saved at path {path}")
-            else:
+            # Verify the path exists (JSON null comes back as 'null', a missing path as NULL)
+            if not saved:
                 logger.error(f"[DB] [ERROR] Verification failed! No data found for {id_column} {entity_id}")
                 raise Exception("Data verification failed: no data in database")
+            if saved['value'] is None:
+                logger.error(f"[DB] [ERROR] Verification failed! Path {path} not found in saved data")
+                raise Exception(f"Data verification failed: path {path} not found after update")
+
+            logger.debug(f"[DB] [OK] Verification successful: data correctly saved at path {path}")
 
         # Technical-log hook (best-effort, never blocks the write)
         if self.on_data_change:
@@ -210,6 +209,8 @@ class ModdyDatabase(
             except Exception as exc:
                 logger.debug(f"[DB] on_data_change hook failed: {exc}")
 
+        return orjson.loads(saved['value'])
+
     async def _init_tables(self):
         """Creates tables if they do not exist"""
         async with self.pool.acquire() as conn:
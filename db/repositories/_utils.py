@@ -1,6 +1,21 @@
 """Shared utility functions for repository modules."""
 
-from typing import Any
+import re
+from typing import Any, List
+
+# Dotted data path ("config.prefix"): non-empty segments of word characters
+# and dashes only, so no JSON path syntax ({}, commas, quotes) reaches SQL
+DATA_PATH_RE = re.compile(r'[A-Za-z0-9_-]+(?:\.[A-Za-z0-9_-]+)*')
+
+
+def split_data_path(path: str) -> List[str]:
+    """Validate a dotted data path and split it into its keys.
+
+    Raises ``ValueError`` on a malformed path, before any query is sent.
+    """
+    if not isinstance(path, str) or not DATA_PATH_RE.fullmatch(path):
+        raise ValueError(f"Invalid data path: {path!r}")
+    return path.split('.')
 
 
 def set_nested_value(data: dict, parts: list, val: Any) -> dict:
@@ -18,3 +33,23 @@ def set_nested_value(data: dict, parts: list, val: Any) -> dict:
     # Recurse
     data[parts[0]] = set_nested_value(data[parts[0]], parts[1:], val)
     return data
+
+
+def nested_set_sql(column: str, depth: int, path_param: str, value_param: str) -> str:
+    """Build a SQL expression that writes ``value_param`` at a nested path.
+
+    Server-side equivalent of :func:`set_nested_value`: ``path_param`` is a
+    ``text[]`` placeholder of ``depth`` keys, and every intermediate level that
+    is missing or not an object is replaced by ``{}``. Only the SQL shape
+    depends on ``depth``, so each depth maps to a single prepared statement.
+    """
+    def level(k: int) -> str:
+        if k == 0:
+            return f"COALESCE({column}, '{{}}'::jsonb)"
+        prefix = f"{column} #> ({path_param})[1:{k}]"
+        return f"(CASE WHEN jsonb_typeof({prefix}) = 'object' THEN {prefix} ELSE '{{}}'::jsonb END)"
+
+    expr = value_param
+    for k in range(depth - 1, -1, -1):
+        expr = f"({level(k)} || jsonb_build_object(({path_param})[{k + 1}], {expr}))"
+    return expr
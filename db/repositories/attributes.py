@@ -3,6 +3,8 @@ import json
 import logging
 from typing import Any, Optional, Union
 
+import orjson
+
 logger = logging.getLogger('moddy.database')
 
 
@@ -18,51 +20,52 @@ class AttributeRepository:
         Pour les attributs avec valeur : on stocke la valeur (ex: LANG=FR)
         Si value est None, on supprime l'attribut
         """
-        table = 'users' if entity_type == 'user' else 'guilds'
-
         async with self.pool.acquire() as conn:
-            # S'assure que l'entité existe d'abord
-            if entity_type == 'user':
-                await self.get_user(entity_id)
-            else:
-                await self.get_guild(entity_id)
+            old_value = await self._write_attribute(
+                conn, entity_type, entity_id, attribute, value, changed_by, reason
+            )
 
-            # Récupère l'ancienne valeur
-            row = await conn.fetchrow(
-                f"SELECT attributes FROM {table} WHERE {entity_type}_id = $1",
-                entity_id
+        self._notify_attribute_change(entity_type, entity_id, attribute, old_value, value, changed_by, reason)
+
+    async def _write_attribute(self, conn, entity_type: str, entity_id: int,
+                               attribute: str, value: Optional[Union[str, bool]],
+                               changed_by: int, reason: str = None) -> Any:
+        """Écrit un attribut et son audit sur une connexion déjà acquise
+
+        Permet de l'inclure dans la transaction d'une opération plus large.
+        Retourne l'ancienne valeur ; le hook n'est pas déclenché ici.
+        """
+        table = 'users' if entity_type == 'user' else 'guilds'
+        id_column = f"{entity_type}_id"
+
+        # Patch côté serveur : seule la clé concernée est modifiée, sans
+        # renvoyer tout le JSONB. L'ancienne valeur est lue à part, ligne
+        # verrouillée : dans une CTE de l'upsert, le FOR UPDATE ignorerait la
+        # ligne modifiée par la requête elle-même et renverrait toujours NULL
+        current = f"COALESCE({table}.attributes, '{{}}'::jsonb)"
+        if value is None or value is False:
+            # None et False suppriment l'attribut
+            initial, patched = "'{}'::jsonb", f"{current} - $2::text"
+            args = (entity_id, attribute)
+        else:
+            # True est stocké tel quel (clé sans valeur), sinon la valeur
+            initial = "jsonb_build_object($2::text, $3::jsonb)"
+            patched = f"{current} || jsonb_build_object($2::text, $3::jsonb)"
+            args = (entity_id, attribute, json.dumps(value))
+
+        async with conn.transaction():
+            old_raw = await conn.fetchval(
+                f"SELECT attributes -> $2::text FROM {table} WHERE {id_column} = $1 FOR UPDATE",
+                entity_id, attribute
             )
+            old_value = orjson.loads(old_raw) if isinstance(old_raw, str) else old_raw
 
-            # Gère proprement le cas où attributes est None
-            if row and row['attributes']:
-                old_attributes = json.loads(row['attributes'])
-            else:
-                old_attributes = {}
-
-            old_value = old_attributes.get(attribute)
-
-            # Met à jour l'attribut selon le nouveau système
-            if value is None:
-                # Supprime l'attribut
-                if attribute in old_attributes:
-                    del old_attributes[attribute]
-            elif value is True:
-                # Pour les booléens True, on stocke juste la clé sans valeur
-                old_attributes[attribute] = True
-            elif value is False:
-                # Pour les booléens False, on supprime l'attribut
-                if attribute in old_attributes:
-                    del old_attributes[attribute]
-            else:
-                # Pour les autres valeurs (string, int, etc), on stocke la valeur
-                old_attributes[attribute] = value
-
-            # Sauvegarde
             await conn.execute(f"""
-                UPDATE {table}
-                SET attributes = $1::jsonb, updated_at = NOW()
-                WHERE {entity_type}_id = $2
-            """, json.dumps(old_attributes), entity_id)
+                INSERT INTO {table} ({id_column}, attributes)
+                VALUES ($1, {initial})
+                ON CONFLICT ({id_column}) DO UPDATE
+                SET attributes = {patched}, updated_at = NOW()
+            """, *args)
 
             # Log le changement
             await conn.execute("""
@@ -76,6 +79,13 @@ class AttributeRepository:
                 changed_by, reason
             )
 
+        return old_value
+
+    def _notify_attribute_change(self, entity_type, entity_id, attribute, old_value, value, changed_by, reason):
+        # TEAM fait partie de l'état staff mis en cache : même invalidation
+        if entity_type == 'user' and attribute == 'TEAM':
+            self._notify_staff_change(entity_id)
+
         # Technical-log hook (best-effort, runs outside the connection block)
         hook = getattr(self, "on_attribute_change", None)
         if hook:
@@ -88,8 +98,20 @@ class AttributeRepository:
 
     async def has_attribute(self, entity_type: str, entity_id: int, attribute: str) -> bool:
         """Vérifie si une entité a un attribut spécifique"""
-        entity = await self.get_user(entity_id) if entity_type == 'user' else await self.get_guild(entity_id)
-        return attribute in entity['attributes']
+        table = 'users' if entity_type == 'user' else 'guilds'
+        # Le test se fait côté SQL : pas besoin de transférer ni de parser
+        # toute la ligne (data comprise) pour une simple présence de clé
+        async with self.pool.acquire() as conn:
+            row = await conn.fetchrow(
+                f"SELECT attributes ? $2 AS present FROM {table} WHERE {entity_type}_id = $1",
+                entity_id, attribute
+            )
+
+        if row is None:
+            # Entité inconnue : on la crée comme avant, elle n'a aucun attribut
+            await (self.get_user(entity_id) if entity_type == 'user' else self.get_guild(entity_id))
+            return False
+        return bool(row['present'])
 
     async def get_attribute(self, entity_type: str, entity_id: int, attribute: str) -> Any:
         """Récupère la valeur d'un attribut
@@ -98,5 +120,15 @@ class AttributeRepository:
         Retourne la valeur pour les attributs avec valeur
         Retourne None si l'attribut n'existe pas
         """
-        entity = await self.get_user(entity_id) if entity_type == 'user' else await self.get_guild(entity_id)
-        return entity['attributes'].get(attribute)
+        table = 'users' if entity_type == 'user' else 'guilds'
+        async with self.pool.acquire() as conn:
+            row = await conn.fetchrow(
+                f"SELECT attributes -> $2 AS value FROM {table} WHERE {entity_type}_id = $1",
+                entity_id, attribute
+            )
+
+        if row is None:
+            await (self.get_user(entity_id) if entity_type == 'user' else self.get_guild(entity_id))
+            return None
+        value = row['value']
+        return orjson.loads(value) if isinstance(value, str) else value
@@ -3,6 +3,10 @@ import logging
 from datetime import datetime, timezone
 from typing import Dict, Any, List
 
+import orjson
+
+from db.repositories._utils import split_data_path
+
 logger = logging.getLogger('moddy.database')
 
 
@@ -18,16 +22,19 @@ class GuildRepository:
             )
 
             if not row:
-                # Crée le serveur s'il n'existe pas, gère la concurrence
-                await conn.execute(
-                    "INSERT INTO guilds (guild_id) VALUES ($1) ON CONFLICT (guild_id) DO NOTHING",
-                    guild_id
-                )
-                # Re-fetch pour être sûr d'avoir les données
+                # Crée le serveur s'il n'existe pas et récupère la ligne
+                # dans la même requête
                 row = await conn.fetchrow(
-                    "SELECT * FROM guilds WHERE guild_id = $1",
+                    "INSERT INTO guilds (guild_id) VALUES ($1) "
+                    "ON CONFLICT (guild_id) DO NOTHING RETURNING *",
                     guild_id
                 )
+                if not row:
+                    # Créé entre-temps par une requête concurrente
+                    row = await conn.fetchrow(
+                        "SELECT * FROM guilds WHERE guild_id = $1",
+                        guild_id
+                    )
 
             return {
                 'guild_id': row['guild_id'],
@@ -37,9 +44,22 @@ class GuildRepository:
                 'updated_at': row.get('updated_at', datetime.now(timezone.utc))
             }
 
-    async def update_guild_data(self, guild_id: int, path: str, value: Any):
+    async def get_guild_data_value(self, guild_id: int, path: str) -> Any:
+        """Lit une seule valeur de la data serveur (chemin pointé, ex. "config.prefix")
+
+        Extraite côté serveur : ni le document complet ni une création de
+        ligne pour un serveur inconnu. Retourne None si absente.
+        """
+        async with self.pool.acquire() as conn:
+            value = await conn.fetchval(
+                "SELECT data #> $2::text[] FROM guilds WHERE guild_id = $1",
+                guild_id, split_data_path(path)
+            )
+        return orjson.loads(value) if value is not None else None
+
+    async def update_guild_data(self, guild_id: int, path: str, value: Any) -> Any:
         """Met à jour une partie spécifique de la data serveur"""
-        await self._update_entity_data('guilds', 'guild_id', guild_id, path, value)
+        return await self._update_entity_data('guilds', 'guild_id', guild_id, path, value)
 
     async def get_guilds_with_attribute(self, attribute: str, value: Any = None) -> List[int]:
         """Récupère tous les serveurs ayant un attribut spécifique"""
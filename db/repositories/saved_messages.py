@@ -1,7 +1,7 @@
 import json
 import logging
 from datetime import datetime
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 
 logger = logging.getLogger('moddy.database')
 
@@ -57,6 +57,32 @@ class SavedMessageRepository:
 
             return [self._parse_saved_message(row) for row in rows]
 
+    async def get_saved_messages_page(self, user_id: int, limit: int = 10,
+                                      offset: int = 0) -> Tuple[List[Dict[str, Any]], int]:
+        """Récupère une page de messages sauvegardés et le total en une requête"""
+        async with self.pool.acquire() as conn:
+            rows = await conn.fetch("""
+                SELECT *, COUNT(*) OVER () AS total_count FROM saved_messages
+                WHERE user_id = $1
+                ORDER BY saved_at DESC
+                LIMIT $2 OFFSET $3
+            """, user_id, limit, offset)
+
+            if rows:
+                total = rows[0]['total_count']
+            else:
+                # Page vide : le total n'est pas porté par les lignes
+                total = await conn.fetchval(
+                    "SELECT COUNT(*) FROM saved_messages WHERE user_id = $1", user_id
+                )
+
+            messages = []
+            for row in rows:
+                msg = self._parse_saved_message(row)
+                del msg['total_count']
+                messages.append(msg)
+            return messages, total
+
     async def get_saved_message(self, saved_id: int, user_id: int) -> Optional[Dict[str, Any]]:
         """Récupère un message sauvegardé spécifique"""
         async with self.pool.acquire() as conn:
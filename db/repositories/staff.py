@@ -1,7 +1,8 @@
-import json
 import logging
 from typing import Dict, Any, List
 
+import orjson
+
 logger = logging.getLogger('moddy.database')
 
 
@@ -16,27 +17,53 @@ class StaffRepository:
                 user_id
             )
 
-            if not row:
-                return {
-                    'user_id': user_id,
-                    'roles': [],
-                    'denied_commands': [],
-                    'role_permissions': {},
-                    'created_at': None,
-                    'updated_at': None
-                }
+        return self._staff_record(user_id, row)
+
+    async def get_staff_member(self, user_id: int) -> Dict[str, Any]:
+        """Récupère l'attribut TEAM et les permissions staff en une requête
+
+        Retourne {'is_team': bool, 'permissions': <même forme que
+        get_staff_permissions>}. Contrairement à get_user, ne crée pas
+        la ligne users si elle n'existe pas.
+        """
+        async with self.pool.acquire() as conn:
+            row = await conn.fetchrow("""
+                SELECT u.attributes, sp.user_id, sp.roles, sp.denied_commands, sp.role_permissions,
+                       sp.created_at, sp.updated_at, sp.created_by, sp.updated_by
+                FROM (SELECT $1::bigint AS user_id) k
+                LEFT JOIN users u ON u.user_id = k.user_id
+                LEFT JOIN staff_permissions sp ON sp.user_id = k.user_id
+            """, user_id)
+
+        attributes = self._parse_jsonb(row['attributes'])
+        return {
+            'is_team': bool(attributes.get('TEAM')),
+            'permissions': self._staff_record(user_id, row if row['user_id'] is not None else None)
+        }
 
+    def _staff_record(self, user_id: int, row) -> Dict[str, Any]:
+        """Convertit une ligne staff_permissions (ou None) en dictionnaire"""
+        if not row:
             return {
-                'user_id': row['user_id'],
-                'roles': self._parse_jsonb_list(row['roles']),
-                'denied_commands': self._parse_jsonb_list(row['denied_commands']),
-                'role_permissions': self._parse_jsonb(row.get('role_permissions')),
-                'created_at': row.get('created_at'),
-                'updated_at': row.get('updated_at'),
-                'created_by': row.get('created_by'),
-                'updated_by': row.get('updated_by')
+                'user_id': user_id,
+                'roles': [],
+                'denied_commands': [],
+                'role_permissions': {},
+                'created_at': None,
+                'updated_at': None
             }
 
+        return {
+            'user_id': row['user_id'],
+            'roles': self._parse_jsonb_list(row['roles']),
+            'denied_commands': self._parse_jsonb_list(row['denied_commands']),
+            'role_permissions': self._parse_jsonb(row.get('role_permissions')),
+            'created_at': row.get('created_at'),
+            'updated_at': row.get('updated_at'),
+            'created_by': row.get('created_by'),
+            'updated_by': row.get('updated_by')
+        }
+
     async def set_staff_roles(self, user_id: int, roles: List[str], updated_by: int):
         """Définit les rôles staff d'un utilisateur"""
         async with self.pool.acquire() as conn:
@@ -45,32 +72,69 @@ class StaffRepository:
                 VALUES ($1, $2, $3, $3)
                 ON CONFLICT (user_id)
                 DO UPDATE SET roles = $2, updated_by = $3, updated_at = NOW()
-            """, user_id, json.dumps(roles), updated_by)
+            """, user_id, orjson.dumps(roles).decode(), updated_by)
 
             # Set TEAM attribute automatically
             await self.set_attribute('user', user_id, 'TEAM', True, updated_by, "Added to staff team")
 
+        self._notify_staff_change(user_id)
+
+    async def set_staff_roles_and_permissions(self, user_id: int, roles: List[str],
+                                              role_permissions: Dict[str, List[str]], updated_by: int):
+        """Définit les rôles et les permissions par rôle en une seule écriture
+
+        Un seul upsert pour les deux colonnes, et l'attribut TEAM dans la même
+        transaction : rôles et permissions ne peuvent pas se désynchroniser.
+        """
+        async with self.pool.acquire() as conn:
+            async with conn.transaction():
+                await conn.execute("""
+                    INSERT INTO staff_permissions (user_id, roles, role_permissions, updated_by, created_by)
+                    VALUES ($1, $2, $3, $4, $4)
+                    ON CONFLICT (user_id)
+                    DO UPDATE SET roles = $2, role_permissions = $3, updated_by = $4, updated_at = NOW()
+                """, user_id, orjson.dumps(roles).decode(), orjson.dumps(role_permissions).decode(), updated_by)
+                old_value = await self._write_attribute(
+                    conn, 'user', user_id, 'TEAM', True, updated_by, "Added to staff team"
+                )
+
+        self._notify_attribute_change('user', user_id, 'TEAM', old_value, True, updated_by, "Added to staff team")
+        self._notify_staff_change(user_id)
+
     async def add_staff_role(self, user_id: int, role: str, updated_by: int):
         """Ajoute un rôle staff à un utilisateur"""
-        perms = await self.get_staff_permissions(user_id)
-        roles = perms['roles']
+        # Ajout atomique côté serveur : pas de lecture-modification-écriture
+        async with self.pool.acquire() as conn:
+            added = await conn.fetchval("""
+                INSERT INTO staff_permissions (user_id, roles, updated_by, created_by)
+                VALUES ($1, jsonb_build_array($2::text), $3, $3)
+                ON CONFLICT (user_id)
+                DO UPDATE SET roles = COALESCE(staff_permissions.roles, '[]'::jsonb) || jsonb_build_array($2::text),
+                              updated_by = $3, updated_at = NOW()
+                WHERE NOT COALESCE(staff_permissions.roles ? $2::text, false)
+                RETURNING true
+            """, user_id, role, updated_by)
 
-        if role not in roles:
-            roles.append(role)
-            await self.set_staff_roles(user_id, roles, updated_by)
+        self._notify_staff_change(user_id)
+
+        if added:
+            await self.set_attribute('user', user_id, 'TEAM', True, updated_by, "Added to staff team")
 
     async def remove_staff_role(self, user_id: int, role: str, updated_by: int):
         """Retire un rôle staff d'un utilisateur"""
-        perms = await self.get_staff_permissions(user_id)
-        roles = perms['roles']
+        async with self.pool.acquire() as conn:
+            remaining = await conn.fetchval("""
+                UPDATE staff_permissions
+                SET roles = roles - $2::text, updated_by = $3, updated_at = NOW()
+                WHERE user_id = $1 AND roles ? $2::text
+                RETURNING jsonb_array_length(roles)
+            """, user_id, role, updated_by)
 
-        if role in roles:
-            roles.remove(role)
-            await self.set_staff_roles(user_id, roles, updated_by)
+        self._notify_staff_change(user_id)
 
-            # If no more roles, remove TEAM attribute
-            if not roles:
-                await self.set_attribute('user', user_id, 'TEAM', None, updated_by, "Removed from staff team")
+        # If no more roles, remove TEAM attribute
+        if remaining == 0:
+            await self.set_attribute('user', user_id, 'TEAM', None, updated_by, "Removed from staff team")
 
     async def set_denied_commands(self, user_id: int, denied_commands: List[str], updated_by: int):
         """Définit les commandes interdites pour un utilisateur"""
@@ -80,25 +144,35 @@ class StaffRepository:
                 VALUES ($1, $2, $3, $3)
                 ON CONFLICT (user_id)
                 DO UPDATE SET denied_commands = $2, updated_by = $3, updated_at = NOW()
-            """, user_id, json.dumps(denied_commands), updated_by)
+            """, user_id, orjson.dumps(denied_commands).decode(), updated_by)
+
+        self._notify_staff_change(user_id)
 
     async def add_denied_command(self, user_id: int, command: str, updated_by: int):
         """Ajoute une commande à la liste des commandes interdites"""
-        perms = await self.get_staff_permissions(user_id)
-        denied = perms['denied_commands']
+        async with self.pool.acquire() as conn:
+            await conn.execute("""
+                INSERT INTO staff_permissions (user_id, denied_commands, updated_by, created_by)
+                VALUES ($1, jsonb_build_array($2::text), $3, $3)
+                ON CONFLICT (user_id)
+                DO UPDATE SET denied_commands = COALESCE(staff_permissions.denied_commands, '[]'::jsonb)
+                                                || jsonb_build_array($2::text),
+                              updated_by = $3, updated_at = NOW()
+                WHERE NOT COALESCE(staff_permissions.denied_commands ? $2::text, false)
+            """, user_id, command, updated_by)
 
-        if command not in denied:
-            denied.append(command)
-            await self.set_denied_commands(user_id, denied, updated_by)
+        self._notify_staff_change(user_id)
 
     async def remove_denied_command(self, user_id: int, command: str, updated_by: int):
         """Retire une commande de la liste des commandes interdites"""
-        perms = await self.get_staff_permissions(user_id)
-        denied = perms['denied_commands']
+        async with self.pool.acquire() as conn:
+            await conn.execute("""
+                UPDATE staff_permissions
+                SET denied_commands = denied_commands - $2::text, updated_by = $3, updated_at = NOW()
+                WHERE user_id = $1 AND denied_commands ? $2::text
+            """, user_id, command, updated_by)
 
-        if command in denied:
-            denied.remove(command)
-            await self.set_denied_commands(user_id, denied, updated_by)
+        self._notify_staff_change(user_id)
 
     async def remove_staff_permissions(self, user_id: int):
         """Supprime complètement les permissions staff d'un utilisateur"""
@@ -108,6 +182,28 @@ class StaffRepository:
                 user_id
             )
 
+        self._notify_staff_change(user_id)
+
+    async def remove_staff_member(self, user_id: int, removed_by: int, reason: str = None):
+        """Retire un membre du staff : permissions et attribut TEAM
+
+        Les deux écritures (et l'audit de l'attribut) partagent une seule
+        connexion et une transaction : pas d'état à moitié retiré si l'une
+        échoue.
+        """
+        async with self.pool.acquire() as conn:
+            async with conn.transaction():
+                await conn.execute(
+                    "DELETE FROM staff_permissions WHERE user_id = $1",
+                    user_id
+                )
+                old_value = await self._write_attribute(
+                    conn, 'user', user_id, 'TEAM', False, removed_by, reason
+                )
+
+        self._notify_attribute_change('user', user_id, 'TEAM', old_value, False, removed_by, reason)
+        self._notify_staff_change(user_id)
+
     async def get_all_staff_members(self) -> List[Dict[str, Any]]:
         """Récupère tous les membres du staff"""
         async with self.pool.acquire() as conn:
@@ -124,19 +220,41 @@ class StaffRepository:
                 'updated_at': row.get('updated_at')
             } for row in rows]
 
-    async def set_role_permissions(self, user_id: int, role: str, permissions: List[str], updated_by: int):
-        """Définit les permissions pour un rôle spécifique d'un utilisateur"""
-        perms = await self.get_staff_permissions(user_id)
-        role_perms = perms['role_permissions']
-        role_perms[role] = permissions
+    async def set_role_permissions(self, user_id: int, role: str, permissions: List[str],
+                                   updated_by: int) -> Dict[str, Any]:
+        """Définit les permissions pour un rôle spécifique d'un utilisateur
 
+        Retourne les rôles et permissions après écriture (RETURNING), ce qui
+        évite une relecture séparée à l'appelant.
+        """
+        # Seule la clé du rôle est remplacée, côté serveur : une modification
+        # concurrente d'un autre rôle n'est pas écrasée
         async with self.pool.acquire() as conn:
-            await conn.execute("""
+            row = await conn.fetchrow("""
                 INSERT INTO staff_permissions (user_id, role_permissions, updated_by, created_by)
-                VALUES ($1, $2, $3, $3)
+                VALUES ($1, jsonb_build_object($2::text, $3::jsonb), $4, $4)
                 ON CONFLICT (user_id)
-                DO UPDATE SET role_permissions = $2, updated_by = $3, updated_at = NOW()
-            """, user_id, json.dumps(role_perms), updated_by)
+                DO UPDATE SET role_permissions = COALESCE(staff_permissions.role_permissions, '{}'::jsonb)
+                                                 || jsonb_build_object($2::text, $3::jsonb),
+                              updated_by = $4, updated_at = NOW()
+                RETURNING roles, role_permissions
+            """, user_id, role, orjson.dumps(permissions).decode(), updated_by)
+
+        self._notify_staff_change(user_id)
+
+        return {
+            'roles': self._parse_jsonb_list(row['roles']),
+            'role_permissions': self._parse_jsonb(row['role_permissions'])
+        }
+
+    def _notify_staff_change(self, user_id: int):
+        # Invalidation du cache de permissions (synchrone, best-effort)
+        hook = getattr(self, "on_staff_permissions_change", None)
+        if hook:
+            try:
+                hook(user_id)
+            except Exception as exc:
+                logger.debug(f"on_staff_permissions_change hook failed: {exc}")
 
     async def get_role_permissions(self, user_id: int, role: str) -> List[str]:
         """Récupère les permissions d'un rôle spécifique"""
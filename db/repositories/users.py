@@ -21,16 +21,19 @@ class UserRepository:
             )
 
             if not row:
-                # Crée l'utilisateur s'il n'existe pas, gère la concurrence
-                await conn.execute(
-                    "INSERT INTO users (user_id) VALUES ($1) ON CONFLICT (user_id) DO NOTHING",
-                    user_id
-                )
-                # Re-fetch pour être sûr d'avoir les données
+                # Crée l'utilisateur s'il n'existe pas et récupère la ligne
+                # dans la même requête
                 row = await conn.fetchrow(
-                    "SELECT * FROM users WHERE user_id = $1",
+                    "INSERT INTO users (user_id) VALUES ($1) "
+                    "ON CONFLICT (user_id) DO NOTHING RETURNING *",
                     user_id
                 )
+                if not row:
+                    # Créé entre-temps par une requête concurrente
+                    row = await conn.fetchrow(
+                        "SELECT * FROM users WHERE user_id = $1",
+                        user_id
+                    )
 
             return {
                 'user_id': row['user_id'],
@@ -42,9 +45,9 @@ class UserRepository:
                 'updated_at': row.get('updated_at', datetime.now(timezone.utc))
             }
 
-    async def update_user_data(self, user_id: int, path: str, value: Any):
+    async def update_user_data(self, user_id: int, path: str, value: Any) -> Any:
         """Met à jour une partie spécifique de la data utilisateur"""
-        await self._update_entity_data('users', 'user_id', user_id, path, value)
+        return await self._update_entity_data('users', 'user_id', user_id, path, value)
 
     async def get_users_with_attribute(self, attribute: str, value: Any = None) -> List[int]:
         """Récupère tous les utilisateurs ayant un attribut spécifique
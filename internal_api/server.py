@@ -105,14 +105,21 @@ async def status(request: Request):
     start_time = getattr(bot, "_start_time", time.time())
     uptime_seconds = int(time.time() - start_time)
 
+    # Staff commands (compteurs du routeur)
+    router = bot.get_cog("StaffCommandsRouter")
+    staff_commands = router.metrics() if router else None
+
+    guild_count, user_count = bot.cache_counts()
+
     return {
         "status": "online",
-        "guilds": len(bot.guilds),
-        "users": len(bot.users),
+        "guilds": guild_count,
+        "users": user_count,
         "shards": shards,
         "latency_ms": round(bot.latency * 1000, 2),
         "uptime_seconds": uptime_seconds,
         "memory_mb": memory_mb,
+        "staff_commands": staff_commands,
     }
 
 
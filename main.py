@@ -310,8 +310,8 @@ async def start_services():
             logger.info(f"  • {name}: {state}")
 
 
-async def start_api_server():
-    """Starts the FastAPI server for health checks and internal API."""
+def create_api_server():
+    """Builds the FastAPI server for health checks and internal API."""
     import uvicorn
     from internal_api.server import app, set_bot
 
@@ -327,8 +327,7 @@ async def start_api_server():
         port=port,
         log_level="info"
     )
-    server = uvicorn.Server(config)
-    await server.serve()
+    return uvicorn.Server(config)
 
 
 async def main():
@@ -451,10 +450,34 @@ async def main():
                     logger.error(f"[FAIL] Connection error: {e}")
                     raise
 
+        api_server = create_api_server()
+
+        async def run_api_server():
+            """Runs the API server, then closes the bot with it."""
+            try:
+                await api_server.serve()
+            finally:
+                # uvicorn owns SIGINT/SIGTERM while serving: a container stop
+                # ends serve() here, so close the bot through the same path
+                # as /dev shutdown instead of leaving it connected.
+                if not bot.is_closed():
+                    logger.info("API server stopped, closing the bot...")
+                    await bot.close()
+
+        async def run_bot():
+            """Runs the bot, then lets the API server wind down with it."""
+            try:
+                await start_bot_with_retry()
+            finally:
+                # Once the bot has closed (/dev shutdown, fatal error), stop
+                # the API server too so main() returns and the process exits
+                # normally instead of idling on the HTTP listener.
+                api_server.should_exit = True
+
         # Run both API server and bot concurrently
         await asyncio.gather(
-            start_api_server(),
-            start_bot_with_retry()
+            run_api_server(),
+            run_bot()
         )
 
     except ImportError as e:
@@ -6,7 +6,6 @@ Sauvegarde les rôles des utilisateurs qui quittent et les restaure automatiquem
 import discord
 from typing import Dict, Any, Optional, List
 import logging
-from datetime import datetime
 
 from modules.module_manager import ModuleBase
 from utils.emojis import HISTORY, DONE
@@ -245,7 +244,7 @@ class AutoRestoreRolesModule(ModuleBase):
                 title=f"{HISTORY} Rôles sauvegardés",
                 description=f"Les rôles de {member.mention} ont été sauvegardés",
                 color=0xFFA500,
-                timestamp=datetime.utcnow()
+                timestamp=discord.utils.utcnow()
             )
             embed.add_field(
                 name="Utilisateur",
@@ -279,7 +278,7 @@ class AutoRestoreRolesModule(ModuleBase):
                 title=f"{DONE} Rôles restaurés",
                 description=f"Les rôles de {member.mention} ont été restaurés automatiquement",
                 color=0x00FF00,
-                timestamp=datetime.utcnow()
+                timestamp=discord.utils.utcnow()
             )
             embed.add_field(
                 name="Utilisateur",
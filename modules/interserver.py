@@ -4,6 +4,7 @@ Permet de connecter plusieurs serveurs Discord via des salons dédiés
 """
 
 import discord
+from discord import ui
 from typing import Dict, Any, Optional, List
 import logging
 import random
@@ -14,6 +15,7 @@ import asyncio
 
 from modules.module_manager import ModuleBase
 from utils.emojis import GROUPS, UNDONE, DONE, VERIFIED, LOADING as LOADING_EMOJI, REPLY as REPLY_EMOJI
+from cogs.error_handler import BaseView
 
 logger = logging.getLogger('moddy.modules.interserver')
 
@@ -25,6 +27,40 @@ ENGLISH_LOG_CHANNEL_ID = 1446555149031047388
 FRENCH_LOG_CHANNEL_ID = 1446555476044284045
 
 
+# Vues définies une seule fois (et non à chaque message relayé)
+class WelcomeView(BaseView):
+    """DM de bienvenue envoyé au premier message inter-serveur"""
+
+    def __init__(self, title: str, body: str):
+        super().__init__()
+        container = ui.Container(
+            ui.TextDisplay(content=title),
+            ui.TextDisplay(content=body),
+        )
+        self.add_item(container)
+
+
+class StaffLogView(BaseView):
+    """Log d'un message relayé, pour le salon staff (sans boutons)"""
+
+    def __init__(self, moddy_id: str, author_info: str, server_info: str, content_preview: str, success_count: int, total_count: int, is_moddy_team: bool):
+        super().__init__()
+        self.moddy_id = moddy_id
+        self.author_info = author_info
+        self.server_info = server_info
+        self.content_preview = content_preview
+        self.success_count = success_count
+        self.total_count = total_count
+        self.is_moddy_team = is_moddy_team
+
+        # Container avec les informations uniquement
+        container = ui.Container(
+            ui.TextDisplay(content=f"### {GROUPS} New Inter-Server Message"),
+            ui.TextDisplay(content=f"**Moddy ID:** `{self.moddy_id}`\n**Author:** {self.author_info}\n**Server:** {self.server_info}\n**Relayed:** {self.success_count}/{self.total_count} servers\n**Moddy Team:** {'✅ Yes' if self.is_moddy_team else '❌ No'}\n**Time:** <t:{int(datetime.now(timezone.utc).timestamp())}:R>\n\n**Content:**\n{self.content_preview}"),
+        )
+        self.add_item(container)
+
+
 class InterServerModule(ModuleBase):
     """
     Module de communication inter-serveurs
@@ -438,19 +474,7 @@ class InterServerModule(ModuleBase):
             welcome_body = t('modules.interserver.welcome_dm.body', locale=locale)
 
             # Crée le message avec Components V2
-            from discord.ui import Container, TextDisplay
-            from cogs.error_handler import BaseView
-
-            class WelcomeView(BaseView):
-                def __init__(self):
-                    super().__init__()
-                    container = Container(
-                        TextDisplay(content=welcome_title),
-                        TextDisplay(content=welcome_body),
-                    )
-                    self.add_item(container)
-
-            view = WelcomeView()
+            view = WelcomeView(welcome_title, welcome_body)
 
             # Envoie le DM
             await user.send(view=view)
@@ -500,28 +524,6 @@ class InterServerModule(ModuleBase):
             server_info = f"{message.guild.name} (`{message.guild.id}`)"
             content_preview = message.content[:500] if message.content else "*No content*"
 
-            # Crée le message de log avec Components V2 (SANS boutons)
-            from discord import ui as discord_ui
-            from cogs.error_handler import BaseView
-
-            class StaffLogView(BaseView):
-                def __init__(self, moddy_id: str, author_info: str, server_info: str, content_preview: str, success_count: int, total_count: int, is_moddy_team: bool):
-                    super().__init__()
-                    self.moddy_id = moddy_id
-                    self.author_info = author_info
-                    self.server_info = server_info
-                    self.content_preview = content_preview
-                    self.success_count = success_count
-                    self.total_count = total_count
-                    self.is_moddy_team = is_moddy_team
-
-                    # Container avec les informations uniquement
-                    container = discord_ui.Container(
-                        discord_ui.TextDisplay(content=f"### {GROUPS} New Inter-Server Message"),
-                        discord_ui.TextDisplay(content=f"**Moddy ID:** `{self.moddy_id}`\n**Author:** {self.author_info}\n**Server:** {self.server_info}\n**Relayed:** {self.success_count}/{self.total_count} servers\n**Moddy Team:** {'✅ Yes' if self.is_moddy_team else '❌ No'}\n**Time:** <t:{int(datetime.now(timezone.utc).timestamp())}:R>\n\n**Content:**\n{self.content_preview}"),
-                    )
-                    self.add_item(container)
-
             # Envoie le log
             log_view = StaffLogView(moddy_id, author_info, server_info, content_preview, success_count, total_count, is_moddy_team)
             await log_channel.send(view=log_view, allowed_mentions=discord.AllowedMentions.none())
@@ -631,7 +633,7 @@ class InterServerModule(ModuleBase):
                     await asyncio.sleep(5)
                     try:
                         await message.remove_reaction(DONE, self.bot.user)
-                    except:
+                    except Exception:
                         pass
 
                 asyncio.create_task(remove_done_reaction())
@@ -654,7 +656,7 @@ class InterServerModule(ModuleBase):
                     await asyncio.sleep(5)
                     try:
                         await message.remove_reaction(DONE, self.bot.user)
-                    except:
+                    except Exception:
                         pass
 
                 asyncio.create_task(remove_done_reaction())
@@ -672,5 +674,5 @@ class InterServerModule(ModuleBase):
             try:
                 await message.remove_reaction(LOADING_EMOJI, self.bot.user)
                 await message.add_reaction(UNDONE)
-            except:
+            except Exception:
                 pass
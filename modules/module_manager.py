@@ -111,7 +111,7 @@ class ModuleBase(ABC):
         # Par défaut, utilise les traductions du module si disponibles
         try:
             return t(f'modules.{self.MODULE_ID}.config.{field_name}.section_title', locale=locale)
-        except:
+        except Exception:
             # Fallback sur le nom brut du champ
             return field_name.replace('_', ' ').title()
 
@@ -334,7 +334,7 @@ class ModuleManager:
                 try:
                     guild = self.bot.get_guild(guild_id)
                     locale = str(guild.preferred_locale) if guild and guild.preferred_locale else 'en-US'
-                except:
+                except Exception:
                     locale = 'en-US'
 
                 # Construit le message d'erreur avec les labels traduits
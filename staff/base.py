@@ -9,6 +9,9 @@ import logging
 from typing import Optional, Union
 from discord.ui import LayoutView
 
+from automod.cache import LruTtlCache, MISS
+from utils.components_v2 import create_error_message
+
 logger = logging.getLogger('moddy.staff_base')
 
 
@@ -32,8 +35,26 @@ class StaffCommandsCog(commands.Cog):
 
     def __init__(self, bot):
         self.bot = bot
-        # Store command message -> response message mapping for auto-deletion
-        self.command_responses = {}  # {command_msg_id: response_msg_id}
+        # Store command message -> response message mapping for auto-deletion.
+        # Bounded: entries were never removed unless the command was deleted,
+        # so the map grew for the whole lifetime of the process.
+        self.command_responses = LruTtlCache(max_entries=2000, ttl_seconds=24 * 3600)  # {command_msg_id: response_msg_id}
+        # Command messages already dispatched, so an event replayed after a
+        # gateway resume does not run the same command twice.
+        self._dispatched_commands = LruTtlCache(max_entries=2000, ttl_seconds=300)
+
+    def first_delivery(self, message: discord.Message) -> bool:
+        """
+        Record a command message as dispatched
+
+        Returns False if this message was already handled by this cog (event
+        replayed after a reconnect), True the first time it is seen.
+        """
+        if self._dispatched_commands.get(message.id) is not MISS:
+            logger.debug("Ignoring replayed command message %s", message.id)
+            return False
+        self._dispatched_commands.set(message.id, True)
+        return True
 
     @commands.Cog.listener()
     async def on_message_delete(self, message: discord.Message):
@@ -44,18 +65,18 @@ class StaffCommandsCog(commands.Cog):
         the bot's response message, keeping channels clean.
         """
         # Check if this message is a command that has a response
-        if message.id in self.command_responses:
-            response_msg_id = self.command_responses[message.id]
+        response_msg_id = self.command_responses.get(message.id)
+        if response_msg_id is not MISS:
             try:
                 # Try to fetch and delete the response message
                 response_msg = await message.channel.fetch_message(response_msg_id)
                 await response_msg.delete()
-                logger.info(f"Auto-deleted response {response_msg_id} for deleted command {message.id}")
+                logger.info("Auto-deleted response %s for deleted command %s", response_msg_id, message.id)
             except (discord.NotFound, discord.Forbidden, discord.HTTPException) as e:
-                logger.debug(f"Could not delete response message {response_msg_id}: {e}")
+                logger.debug("Could not delete response message %s: %s", response_msg_id, e)
             finally:
                 # Clean up the mapping
-                del self.command_responses[message.id]
+                self.command_responses.discard(message.id)
 
     async def reply_with_tracking(
         self,
@@ -87,5 +108,14 @@ class StaffCommandsCog(commands.Cog):
         """
         reply_msg = await message.reply(view=view, content=content, mention_author=mention_author)
         # Store for auto-deletion
-        self.command_responses[message.id] = reply_msg.id
+        self.command_responses.set(message.id, reply_msg.id)
         return reply_msg
+
+    async def reply_error(self, message: discord.Message, title: str, description: str) -> discord.Message:
+        """
+        Reply with a standard error panel, tracked for auto-deletion
+
+        A fresh view is built per reply: a sent view is bound to its message,
+        so one instance cannot be shared between replies.
+        """
+        return await self.reply_with_tracking(message, create_error_message(title, description))
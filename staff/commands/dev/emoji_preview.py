@@ -35,11 +35,12 @@ async def _resolve_emoji(bot, raw: str):
         return pe, f"<:{name}:{emoji_id}>"
 
     # Name or ID only — need to look up the application emoji list.
+    wanted = name.lower() if name else None
     for e in await bot.fetch_application_emojis():
         if emoji_id and e.id == emoji_id:
             pe = discord.PartialEmoji(name=e.name, id=e.id)
             return pe, f"<:{e.name}:{e.id}>"
-        if name and e.name.lower() == name.lower():
+        if wanted and e.name.lower() == wanted:
             pe = discord.PartialEmoji(name=e.name, id=e.id)
             return pe, f"<:{e.name}:{e.id}>"
 
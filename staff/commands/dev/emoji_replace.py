@@ -28,10 +28,11 @@ def _parse_input(raw: str):
 
 
 async def _find_app_emoji(bot, name, emoji_id):
+    wanted = name.lower() if name else None
     for e in await bot.fetch_application_emojis():
         if emoji_id and e.id == emoji_id:
             return e
-        if name and e.name.lower() == name.lower():
+        if wanted and e.name.lower() == wanted:
             return e
     return None
 
@@ -12,6 +12,8 @@ STATUS_MAP = {
     "dnd": discord.Status.dnd,
     "invisible": discord.Status.invisible,
 }
+# Accepted values as shown in the usage error, built once.
+STATUS_OPTIONS = " | ".join(f"`{k}`" for k in STATUS_MAP)
 
 STATUS_LABELS = {
     "online": f"{emojis.GREEN_STATUS} Online",
@@ -28,7 +30,7 @@ class PresenceCommand(StaffCommand):
     description = "Change the bot's presence (status + activity)."
     options = [
         SlashOption("status", "string", "Presence status.", required=True,
-                    choices=["online", "idle", "dnd", "invisible"]),
+                    choices=list(STATUS_MAP)),
         SlashOption("activity", "string", "Optional activity text.", required=False),
     ]
 
@@ -44,10 +46,9 @@ class PresenceCommand(StaffCommand):
         activity_text = ctx.opt("activity")
 
         if status_key not in STATUS_MAP:
-            options = " | ".join(f"`{k}`" for k in STATUS_MAP)
             await ctx.send(view=design.error(
                 t("staff.common.invalid_usage.title", locale=ctx.locale),
-                t("staff.dev.presence.usage", locale=ctx.locale, options=options),
+                t("staff.dev.presence.usage", locale=ctx.locale, options=STATUS_OPTIONS),
             ))
             return
 
@@ -5,11 +5,10 @@ import re
 import discord
 from discord import ui
 
-from staff.framework import StaffCommand, staff_command, design, CommandType
+from staff.framework import StaffCommand, staff_command, design, CommandType, owner_only
 from staff.framework.design import make_container, title_line
 from utils import emojis
 from utils.i18n import i18n, t
-from utils.components_v2 import create_error_message
 from cogs.error_handler import BaseView
 
 _PER_PAGE = 10
@@ -66,18 +65,8 @@ class ServerListNavButton(ui.DynamicItem[ui.Button], template=_CID_NAV_TEMPLATE)
         return cls(match["action"], int(match["owner"]), int(match["page"]))
 
     @_guarded
+    @owner_only("owner_id")
     async def callback(self, interaction: discord.Interaction):
-        if interaction.user.id != self.owner_id:
-            locale = i18n.get_user_locale(interaction)
-            await interaction.response.send_message(
-                view=create_error_message(
-                    t("errors.not_your_message.title", locale=locale),
-                    t("errors.not_your_message.description", locale=locale),
-                ),
-                ephemeral=True,
-            )
-            return
-
         bot = interaction.client
         locale = i18n.get_user_locale(interaction)
         guilds = _sorted_guilds(bot)
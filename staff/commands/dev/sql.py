@@ -4,6 +4,9 @@ Dangerous statements (DROP/DELETE/TRUNCATE/ALTER/UPDATE) require an explicit
 confirmation via buttons before running.
 """
 
+import logging
+import re
+
 import discord
 from discord import ui
 
@@ -11,42 +14,83 @@ from staff.framework import StaffCommand, SlashOption, staff_command, design, Co
 from utils import emojis
 from utils.i18n import t
 from cogs.error_handler import BaseView
+from db.base import SESSION_RESET_QUERY
 
 DANGEROUS = ("DROP", "DELETE", "TRUNCATE", "ALTER", "UPDATE")
+# Same substring match as before, in one case-insensitive pass over the query.
+_DANGEROUS_RE = re.compile("|".join(DANGEROUS), re.IGNORECASE)
+
+logger = logging.getLogger("moddy.staff.dev.sql")
+
+
+async def _run_query(conn, query: str, locale: str) -> BaseView:
+    """Run the query on an acquired connection and build the result panel."""
+    if query.upper().lstrip().startswith("SELECT"):
+        rows = await conn.fetch(query)
+        if not rows:
+            return design.success(t("staff.dev.sql.done_title", locale=locale),
+                                  t("staff.dev.sql.no_rows", locale=locale))
+        lines = [" | ".join(str(v) for v in row.values()) for row in rows[:10]]
+        result = "```\n" + "\n".join(lines) + "\n```"
+        if len(rows) > 10:
+            result += f"\n-# +{len(rows) - 10}"
+        return design.success(
+            t("staff.dev.sql.done_title", locale=locale),
+            t("staff.dev.sql.rows", locale=locale, count=len(rows)) + f"\n{result}",
+        )
+    result = await conn.execute(query)
+    return design.success(
+        t("staff.dev.sql.done_title", locale=locale),
+        f"```sql\n{query[:400]}\n```\n**{t('staff.dev.sql.result', locale=locale)}:** `{result}`",
+    )
+
+
+def _error_panel(query: str, exc: Exception, locale: str) -> BaseView:
+    return design.error(
+        t("staff.dev.sql.fail_title", locale=locale),
+        f"```sql\n{query[:400]}\n```",
+        fields=[{"name": "Error", "value": f"```{str(exc)[:500]}```"}],
+    )
+
+
+async def _reset_session(conn) -> None:
+    """Undo whatever session state an ad-hoc query may have left behind.
+
+    The pool doesn't reset sessions on release (ModdyConnection). If the reset
+    itself fails, the connection is terminated so the pool replaces it rather
+    than handing the altered session to another caller.
+    """
+    try:
+        if conn.is_in_transaction():
+            await conn.execute("ROLLBACK")
+        await conn.execute(SESSION_RESET_QUERY)
+    except Exception as exc:
+        logger.warning(f"Session reset after /dev sql failed, dropping the connection: {exc}")
+        conn.terminate()
 
 
 async def _execute_query(bot, query: str, locale: str) -> BaseView:
     """Run the query and return a result panel."""
     try:
         async with bot.db.pool.acquire() as conn:
-            if query.upper().lstrip().startswith("SELECT"):
-                rows = await conn.fetch(query)
-                if not rows:
-                    return design.success(t("staff.dev.sql.done_title", locale=locale),
-                                          t("staff.dev.sql.no_rows", locale=locale))
-                lines = [" | ".join(str(v) for v in row.values()) for row in rows[:10]]
-                result = "```\n" + "\n".join(lines) + "\n```"
-                if len(rows) > 10:
-                    result += f"\n-# +{len(rows) - 10}"
-                return design.success(
-                    t("staff.dev.sql.done_title", locale=locale),
-                    t("staff.dev.sql.rows", locale=locale, count=len(rows)) + f"\n{result}",
-                )
-            result = await conn.execute(query)
-            return design.success(
-                t("staff.dev.sql.done_title", locale=locale),
-                f"```sql\n{query[:400]}\n```\n**{t('staff.dev.sql.result', locale=locale)}:** `{result}`",
-            )
+            # The panel reflects the query alone: a failed reset must not hide
+            # its error or report an already committed write as failed.
+            try:
+                view = await _run_query(conn, query, locale)
+            except Exception as exc:
+                view = _error_panel(query, exc, locale)
+            await _reset_session(conn)
+            return view
     except Exception as exc:
-        return design.error(
-            t("staff.dev.sql.fail_title", locale=locale),
-            f"```sql\n{query[:400]}\n```",
-            fields=[{"name": "Error", "value": f"```{str(exc)[:500]}```"}],
-        )
+        return _error_panel(query, exc, locale)
 
 
 class SqlConfirmView(BaseView):
-    """Confirm/cancel a dangerous query. Author-checked."""
+    """Confirm/cancel a dangerous query. Author-checked.
+
+    Stops itself as soon as it is resolved (like ``ConfirmView``), releasing
+    its timeout task and making a second click on Confirm a no-op.
+    """
 
     def __init__(self, bot, author_id: int, query: str, locale: str):
         super().__init__(timeout=60)
@@ -85,6 +129,8 @@ class SqlConfirmView(BaseView):
     async def _confirm(self, interaction: discord.Interaction):
         if not await self._guard(interaction):
             return
+        # Stop before running the query so a double click can't run it twice.
+        self.stop()
         await interaction.response.defer()
         view = await _execute_query(self.bot, self.query, self.locale)
         await interaction.edit_original_response(view=view)
@@ -92,6 +138,7 @@ class SqlConfirmView(BaseView):
     async def _cancel(self, interaction: discord.Interaction):
         if not await self._guard(interaction):
             return
+        self.stop()
         await interaction.response.edit_message(view=design.error(
             t("staff.common.cancelled", locale=self.locale),
             t("staff.dev.sql.cancelled", locale=self.locale),
@@ -120,7 +167,7 @@ class SqlCommand(StaffCommand):
             ))
             return
 
-        if any(keyword in query.upper() for keyword in DANGEROUS):
+        if _DANGEROUS_RE.search(query):
             await ctx.send(view=SqlConfirmView(ctx.bot, ctx.author.id, query, ctx.locale))
             return
 
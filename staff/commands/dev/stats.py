@@ -1,10 +1,9 @@
 """`/dev stats` — runtime, Discord, database and system statistics."""
 
-from datetime import datetime, timezone
-
 from staff.framework import StaffCommand, staff_command, design, CommandType
 from utils import emojis
 from utils.i18n import t
+from utils.uptime import format_uptime
 
 
 @staff_command
@@ -16,23 +15,19 @@ class StatsCommand(StaffCommand):
     async def execute(self, ctx):
         bot = ctx.bot
         locale = ctx.locale
-
-        uptime = datetime.now(timezone.utc) - bot.launch_time
-        days = uptime.days
-        hours, remainder = divmod(uptime.seconds, 3600)
-        minutes, seconds = divmod(remainder, 60)
+        guild_count, user_count = bot.cache_counts()
 
         fields = [{
             "name": f"{emojis.MODDY} {t('staff.dev.stats.bot', locale=locale)}",
             "value": (
-                f"**{t('staff.dev.stats.uptime', locale=locale)}:** `{days}d {hours}h {minutes}m {seconds}s`\n"
+                f"**{t('staff.dev.stats.uptime', locale=locale)}:** `{format_uptime(bot.uptime_seconds())}`\n"
                 f"**{t('staff.dev.stats.latency', locale=locale)}:** `{round(bot.latency * 1000)}ms`"
             ),
         }, {
             "name": f"{emojis.WEB} {t('staff.dev.stats.discord', locale=locale)}",
             "value": (
-                f"**{t('staff.dev.stats.guilds', locale=locale)}:** `{len(bot.guilds):,}`\n"
-                f"**{t('staff.dev.stats.users', locale=locale)}:** `{len(bot.users):,}`\n"
+                f"**{t('staff.dev.stats.guilds', locale=locale)}:** `{guild_count:,}`\n"
+                f"**{t('staff.dev.stats.users', locale=locale)}:** `{user_count:,}`\n"
                 f"**{t('staff.dev.stats.commands', locale=locale)}:** `{len(bot.tree.get_commands())}`"
             ),
         }]
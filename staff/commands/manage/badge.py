@@ -12,7 +12,7 @@ from datetime import datetime, timezone
 
 import discord
 
-from staff.framework import StaffCommand, SlashOption, staff_command, design, CommandType, parse_user_id
+from staff.framework import StaffCommand, SlashOption, staff_command, design, CommandType, parse_user_id, resolve_user
 from utils import emojis
 from utils.i18n import t
 
@@ -26,6 +26,11 @@ BADGE_ALIASES = {
 REMOVE_WORDS = {"rm", "remove", "del", "delete"}
 
 
+def _parse_orgs(raw: str) -> list:
+    """Comma-separated org names: stripped once, blanks and repeats dropped, order kept."""
+    return list(dict.fromkeys(o for o in (part.strip() for part in raw.split(",")) if o))
+
+
 async def _apply_set(db, uid, attr_key, modifier, orgs):
     now_ts = int(datetime.now(timezone.utc).timestamp())
     await db.set_attribute("user", uid, attr_key, True, modifier, f"Badge {attr_key} set via badge command")
@@ -34,10 +39,7 @@ async def _apply_set(db, uid, attr_key, modifier, orgs):
         user_db = await db.get_user(uid)
         existing = (user_db.get("data") or {}).get("verification", {}).get("VERIFIED_ORG_MEMBER", {})
         existing_orgs = existing.get("orgs") if isinstance(existing, dict) else []
-        merged = list(existing_orgs) if isinstance(existing_orgs, list) else []
-        for org in orgs:
-            if org not in merged:
-                merged.append(org)
+        merged = list(dict.fromkeys([*(existing_orgs if isinstance(existing_orgs, list) else []), *orgs]))
         await db.update_user_data(uid, "verification.VERIFIED_ORG_MEMBER.orgs", merged)
         return merged
     return None
@@ -84,7 +86,7 @@ class BadgeCommand(StaffCommand):
         user = ctx.opt("user")
         action = ctx.opt("action") or "add"
         attr_key = BADGE_ALIASES.get((ctx.opt("type") or "verified").lower(), "VERIFIED")
-        orgs = [o.strip() for o in (ctx.opt("orgs") or "").split(",") if o.strip()]
+        orgs = _parse_orgs(ctx.opt("orgs") or "")
 
         if action == "remove":
             await _apply_remove(db, user.id, attr_key, ctx.author.id)
@@ -106,11 +108,8 @@ class BadgeCommand(StaffCommand):
         db = ctx.bot.db
         locale = ctx.locale
 
-        target_id = None
-        for mention in ctx.message.mentions:
-            if mention.id != ctx.bot.user.id:
-                target_id = mention.id
-                break
+        bot_id = ctx.bot.user.id
+        target_id = next((m.id for m in ctx.message.mentions if m.id != bot_id), None)
         if target_id is None and tokens:
             target_id = parse_user_id(tokens[0])
         if tokens and re.match(r"<@!?\d+>", tokens[0]) or (tokens and parse_user_id(tokens[0]) is not None):
@@ -122,16 +121,16 @@ class BadgeCommand(StaffCommand):
 
         action = tokens[0].lower()
         try:
-            user = await ctx.bot.fetch_user(target_id)
+            user = await resolve_user(ctx.bot, target_id)
             mention = user.mention
         except Exception:
             mention = f"<@{target_id}>"
 
         if action in REMOVE_WORDS:
-            if len(tokens) < 2 or tokens[1].lower() not in BADGE_ALIASES:
+            attr_key = BADGE_ALIASES.get(tokens[1].lower()) if len(tokens) > 1 else None
+            if attr_key is None:
                 await ctx.send(view=design.invalid_usage(locale, "m.badge <@user> rm <v|org|member>"))
                 return
-            attr_key = BADGE_ALIASES[tokens[1].lower()]
             await _apply_remove(db, target_id, attr_key, ctx.author.id)
             await ctx.send(view=design.success(
                 t("staff.manage.badge.removed_title", locale=locale),
@@ -144,7 +143,7 @@ class BadgeCommand(StaffCommand):
             return
 
         attr_key = BADGE_ALIASES[action]
-        orgs = [o.strip() for o in " ".join(tokens[1:]).split(",") if o.strip()]
+        orgs = _parse_orgs(" ".join(tokens[1:]))
         merged = await _apply_set(db, target_id, attr_key, ctx.author.id, orgs)
         desc = t("staff.manage.badge.assigned", locale=locale, key=f"`{attr_key}`", user=mention)
         if merged:
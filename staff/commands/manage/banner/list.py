@@ -26,7 +26,7 @@ class BannerListCommand(StaffCommand):
         for r in rows[:20]:
             active = "**[ACTIVE]** " if r["is_active"] else ""
             kind = r["type"] or "custom"
-            msg = r["message"][:60] + ("…" if len(r["message"]) > 60 else "")
+            msg = design.truncate(r["message"], 60)
             lines.append(f"`{r['id']}` {active}**{kind}** — {msg}")
         await ctx.send(view=design.panel(
             "info",
@@ -6,7 +6,7 @@ permissions for each role (and the shared "common" set), then save — or remove
 the member from the team. Works from both message and slash transports.
 """
 
-import json
+import asyncio
 import logging
 import re
 from typing import Dict, List, Optional
@@ -14,12 +14,11 @@ from typing import Dict, List, Optional
 import discord
 from discord import ui
 
-from staff.framework import StaffCommand, SlashOption, staff_command, design, CommandType, parse_user_id
+from staff.framework import StaffCommand, SlashOption, staff_command, design, CommandType, resolve_user, owner_only
 from staff.framework import badges
 from utils import emojis
 from utils.i18n import i18n, t
-from utils.components_v2 import create_error_message
-from utils.staff_permissions import staff_permissions, StaffRole
+from utils.staff_permissions import staff_permissions, StaffRole, ROLE_BY_VALUE
 from utils.staff_role_permissions import (
     COMMON_PERMISSIONS, ROLE_PERMISSIONS_MAP, get_permission_label, get_role_display_name,
 )
@@ -33,6 +32,15 @@ ASSIGNABLE_ROLES = [
     StaffRole.SUPERVISOR_SUP, StaffRole.MODERATOR, StaffRole.COMMUNICATION, StaffRole.SUPPORT,
 ]
 
+# Role label + parsed badge, computed once: the role and scope selects are
+# rebuilt on every panel refresh, only ``default`` changes between builds.
+_ROLE_OPTION_SPECS = {
+    role: (get_role_display_name(role.value),
+           discord.PartialEmoji.from_str(badges.role_badge(role.value)) if badges.role_badge(role.value) else None)
+    for role in ASSIGNABLE_ROLES
+}
+_SETTINGS_EMOJI = discord.PartialEmoji.from_str(emojis.SETTINGS)
+
 # --------------------------------------------------------------------------- #
 # custom_id templates
 #
@@ -76,23 +84,6 @@ def _guarded(callback):
     return wrapper
 
 
-async def _reject_if_not_modifier(interaction: discord.Interaction, modifier_id: int) -> bool:
-    """Return True (and answer ephemerally) if the clicker is not the staff
-    member who opened this panel — same "not your menu" semantics the
-    non-persistent view enforced via self.modifier.id."""
-    if interaction.user.id == modifier_id:
-        return False
-    locale = i18n.get_user_locale(interaction)
-    await interaction.response.send_message(
-        view=create_error_message(
-            t("errors.not_your_message.title", locale=locale),
-            t("errors.not_your_message.description", locale=locale),
-        ),
-        ephemeral=True,
-    )
-    return True
-
-
 async def _load_panel_state(bot, target_id: int):
     """Re-fetch everything a StaffManagerPanel needs to render, keyed only
     on target_id. Used both for the initial command and to rebuild after a
@@ -100,14 +91,21 @@ async def _load_panel_state(bot, target_id: int):
     rather than silently mixed with whichever staff member's session last
     used the shared shell instance (see Step 8's mutate-and-resend-self
     writeup for why that matters)."""
-    target = await bot.fetch_user(target_id)
-    user_data = await bot.db.get_user(target_id)
-    is_staff = bool(user_data["attributes"].get("TEAM"))
-    perms = await bot.db.get_staff_permissions(target_id)
-    roles = [StaffRole(r) for r in perms["roles"] if r != StaffRole.DEV.value]
+    # Independent reads (one HTTP, one DB): issued together.
+    target, member = await asyncio.gather(
+        resolve_user(bot, target_id),
+        bot.db.get_staff_member(target_id),
+    )
+    return (target, member["is_team"], *_split_staff_perms(member["permissions"]))
+
+
+def _split_staff_perms(perms: dict):
+    """Split a staff_permissions record into the panel's (roles,
+    role_permissions, common) triple."""
+    roles = [ROLE_BY_VALUE[r] for r in perms["roles"] if r != StaffRole.DEV.value]
     role_perms = {k: list(v) for k, v in (perms.get("role_permissions", {}) or {}).items() if k != "common"}
     common = list((perms.get("role_permissions", {}) or {}).get("common", []))
-    return target, is_staff, roles, role_perms, common
+    return roles, role_perms, common
 
 
 class StaffManagerPanel(BaseView):
@@ -193,13 +191,13 @@ class StaffManagerPanel(BaseView):
         if self.roles:
             scope_options = [discord.SelectOption(
                 label=t("staff.manage.staff.common", locale=loc), value="common",
-                emoji=discord.PartialEmoji.from_str(emojis.SETTINGS), default=self.scope == "common",
+                emoji=_SETTINGS_EMOJI, default=self.scope == "common",
             )]
             for role in self.roles:
                 if ROLE_PERMISSIONS_MAP.get(role.value):
+                    label, emoji = _ROLE_OPTION_SPECS[role]
                     scope_options.append(discord.SelectOption(
-                        label=get_role_display_name(role.value), value=role.value,
-                        emoji=discord.PartialEmoji.from_str(badges.role_badge(role.value)) if badges.role_badge(role.value) else None,
+                        label=label, value=role.value, emoji=emoji,
                         default=self.scope == role.value,
                     ))
 
@@ -248,14 +246,23 @@ class StaffManagerPanel(BaseView):
     @staticmethod
     async def _rebuild(interaction: discord.Interaction, target_id: int, modifier_id: int, *,
                         roles: List[StaffRole], role_permissions: Dict[str, List[str]],
-                        common_permissions: List[str], scope: str = "common") -> "StaffManagerPanel":
+                        common_permissions: List[str], scope: str = "common",
+                        target: Optional[discord.User] = None,
+                        is_staff: Optional[bool] = None) -> "StaffManagerPanel":
         """Construct a fresh panel — never mutate/resend a possibly-shared
         shell instance in place (see Step 8's writeup on why that leaks
-        state across sessions on a view this high-privilege)."""
+        state across sessions on a view this high-privilege).
+
+        Callers that already loaded (or just wrote) the target's state pass
+        ``target``/``is_staff`` so it isn't fetched a second time."""
         bot = interaction.client
         locale = i18n.get_user_locale(interaction)
-        target, is_staff, _, _, _ = await _load_panel_state(bot, target_id)
-        modifier = await bot.fetch_user(modifier_id)
+        if target is None or is_staff is None:
+            (target, is_staff, _, _, _), modifier = await asyncio.gather(
+                _load_panel_state(bot, target_id), resolve_user(bot, modifier_id),
+            )
+        else:
+            modifier = await resolve_user(bot, modifier_id)
         return StaffManagerPanel(
             bot=bot, target=target, modifier=modifier, locale=locale,
             roles=roles, role_permissions=role_permissions,
@@ -284,11 +291,8 @@ class StaffPanelRolesSelect(ui.DynamicItem[ui.Select], template=_CID_TEMPLATE):
                  roles: Optional[List[StaffRole]] = None):
         roles = roles or []
         options = [
-            discord.SelectOption(
-                label=get_role_display_name(role.value), value=role.value,
-                emoji=discord.PartialEmoji.from_str(badges.role_badge(role.value)) if badges.role_badge(role.value) else None,
-                default=role in roles,
-            ) for role in ASSIGNABLE_ROLES
+            discord.SelectOption(label=label, value=role.value, emoji=emoji, default=role in roles)
+            for role, (label, emoji) in _ROLE_OPTION_SPECS.items()
         ]
         super().__init__(
             ui.Select(
@@ -305,18 +309,23 @@ class StaffPanelRolesSelect(ui.DynamicItem[ui.Select], template=_CID_TEMPLATE):
         return cls(int(match["target"]), int(match["modifier"]), locale=i18n.get_user_locale(interaction))
 
     @_guarded
+    @owner_only("modifier_id")
     async def callback(self, interaction: discord.Interaction):
-        if await _reject_if_not_modifier(interaction, self.modifier_id):
-            return
-
+        # Acknowledge first: the permission checks and writes below can take
+        # longer than Discord's 3s window on a slow DB.
+        await interaction.response.defer()
         locale = i18n.get_user_locale(interaction)
         bot = interaction.client
         values = self.item.values
-        new_roles = [StaffRole(v) for v in values]
+        new_roles = [ROLE_BY_VALUE[v] for v in values]
 
-        invalid = [r for r in new_roles if not await staff_permissions.can_assign_role(self.modifier_id, r)]
+        # One read warms the modifier's cached roles, then every role is
+        # checked concurrently against it.
+        await staff_permissions.get_user_roles(self.modifier_id)
+        allowed = await asyncio.gather(*(staff_permissions.can_assign_role(self.modifier_id, r) for r in new_roles))
+        invalid = [r for r, ok in zip(new_roles, allowed) if not ok]
         if invalid:
-            await interaction.response.send_message(
+            await interaction.followup.send(
                 t("staff.manage.staff.cannot_assign", locale=locale,
                   roles=", ".join(get_role_display_name(r.value) for r in invalid)),
                 ephemeral=True,
@@ -324,26 +333,22 @@ class StaffPanelRolesSelect(ui.DynamicItem[ui.Select], template=_CID_TEMPLATE):
             return
 
         db = bot.db
+        target = None
         if not new_roles:
-            await db.remove_staff_permissions(self.target_id)
-            await db.set_attribute("user", self.target_id, "TEAM", False, self.modifier_id,
-                                    "All roles removed via /manage staff")
+            await db.remove_staff_member(self.target_id, self.modifier_id,
+                                         "All roles removed via /manage staff")
             role_permissions, common = {}, []
         else:
-            _, _, _, saved_role_perms, saved_common = await _load_panel_state(bot, self.target_id)
+            target, _, _, saved_role_perms, saved_common = await _load_panel_state(bot, self.target_id)
             kept = {r.value for r in new_roles}
             role_permissions = {k: v for k, v in saved_role_perms.items() if k in kept}
             for role in new_roles:
                 role_permissions.setdefault(role.value, [])
-            role_values = [r.value for r in new_roles]
-            await db.set_staff_roles(self.target_id, role_values, self.modifier_id)
             all_perms = dict(role_permissions)
             all_perms["common"] = saved_common
-            async with db.pool.acquire() as conn:
-                await conn.execute(
-                    "UPDATE staff_permissions SET role_permissions = $1, updated_by = $2, updated_at = NOW() WHERE user_id = $3",
-                    json.dumps(all_perms), self.modifier_id, self.target_id,
-                )
+            await db.set_staff_roles_and_permissions(
+                self.target_id, [r.value for r in new_roles], all_perms, self.modifier_id,
+            )
             common = saved_common
 
         valid_scopes = ["common"] + [r.value for r in new_roles if ROLE_PERMISSIONS_MAP.get(r.value)]
@@ -353,8 +358,9 @@ class StaffPanelRolesSelect(ui.DynamicItem[ui.Select], template=_CID_TEMPLATE):
             interaction, self.target_id, self.modifier_id,
             roles=new_roles, role_permissions=role_permissions,
             common_permissions=common, scope=scope,
+            target=target, is_staff=bool(new_roles),
         )
-        await interaction.response.edit_message(view=view)
+        await interaction.edit_original_response(view=view)
 
 
 class StaffPanelScopeSelect(ui.DynamicItem[ui.Select], template=_CID_TEMPLATE):
@@ -378,22 +384,23 @@ class StaffPanelScopeSelect(ui.DynamicItem[ui.Select], template=_CID_TEMPLATE):
         return cls(int(match["target"]), int(match["modifier"]), locale=i18n.get_user_locale(interaction))
 
     @_guarded
+    @owner_only("modifier_id")
     async def callback(self, interaction: discord.Interaction):
-        if await _reject_if_not_modifier(interaction, self.modifier_id):
-            return
         values = self.item.values
         if not values:
             await interaction.response.defer()
             return
 
+        await interaction.response.defer()
         bot = interaction.client
-        _, _, roles, role_permissions, common = await _load_panel_state(bot, self.target_id)
+        target, is_staff, roles, role_permissions, common = await _load_panel_state(bot, self.target_id)
         view = await StaffManagerPanel._rebuild(
             interaction, self.target_id, self.modifier_id,
             roles=roles, role_permissions=role_permissions,
             common_permissions=common, scope=values[0],
+            target=target, is_staff=is_staff,
         )
-        await interaction.response.edit_message(view=view)
+        await interaction.edit_original_response(view=view)
 
 
 class StaffPanelPermsSelect(ui.DynamicItem[ui.Select], template=_CID_PERMS_TEMPLATE):
@@ -408,7 +415,7 @@ class StaffPanelPermsSelect(ui.DynamicItem[ui.Select], template=_CID_PERMS_TEMPL
     def __init__(self, target_id: int, modifier_id: int, scope: str = "common", *, locale: str = "en-US",
                  available: Optional[List[str]] = None, current: Optional[List[str]] = None):
         available = available or []
-        current = current or []
+        current = set(current or ())  # membership test per option below
         options = [
             discord.SelectOption(label=get_permission_label(p), value=p, default=p in current)
             for p in available
@@ -430,36 +437,31 @@ class StaffPanelPermsSelect(ui.DynamicItem[ui.Select], template=_CID_PERMS_TEMPL
         return cls(int(match["target"]), int(match["modifier"]), scope, locale=i18n.get_user_locale(interaction))
 
     @_guarded
+    @owner_only("modifier_id")
     async def callback(self, interaction: discord.Interaction):
-        if await _reject_if_not_modifier(interaction, self.modifier_id):
-            return
-
+        await interaction.response.defer()
         bot = interaction.client
         db = bot.db
-        _, _, roles, role_permissions, common = await _load_panel_state(bot, self.target_id)
         values = self.item.values
 
-        if self.scope == "common":
-            common = values
-        else:
-            role_permissions[self.scope] = values
-
         # Applies immediately — see StaffPanelRolesSelect's docstring for
-        # why this view cannot defer to a later Save click.
-        all_perms = dict(role_permissions)
-        all_perms["common"] = common
-        async with db.pool.acquire() as conn:
-            await conn.execute(
-                "UPDATE staff_permissions SET role_permissions = $1, updated_by = $2, updated_at = NOW() WHERE user_id = $3",
-                json.dumps(all_perms), self.modifier_id, self.target_id,
-            )
+        # why this view cannot defer to a later Save click. Only this scope's
+        # key is written, server-side, and the write returns the saved
+        # permissions so they are not read back a second time.
+        saved = await db.set_role_permissions(self.target_id, self.scope, values, self.modifier_id)
+        roles, role_permissions, common = _split_staff_perms(saved)
+        target, user_data = await asyncio.gather(
+            resolve_user(bot, self.target_id), db.get_user(self.target_id),
+        )
+        is_staff = bool(user_data["attributes"].get("TEAM"))
 
         view = await StaffManagerPanel._rebuild(
             interaction, self.target_id, self.modifier_id,
             roles=roles, role_permissions=role_permissions,
             common_permissions=common, scope=self.scope,
+            target=target, is_staff=is_staff,
         )
-        await interaction.response.edit_message(view=view)
+        await interaction.edit_original_response(view=view)
 
 
 class StaffPanelActionButton(ui.DynamicItem[ui.Button], template=_CID_TEMPLATE):
@@ -488,20 +490,18 @@ class StaffPanelActionButton(ui.DynamicItem[ui.Button], template=_CID_TEMPLATE):
                    locale=i18n.get_user_locale(interaction))
 
     @_guarded
+    @owner_only("modifier_id")
     async def callback(self, interaction: discord.Interaction):
-        if await _reject_if_not_modifier(interaction, self.modifier_id):
-            return
-
+        await interaction.response.defer()
         bot = interaction.client
         locale = i18n.get_user_locale(interaction)
         db = bot.db
-        target = await bot.fetch_user(self.target_id)
+        target = await resolve_user(bot, self.target_id)
 
         if self.action == "remove":
-            await db.remove_staff_permissions(self.target_id)
-            await db.set_attribute("user", self.target_id, "TEAM", False, self.modifier_id,
-                                    "Removed via /manage staff")
-            await interaction.response.edit_message(view=design.success(
+            await db.remove_staff_member(self.target_id, self.modifier_id,
+                                         "Removed via /manage staff")
+            await interaction.edit_original_response(view=design.success(
                 t("staff.manage.staff.removed_title", locale=locale),
                 t("staff.manage.staff.removed", locale=locale, user=target.mention),
             ))
@@ -529,9 +529,9 @@ class StaffPanelActionButton(ui.DynamicItem[ui.Button], template=_CID_TEMPLATE):
                 t("staff.manage.staff.saved_title", locale=locale),
                 t("staff.manage.staff.saved", locale=locale, user=target.mention),
                 fields=[{"name": t("staff.manage.staff.roles", locale=locale),
-                         "value": " ".join(f"{badges.role_badge(r.value)} {get_role_display_name(r.value)}" for r in roles)}],
+                         "value": " ".join(badges.role_label(r.value) for r in roles)}],
             )
-        await interaction.response.edit_message(view=view)
+        await interaction.edit_original_response(view=view)
 
 
 @staff_command
@@ -551,7 +551,7 @@ class StaffPanelCommand(StaffCommand):
         bot = ctx.bot
         locale = ctx.locale
         target = ctx.opt("user")
-        uid = target.id if target else parse_user_id(ctx.opt("user_id") or "")
+        uid = ctx.target_user_id()
         if not uid:
             await ctx.send(view=design.invalid_usage(locale, "m.staff <@user|user_id>"))
             return
@@ -562,8 +562,16 @@ class StaffPanelCommand(StaffCommand):
             ))
             return
 
+        # Developers are always protected by the hierarchy: decided in memory,
+        # before any lookup
+        is_dev = bot.is_developer(uid)
+        if is_dev and not await staff_permissions.can_modify_user(ctx.author.id, uid):
+            await ctx.send(view=design.permission_denied(locale, t("staff.manage.hierarchy", locale=locale)))
+            return
+
+        await ctx.defer()
         try:
-            user = await bot.fetch_user(uid)
+            user = await resolve_user(bot, uid)
         except discord.NotFound:
             await ctx.send(view=design.error(
                 t("staff.team.user_notfound_title", locale=locale),
@@ -571,19 +579,17 @@ class StaffPanelCommand(StaffCommand):
             ))
             return
 
-        user_data = await bot.db.get_user(uid)
-        is_staff = bool(user_data["attributes"].get("TEAM"))
+        # One query for TEAM + permissions; the hierarchy check below reuses it
+        member = await staff_permissions.get_staff_member(uid)
+        is_staff = member["is_team"]
 
-        if (is_staff or bot.is_developer(uid)) and not await staff_permissions.can_modify_user(ctx.author.id, uid):
+        if is_staff and not is_dev and not await staff_permissions.can_modify_user(ctx.author.id, uid):
             await ctx.send(view=design.permission_denied(locale, t("staff.manage.hierarchy", locale=locale)))
             return
 
-        perms = await bot.db.get_staff_permissions(uid)
-        roles = [StaffRole(r) for r in perms["roles"] if r != StaffRole.DEV.value]
-        role_perms = {k: list(v) for k, v in (perms.get("role_permissions", {}) or {}).items() if k != "common"}
-        common = list((perms.get("role_permissions", {}) or {}).get("common", []))
+        roles, role_perms, common = _split_staff_perms(member["permissions"])
 
-        author = ctx.author if isinstance(ctx.author, discord.abc.User) else await bot.fetch_user(ctx.author.id)
+        author = ctx.author if isinstance(ctx.author, discord.abc.User) else await resolve_user(bot, ctx.author.id)
         panel = StaffManagerPanel(
             bot=bot, target=user, modifier=author, locale=locale,
             roles=roles, role_permissions=role_perms, common_permissions=common, is_staff=is_staff,
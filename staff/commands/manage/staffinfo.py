@@ -1,13 +1,14 @@
 """`/manage staffinfo` — information about a staff member (defaults to self)."""
 
+import asyncio
+
 import discord
 
-from staff.framework import StaffCommand, SlashOption, staff_command, design, CommandType, parse_user_id
+from staff.framework import StaffCommand, SlashOption, staff_command, design, CommandType, resolve_user
 from staff.framework import badges
 from utils import emojis
 from utils.i18n import t
-from utils.staff_permissions import StaffRole
-from utils.staff_role_permissions import get_role_display_name
+from utils.staff_permissions import StaffRole, ROLE_BY_VALUE
 
 
 @staff_command
@@ -26,13 +27,18 @@ class StaffInfoCommand(StaffCommand):
         bot = ctx.bot
         locale = ctx.locale
 
-        target = ctx.opt("user")
-        uid = target.id if target else parse_user_id(ctx.opt("user_id") or "")
+        uid = ctx.target_user_id()
         if not uid:
             uid = ctx.author.id
 
+        await ctx.defer()
+        # The staff row is keyed by the ID alone, so it is read while Discord
+        # resolves the user; an unknown user still ends the command below.
         try:
-            user = await bot.fetch_user(uid)
+            user, perms = await asyncio.gather(
+                resolve_user(bot, uid),
+                bot.db.get_staff_permissions(uid),
+            )
         except discord.NotFound:
             await ctx.send(view=design.error(
                 t("staff.team.user_notfound_title", locale=locale),
@@ -40,7 +46,6 @@ class StaffInfoCommand(StaffCommand):
             ))
             return
 
-        perms = await bot.db.get_staff_permissions(uid)
         is_dev = bot.is_developer(uid)
         if not perms["roles"] and not is_dev:
             await ctx.send(view=design.error(
@@ -50,14 +55,14 @@ class StaffInfoCommand(StaffCommand):
             return
 
         role_lines = []
-        roles = [StaffRole(r) for r in perms["roles"]] if perms["roles"] else []
+        roles = [ROLE_BY_VALUE[r] for r in perms["roles"]]
         if is_dev:
-            if StaffRole.DEV not in roles:
-                role_lines.append(f"{badges.role_badge('Dev')} {get_role_display_name('Dev')} *(auto)*")
-            if StaffRole.MANAGER not in roles:
-                role_lines.append(f"{badges.role_badge('Manager')} {get_role_display_name('Manager')} *(auto)*")
-        for role in roles:
-            role_lines.append(f"{badges.role_badge(role.value)} {get_role_display_name(role.value)}")
+            held = frozenset(roles)
+            if StaffRole.DEV not in held:
+                role_lines.append(f"{badges.role_label('Dev')} *(auto)*")
+            if StaffRole.MANAGER not in held:
+                role_lines.append(f"{badges.role_label('Manager')} *(auto)*")
+        role_lines.extend(badges.role_label(role.value) for role in roles)
 
         fields = [{
             "name": f"{emojis.MODDYTEAM_BADGE} {t('staff.manage.info.roles', locale=locale)}",
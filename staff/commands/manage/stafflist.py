@@ -4,10 +4,14 @@ from staff.framework import StaffCommand, staff_command, design, CommandType
 from staff.framework import badges
 from utils import emojis
 from utils.i18n import t
-from utils.staff_role_permissions import get_role_display_name
+from utils.staff_permissions import StaffRole
 
-ROLE_ORDER = ["Manager", "Supervisor_Mod", "Supervisor_Com", "Supervisor_Sup",
-              "Moderator", "Communication", "Support"]
+ROLE_ORDER = tuple(role.value for role in (
+    StaffRole.MANAGER, StaffRole.SUPERVISOR_MOD, StaffRole.SUPERVISOR_COM, StaffRole.SUPERVISOR_SUP,
+    StaffRole.MODERATOR, StaffRole.COMMUNICATION, StaffRole.SUPPORT,
+))
+# Badge + display name per role, in display order: static, built once.
+_ROLE_HEADERS = tuple((role, badges.role_label(role)) for role in ROLE_ORDER)
 
 
 @staff_command
@@ -19,6 +23,7 @@ class StaffListCommand(StaffCommand):
 
     async def execute(self, ctx):
         locale = ctx.locale
+        await ctx.defer()
         members = await ctx.bot.db.get_all_staff_members()
         if not members:
             await ctx.send(view=design.info(
@@ -32,14 +37,11 @@ class StaffListCommand(StaffCommand):
             for role in member["roles"]:
                 by_role.setdefault(role, []).append(member["user_id"])
 
-        fields = []
-        for role in ROLE_ORDER:
-            if role in by_role:
-                ids = by_role[role]
-                fields.append({
-                    "name": f"{badges.role_badge(role)} {get_role_display_name(role)} ({len(ids)})",
-                    "value": ", ".join(f"<@{uid}>" for uid in ids),
-                })
+        fields = [
+            {"name": f"{header} ({len(ids)})", "value": ", ".join(f"<@{uid}>" for uid in ids)}
+            for role, header in _ROLE_HEADERS
+            if (ids := by_role.get(role))
+        ]
 
         await ctx.send(view=design.panel(
             "info",
@@ -4,7 +4,7 @@ Recategorized out of the dev prefix: this is a billing/Stripe operation gated by
 the ``stripe_manage`` permission node.
 """
 
-from staff.framework import StaffCommand, SlashOption, staff_command, design, CommandType, parse_user_id
+from staff.framework import StaffCommand, SlashOption, staff_command, design, CommandType
 from utils.i18n import t
 
 
@@ -24,8 +24,7 @@ class SubRefreshCommand(StaffCommand):
 
     async def execute(self, ctx):
         locale = ctx.locale
-        target = ctx.opt("user")
-        uid = target.id if target else parse_user_id(ctx.opt("user_id") or "")
+        uid = ctx.target_user_id()
         if not uid:
             await ctx.send(view=design.invalid_usage(locale, "m.subrefresh <@user|user_id>"))
             return
@@ -4,7 +4,7 @@ import logging
 
 import discord
 
-from staff.framework import StaffCommand, SlashOption, staff_command, design, CommandType, parse_user_id, ConfirmView
+from staff.framework import StaffCommand, SlashOption, staff_command, design, CommandType, resolve_user, ConfirmView
 from utils import emojis
 from utils.i18n import t
 from utils.staff_permissions import staff_permissions
@@ -28,14 +28,20 @@ class UnrankCommand(StaffCommand):
         bot = ctx.bot
         locale = ctx.locale
 
-        target = ctx.opt("user")
-        uid = target.id if target else parse_user_id(ctx.opt("user_id") or "")
+        uid = ctx.target_user_id()
         if not uid:
             await ctx.send(view=design.invalid_usage(locale, "m.unrank <@user|user_id>"))
             return
 
+        # Developers are always protected by the hierarchy: decided in memory,
+        # before any lookup
+        if bot.is_developer(uid) and not await staff_permissions.can_modify_user(ctx.author.id, uid):
+            await ctx.send(view=design.permission_denied(locale, t("staff.manage.hierarchy", locale=locale)))
+            return
+
+        await ctx.defer()
         try:
-            user = await bot.fetch_user(uid)
+            user = await resolve_user(bot, uid)
         except discord.NotFound:
             await ctx.send(view=design.error(
                 t("staff.team.user_notfound_title", locale=locale),
@@ -43,8 +49,9 @@ class UnrankCommand(StaffCommand):
             ))
             return
 
-        user_data = await bot.db.get_user(uid)
-        if not user_data["attributes"].get("TEAM"):
+        # One query for TEAM + roles; the hierarchy check below reuses it
+        member = await staff_permissions.get_staff_member(uid)
+        if not member["is_team"]:
             await ctx.send(view=design.error(
                 t("staff.manage.not_staff_title", locale=locale),
                 t("staff.manage.not_staff", locale=locale, user=user.mention),
@@ -56,8 +63,7 @@ class UnrankCommand(StaffCommand):
             return
 
         async def _do_unrank(interaction):
-            await bot.db.remove_staff_permissions(uid)
-            await bot.db.set_attribute("user", uid, "TEAM", False, ctx.author.id, "Removed from staff via unrank")
+            await bot.db.remove_staff_member(uid, ctx.author.id, "Removed from staff via unrank")
             logger.info("Staff %s removed %s from staff", ctx.author.id, uid)
             return design.success(
                 t("staff.manage.unrank.done_title", locale=locale),
@@ -8,7 +8,7 @@ from typing import Optional, Tuple
 import discord
 from discord import ui
 
-from staff.framework import design, parse_user_id, parse_guild_id
+from staff.framework import design, parse_user_id, resolve_user, parse_guild_id
 from utils import emojis
 from utils.i18n import t
 from utils.moderation_cases import (
@@ -50,7 +50,7 @@ async def resolve_subject(ctx) -> Tuple[Optional[SubjectType], Optional[int], Op
         return SubjectType.DISCORD_GUILD, guild_id, (guild.name if guild else f"Guild {guild_id}"), None
     if user_id:
         try:
-            user = await bot.fetch_user(user_id)
+            user = await resolve_user(bot, user_id)
             name = f"{user} ({user.id})"
         except Exception:
             name = f"User {user_id}"
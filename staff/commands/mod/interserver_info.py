@@ -34,7 +34,7 @@ class InterserverInfoCommand(StaffCommand):
         ts = data.get("timestamp", data.get("created_at"))
         ts_str = f"<t:{int(ts.timestamp())}:F>" if ts else "—"
         content = data.get("content") or ""
-        content = (content[:500] + "…") if len(content) > 500 else (content or f"-# {t('staff.mod.interserver.no_content', locale=locale)}")
+        content = design.truncate(content, 500) if content else f"-# {t('staff.mod.interserver.no_content', locale=locale)}"
         relayed = len(data.get("relayed_messages", []))
 
         fields = [
@@ -26,6 +26,9 @@ ROLE_KEY = {
     "Communication": "member",
     "Support": "support",
 }
+# Role value -> full translation key of its label, built once.
+_ROLE_LABEL_KEYS = {role: f"staff.team.flex.roles.{key}" for role, key in ROLE_KEY.items()}
+_DEFAULT_LABEL_KEY = "staff.team.flex.roles.member"
 
 
 @staff_command
@@ -44,8 +47,7 @@ class FlexCommand(StaffCommand):
             ))
             return
 
-        role_key = ROLE_KEY.get(roles[0].value, "member")
-        role_display = t(f"staff.team.flex.roles.{role_key}", locale=locale)
+        role_display = t(_ROLE_LABEL_KEYS.get(roles[0].value, _DEFAULT_LABEL_KEY), locale=locale)
 
         view = BaseView()
         container = design.make_container(FLEX_ACCENT)
@@ -11,15 +11,20 @@ import re
 import discord
 from discord import ui
 
-from staff.framework import StaffCommand, staff_command, design, CommandType
+from automod.cache import LruTtlCache, MISS
+from staff.framework import StaffCommand, staff_command, design, CommandType, owner_only
 from staff.framework.registry import SLASH_GROUPS
 from utils import emojis
 from utils.i18n import i18n, t
-from utils.components_v2 import create_error_message
+from utils.staff_permissions import staff_permissions
 from cogs.error_handler import BaseView
 
 _CID_DEPT_TEMPLATE = r"moddy:staffhelp:dept:(?P<owner>\d{1,20})"
 
+# Last listing built per staff member, reused by department clicks for a
+# short while. Display only: every command re-checks permissions on run.
+_HELP_DATA_CACHE = LruTtlCache(max_entries=256, ttl_seconds=60)
+
 
 def _guarded(callback):
     """Route DynamicItem callback errors to the central error handler.
@@ -50,9 +55,20 @@ async def _build_help_data(bot, author_id: int) -> dict:
 
     data: dict = {}
     seen = set()
+    # Department access is resolved once per type: when the author can't use a
+    # type at all, every command in it is skipped without its own full check.
+    type_access: dict = {}
+    # The author's roles, resolved once and shared by every check below.
+    roles = await staff_permissions.get_user_roles(author_id) if staff_permissions and bot.db else None
 
     async def _allowed(cmd) -> bool:
-        ok, _ = await router._has_permission(cmd, author_id)
+        tv = cmd.command_type
+        if roles is not None:
+            if tv not in type_access:
+                type_access[tv] = await staff_permissions.can_use_command_type(author_id, tv, roles)
+            if not type_access[tv]:
+                return False
+        ok, _ = await router._has_permission(cmd, author_id, roles)
         return ok
 
     for (tv, name), cmd in router.message_index.items():
@@ -87,6 +103,8 @@ DEPT_BADGE = {
     "sup": emojis.SUPPORTAGENT_BADGE,
     "com": emojis.COMMUNICATION_BADGE,
 }
+# Parsed once: the department select is rebuilt on every open and every click.
+_DEPT_EMOJI = {tv: discord.PartialEmoji.from_str(badge) for tv, badge in DEPT_BADGE.items()}
 
 
 class HelpDeptSelect(ui.DynamicItem[ui.Select], template=_CID_DEPT_TEMPLATE):
@@ -100,7 +118,7 @@ class HelpDeptSelect(ui.DynamicItem[ui.Select], template=_CID_DEPT_TEMPLATE):
             discord.SelectOption(
                 label=t(f"staff.team.help.groups.{ct.value}", locale=locale),
                 value=ct.value,
-                emoji=discord.PartialEmoji.from_str(DEPT_BADGE.get(ct.value)) if DEPT_BADGE.get(ct.value) else None,
+                emoji=_DEPT_EMOJI.get(ct.value),
                 description=t("staff.team.help.count", locale=locale, count=len(data.get(ct.value, []))),
                 default=ct.value == selected,
             )
@@ -122,25 +140,27 @@ class HelpDeptSelect(ui.DynamicItem[ui.Select], template=_CID_DEPT_TEMPLATE):
         return cls(int(match["owner"]), locale=i18n.get_user_locale(interaction))
 
     @_guarded
+    @owner_only("owner_id")
     async def callback(self, interaction: discord.Interaction):
-        if interaction.user.id != self.owner_id:
-            locale = i18n.get_user_locale(interaction)
-            await interaction.response.send_message(
-                view=create_error_message(
-                    t("errors.not_your_message.title", locale=locale),
-                    t("errors.not_your_message.description", locale=locale),
-                ),
-                ephemeral=True,
-            )
-            return
-
         bot = interaction.client
         locale = i18n.get_user_locale(interaction)
         values = self.item.values
         selected = values[0] if values else None
+        # Switching department re-uses the listing checked moments ago instead
+        # of re-running every per-command permission check.
+        data = _HELP_DATA_CACHE.get(interaction.user.id)
+        if data is not MISS:
+            view = HelpView(bot=bot, author_id=interaction.user.id, locale=locale, data=data, selected=selected)
+            await interaction.response.edit_message(view=view)
+            return
+
+        # Rebuilding runs one permission check per command: acknowledge first
+        # so a slow database cannot outlast the interaction deadline.
+        await interaction.response.defer()
         data = await _build_help_data(bot, interaction.user.id)
+        _HELP_DATA_CACHE.set(interaction.user.id, data)
         view = HelpView(bot=bot, author_id=interaction.user.id, locale=locale, data=data, selected=selected)
-        await interaction.response.edit_message(view=view)
+        await interaction.edit_original_response(view=view)
 
 
 class HelpView(BaseView):
@@ -217,7 +237,9 @@ class HelpCommand(StaffCommand):
             ))
             return
 
+        await ctx.defer()
         data = await _build_help_data(ctx.bot, ctx.author.id)
+        _HELP_DATA_CACHE.set(ctx.author.id, data)
 
         if not data:
             await ctx.send(view=design.info(
@@ -2,29 +2,31 @@
 
 import discord
 
-from staff.framework import StaffCommand, SlashOption, staff_command, design, CommandType, parse_user_id
+from staff.framework import StaffCommand, SlashOption, staff_command, design, CommandType, resolve_user
 from staff.framework import badges
 from utils import emojis
 from utils.i18n import t
 
 
+_ADMINISTRATOR = discord.Permissions(administrator=True).value
+# (permission bit, label), in display order.
+_KEY_PERMS = tuple((discord.Permissions(**{flag: True}).value, label) for flag, label in (
+    ("manage_guild", "Manage Server"),
+    ("manage_channels", "Manage Channels"),
+    ("manage_roles", "Manage Roles"),
+    ("ban_members", "Ban"),
+    ("kick_members", "Kick"),
+    ("moderate_members", "Timeout"),
+))
+
+
 def _key_perms(member: discord.Member, locale: str) -> str:
-    perms = member.guild_permissions
-    if perms.administrator:
+    # guild_permissions is recomputed from the roles on each access: read its
+    # bitfield once and test the bits directly.
+    value = member.guild_permissions.value
+    if value & _ADMINISTRATOR:
         return "Administrator"
-    labels = []
-    if perms.manage_guild:
-        labels.append("Manage Server")
-    if perms.manage_channels:
-        labels.append("Manage Channels")
-    if perms.manage_roles:
-        labels.append("Manage Roles")
-    if perms.ban_members:
-        labels.append("Ban")
-    if perms.kick_members:
-        labels.append("Kick")
-    if perms.moderate_members:
-        labels.append("Timeout")
+    labels = [label for bit, label in _KEY_PERMS if value & bit]
     return ", ".join(labels) if labels else t("staff.team.mutual.no_perms", locale=locale)
 
 
@@ -45,14 +47,14 @@ class MutualServerCommand(StaffCommand):
         bot = ctx.bot
         locale = ctx.locale
 
-        target = ctx.opt("user")
-        user_id = target.id if target else parse_user_id(ctx.opt("user_id") or "")
+        user_id = ctx.target_user_id()
         if not user_id:
             await ctx.send(view=design.invalid_usage(locale, "t.mutualserver <user_id>"))
             return
 
+        await ctx.defer()
         try:
-            user = await bot.fetch_user(user_id)
+            user = await resolve_user(bot, user_id)
         except discord.NotFound:
             await ctx.send(view=design.error(
                 t("staff.team.user_notfound_title", locale=locale),
@@ -61,7 +63,9 @@ class MutualServerCommand(StaffCommand):
             return
 
         rendered, _, _ = await badges.render_user(bot, user)
-        mutual = [g for g in bot.guilds if g.get_member(user_id)]
+        # One pass over the guild cache, keeping each member found: the
+        # fields below reuse it instead of looking the member up again.
+        mutual = [(g, m) for g in bot.guilds if (m := g.get_member(user_id))]
 
         if not mutual:
             await ctx.send(view=design.info(
@@ -71,10 +75,7 @@ class MutualServerCommand(StaffCommand):
             return
 
         fields = []
-        for guild in mutual[:10]:
-            member = guild.get_member(user_id)
-            if not member:
-                continue
+        for guild, member in mutual[:10]:
             top_role = member.top_role.name if member.top_role.name != "@everyone" else "—"
             fields.append({
                 "name": f"{emojis.WEB} {guild.name}",
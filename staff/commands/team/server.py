@@ -4,6 +4,8 @@ Merges the former ``t.serverinfo`` and ``t.server`` into one command: Discord
 information plus Moddy database attributes.
 """
 
+from itertools import islice
+
 from staff.framework import StaffCommand, SlashOption, staff_command, design, CommandType, parse_guild_id
 from utils import emojis
 from utils.i18n import t
@@ -71,16 +73,16 @@ class ServerCommand(StaffCommand):
                 guild_data = await bot.db.get_guild(gid)
                 attributes = guild_data.get("attributes", {}) or {}
                 if attributes:
-                    attr_lines = [f"`{k}`" + (f": `{v}`" if v is not True else "") for k, v in attributes.items()]
                     fields.append({
                         "name": f"{emojis.SETTINGS} {t('staff.team.attributes', locale=locale)}",
-                        "value": " • ".join(attr_lines),
+                        "value": " • ".join(f"`{k}`" + (f": `{v}`" if v is not True else "")
+                                            for k, v in attributes.items()),
                     })
             except Exception:
                 pass
 
         if guild.features:
-            features = ", ".join(f.replace("_", " ").title() for f in guild.features[:10])
+            features = ", ".join(f.replace("_", " ").title() for f in islice(guild.features, 10))
             fields.append({"name": f"{emojis.WEB} {t('staff.team.server.features', locale=locale)}", "value": features})
 
         await ctx.send(view=design.panel(
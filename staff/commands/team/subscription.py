@@ -10,7 +10,7 @@ from datetime import timezone
 
 import discord
 
-from staff.framework import StaffCommand, SlashOption, staff_command, design, CommandType, parse_user_id
+from staff.framework import StaffCommand, SlashOption, staff_command, design, CommandType, resolve_user
 from staff.framework import badges
 from utils import emojis
 from utils.i18n import t
@@ -34,14 +34,13 @@ class SubscriptionCommand(StaffCommand):
         bot = ctx.bot
         locale = ctx.locale
 
-        target = ctx.opt("user")
-        user_id = target.id if target else parse_user_id(ctx.opt("user_id") or "")
+        user_id = ctx.target_user_id()
         if not user_id:
             await ctx.send(view=design.invalid_usage(locale, "t.subscription <user_id>"))
             return
 
         try:
-            user = await bot.fetch_user(user_id)
+            user = await resolve_user(bot, user_id)
         except discord.NotFound:
             await ctx.send(view=design.error(
                 t("staff.team.user_notfound_title", locale=locale),
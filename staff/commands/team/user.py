@@ -2,7 +2,7 @@
 
 import discord
 
-from staff.framework import StaffCommand, SlashOption, staff_command, design, CommandType, parse_user_id
+from staff.framework import StaffCommand, SlashOption, staff_command, design, CommandType, resolve_user
 from staff.framework import badges
 from utils import emojis
 from utils.i18n import t
@@ -24,14 +24,14 @@ class UserCommand(StaffCommand):
         bot = ctx.bot
         locale = ctx.locale
 
-        target = ctx.opt("user")
-        user_id = target.id if target else parse_user_id(ctx.opt("user_id") or "")
+        user_id = ctx.target_user_id()
         if not user_id:
             await ctx.send(view=design.invalid_usage(locale, "t.user <user_id>"))
             return
 
+        await ctx.defer()
         try:
-            user = await bot.fetch_user(user_id)
+            user = await resolve_user(bot, user_id)
         except discord.NotFound:
             await ctx.send(view=design.error(
                 t("staff.team.user_notfound_title", locale=locale),
@@ -39,7 +39,14 @@ class UserCommand(StaffCommand):
             ))
             return
 
-        attributes, verification = await badges.fetch_verification(bot, user_id)
+        # One read serves both the badge and the first-seen field below.
+        db_data = None
+        if bot.db:
+            try:
+                db_data = await bot.db.get_user(user_id)
+            except Exception:
+                pass
+        attributes, verification = badges.split_verification(db_data)
         rendered, orgs, tier = badges.render_name(user, attributes, verification)
 
         fields = [{
@@ -53,9 +60,9 @@ class UserCommand(StaffCommand):
         }]
 
         if attributes:
-            attr_lines = [f"`{k}`" + (f": `{v}`" if v is not True else "") for k, v in attributes.items()]
             fields.append({"name": f"{emojis.SETTINGS} {t('staff.team.attributes', locale=locale)}",
-                           "value": " • ".join(attr_lines)})
+                           "value": " • ".join(f"`{k}`" + (f": `{v}`" if v is not True else "")
+                                               for k, v in attributes.items())})
         else:
             fields.append({"name": f"{emojis.SETTINGS} {t('staff.team.attributes', locale=locale)}",
                            "value": f"-# {t('staff.team.none', locale=locale)}"})
@@ -64,14 +71,9 @@ class UserCommand(StaffCommand):
         fields.append({"name": f"{emojis.WEB} {t('staff.team.user.shared', locale=locale)}",
                        "value": f"`{shared}`"})
 
-        if bot.db:
-            try:
-                db_data = await bot.db.get_user(user_id)
-                if db_data and db_data.get("created_at"):
-                    fields.append({"name": f"{emojis.TIME} {t('staff.team.user.first_seen', locale=locale)}",
-                                   "value": f"<t:{int(db_data['created_at'].timestamp())}:R>"})
-            except Exception:
-                pass
+        if db_data and db_data.get("created_at"):
+            fields.append({"name": f"{emojis.TIME} {t('staff.team.user.first_seen', locale=locale)}",
+                           "value": f"<t:{int(db_data['created_at'].timestamp())}:R>"})
 
         description = rendered
         if tier == "org_member" and orgs:
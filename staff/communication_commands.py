@@ -12,7 +12,7 @@ from datetime import datetime, timezone
 from utils.staff_permissions import staff_permissions, CommandType
 from database import db
 from config import COLORS
-from utils.components_v2 import create_error_message, create_info_message
+from utils.components_v2 import create_info_message
 from utils.emojis import EMOJIS
 from utils.staff_logger import staff_logger
 from staff.base import StaffCommandsCog
@@ -25,6 +25,10 @@ class CommunicationCommands(StaffCommandsCog):
 
     def __init__(self, bot):
         super().__init__(bot)
+        # command name -> handler, built once instead of an if/elif chain
+        self._handlers = {
+            "help": self.handle_help_command,
+        }
 
     @commands.Cog.listener()
     async def on_message(self, message: discord.Message):
@@ -48,25 +52,29 @@ class CommunicationCommands(StaffCommandsCog):
         if command_type != CommandType.COMMUNICATION:
             return
 
+        # Drop gateway replays of a command already handled
+        if not self.first_delivery(message):
+            return
+
         # Check permissions
         allowed, reason = await staff_permissions.check_command_permission(
             message.author.id, command_type, command_name
         )
 
         if not allowed:
-            view = create_error_message("Permission Denied", reason)
-            await self.reply_with_tracking(message, view)
+            await self.reply_error(message, "Permission Denied", reason)
             return
 
         # Route to appropriate command
-        if command_name == "help":
-            await self.handle_help_command(message, args)
+        handler = self._handlers.get(command_name)
+        if handler:
+            await handler(message, args)
         else:
-            view = create_error_message(
+            await self.reply_error(
+                message,
                 "Unknown Command",
                 f"Communication command `{command_name}` not found.\n\nCommunication commands are in development."
             )
-            await self.reply_with_tracking(message, view)
 
     async def handle_help_command(self, message: discord.Message, args: str):
         """
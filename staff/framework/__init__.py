@@ -10,7 +10,7 @@ Public API used by command modules:
 
     from staff.framework import (
         StaffCommand, SlashOption, staff_command, StaffContext, design,
-        parse_user_id, parse_guild_id, CommandType,
+        parse_user_id, parse_guild_id, resolve_user, CommandType,
     )
 """
 
@@ -18,7 +18,7 @@ from utils.staff_permissions import CommandType  # re-export for command modules
 
 from staff.framework.command import StaffCommand, SlashOption, staff_command, get_registered_commands
 from staff.framework.context import StaffContext
-from staff.framework.parsing import parse_user_id, parse_guild_id
+from staff.framework.parsing import parse_user_id, parse_guild_id, resolve_user
 from staff.framework import design
 
 __all__ = [
@@ -30,8 +30,10 @@ __all__ = [
     "design",
     "parse_user_id",
     "parse_guild_id",
+    "resolve_user",
     "CommandType",
     "ConfirmView",
+    "owner_only",
 ]
 
 
@@ -39,4 +41,7 @@ def __getattr__(name):  # lazy to avoid an import cycle (views imports design)
     if name == "ConfirmView":
         from staff.framework.views import ConfirmView
         return ConfirmView
+    if name == "owner_only":
+        from staff.framework.views import owner_only
+        return owner_only
     raise AttributeError(name)
@@ -19,6 +19,7 @@ from utils.emojis import (
     DEV_BADGE, MANAGER_BADGE, MOD_SUPERVISOR_BADGE, COMMUNICATION_SUPERVISOR_BADGE,
     SUPPORT_SUPERVISOR_BADGE, MODERATOR_BADGE, COMMUNICATION_BADGE, SUPPORTAGENT_BADGE,
 )
+from utils.staff_role_permissions import get_role_display_name
 
 # Staff role value -> badge emoji.
 STAFF_ROLE_BADGES = {
@@ -32,24 +33,36 @@ STAFF_ROLE_BADGES = {
     "Support": SUPPORTAGENT_BADGE,
 }
 
+# Staff role value -> "{badge} {display name}", as shown in role lists.
+STAFF_ROLE_LABELS = {role: f"{badge} {get_role_display_name(role)}" for role, badge in STAFF_ROLE_BADGES.items()}
+
 
 def role_badge(role_value: str) -> str:
     """Return the badge emoji for a staff role value (empty string if unknown)."""
     return STAFF_ROLE_BADGES.get(role_value, "")
 
 
+def role_label(role_value: str) -> str:
+    """Return ``{badge} {display name}`` for a staff role value."""
+    return STAFF_ROLE_LABELS.get(role_value) or f"{role_badge(role_value)} {get_role_display_name(role_value)}"
+
+
+def split_verification(data: Optional[dict]) -> Tuple[dict, dict]:
+    """Return ``(moddy_attributes, verification_data)`` from a ``db.get_user`` record."""
+    if not data:
+        return {}, {}
+    return data.get("attributes", {}) or {}, (data.get("data") or {}).get("verification") or {}
+
+
 async def fetch_verification(bot, user_id: int) -> Tuple[dict, dict]:
     """Return ``(moddy_attributes, verification_data)`` from the DB."""
-    moddy_attributes, verification = {}, {}
+    data = None
     if bot.db:
         try:
             data = await bot.db.get_user(user_id)
-            if data:
-                moddy_attributes = data.get("attributes", {}) or {}
-                verification = (data.get("data") or {}).get("verification") or {}
         except Exception:
             pass
-    return moddy_attributes, verification
+    return split_verification(data)
 
 
 def _user_api_dict(user: discord.abc.User) -> dict:
@@ -14,6 +14,8 @@ Responsibilities:
 from __future__ import annotations
 
 import logging
+import time
+from collections import Counter
 
 import discord
 from discord.ext import commands
@@ -21,7 +23,7 @@ from discord.ext import commands
 from staff.base import StaffCommandsCog
 from staff.framework import design, registry
 from staff.framework.context import StaffContext
-from utils.staff_permissions import staff_permissions, CommandType
+from utils.staff_permissions import staff_permissions, CommandType, StaffRole
 from utils.staff_logger import staff_logger
 from utils.i18n import t
 
@@ -39,6 +41,20 @@ class StaffCommandsRouter(StaffCommandsCog):
         # Types fully owned by the new framework. Message commands of these
         # types are handled here; legacy cogs keep handling the rest.
         self.owned_types = set()
+        # Outcome counters (invoked / denied / failed) plus total execution
+        # time, exposed on the internal API's /status. Plain increments only.
+        self.stats = Counter()
+        self.exec_seconds = 0.0
+
+    def metrics(self) -> dict:
+        """Snapshot of the dispatch counters for monitoring."""
+        invoked = self.stats["invoked"]
+        return {
+            "invoked": invoked,
+            "denied": self.stats["denied"],
+            "failed": self.stats["failed"],
+            "avg_ms": round(self.exec_seconds * 1000 / invoked, 2) if invoked else 0,
+        }
 
     async def setup(self):
         """Discover commands and register the slash groups on the bot."""
@@ -67,29 +83,31 @@ class StaffCommandsRouter(StaffCommandsCog):
 
     # --- permission helpers ------------------------------------------------
 
-    async def _has_permission(self, command, user_id: int) -> tuple[bool, str]:
+    async def _has_permission(self, command, user_id: int, roles=None) -> tuple[bool, str]:
+        """``roles``: the user's roles when the caller checks many commands
+        for the same user (resolved once instead of per check)."""
         allowed, reason = await staff_permissions.check_command_permission(
-            user_id, command.command_type, command.name
+            user_id, command.command_type, command.name, roles=roles
         )
         if not allowed:
             return False, reason
         # Optional fine-grained permission node.
         node = getattr(command, "permission", None)
-        if node and not await self._has_node(user_id, node):
+        if node and not await self._has_node(user_id, node, roles):
             return False, t("staff.common.permission_denied.description", locale="en-US")
         return True, ""
 
-    async def _has_node(self, user_id: int, node: str) -> bool:
+    async def _has_node(self, user_id: int, node: str, roles=None) -> bool:
         # Super-admin, devs and Managers are not gated by granular nodes.
         if user_id == staff_permissions.SUPER_ADMIN_ID or self.bot.is_developer(user_id):
             return True
-        from utils.staff_permissions import StaffRole
-        roles = await staff_permissions.get_user_roles(user_id)
+        if roles is None:
+            roles = await staff_permissions.get_user_roles(user_id)
         if StaffRole.MANAGER in roles:
             return True
         if not self.bot.db:
             return False
-        perms = await self.bot.db.get_staff_permissions(user_id)
+        perms = await staff_permissions.get_staff_record(user_id)
         role_perms = perms.get("role_permissions", {}) or {}
         for granted in role_perms.values():
             if node in granted:
@@ -110,6 +128,8 @@ class StaffCommandsRouter(StaffCommandsCog):
         # Only handle types owned by the new framework; legacy cogs handle others.
         if command_type.value not in self.owned_types:
             return
+        if not self.first_delivery(message):
+            return
 
         # Flat command, or a sub-group command (`mod.case create ...`).
         command = self.message_index.get((command_type.value, command_name))
@@ -139,6 +159,7 @@ class StaffCommandsRouter(StaffCommandsCog):
 
         allowed, reason = await self._has_permission(command, message.author.id)
         if not allowed:
+            self.stats["denied"] += 1
             await self.reply_with_tracking(message, design.permission_denied("en-US", reason))
             return
 
@@ -155,6 +176,7 @@ class StaffCommandsRouter(StaffCommandsCog):
         allowed, reason = await self._has_permission(command, interaction.user.id)
         ctx = StaffContext.from_interaction(self.bot, command, interaction, options, incognito, cog=self)
         if not allowed:
+            self.stats["denied"] += 1
             await interaction.response.send_message(
                 view=design.permission_denied(ctx.locale, reason), ephemeral=True
             )
@@ -173,9 +195,12 @@ class StaffCommandsRouter(StaffCommandsCog):
             except Exception as exc:  # pragma: no cover - logging must never break commands
                 logger.debug("staff log failed for %s.%s: %s", command.command_type.value, command.name, exc)
 
+        self.stats["invoked"] += 1
+        started = time.perf_counter()
         try:
             await command.execute(ctx)
         except Exception as exc:
+            self.stats["failed"] += 1
             logger.error("Error in staff command %s.%s: %s",
                          command.command_type.value, command.name, exc, exc_info=True)
             # For a not-yet-answered slash, let the global handler produce the
@@ -189,6 +214,8 @@ class StaffCommandsRouter(StaffCommandsCog):
                 ))
             except Exception:
                 pass
+        finally:
+            self.exec_seconds += time.perf_counter() - started
 
 
 async def setup(bot):
@@ -16,6 +16,7 @@ from dataclasses import dataclass, field
 from typing import Any, List, Optional
 
 from utils.staff_permissions import CommandType
+from staff.framework.design import truncate
 
 
 # --- Slash option declaration ---------------------------------------------
@@ -113,9 +114,7 @@ class StaffCommand:
         else:
             raw = " ".join(f"{k}={v}" for k, v in ctx.options.items() if v is not None)
         raw = raw.strip()
-        if self.sensitive and raw:
-            return raw[:30] + ("…" if len(raw) > 30 else "")
-        return raw[:100] + ("…" if len(raw) > 100 else "")
+        return truncate(raw, 30 if self.sensitive else 100)
 
     @staticmethod
     def is_message_like(ctx) -> bool:
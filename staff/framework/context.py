@@ -23,6 +23,7 @@ from discord import ui
 from utils.i18n import t
 from utils import emojis
 from cogs.error_handler import BaseView
+from staff.framework.parsing import parse_user_id
 
 
 def resolve_message_locale(bot, user_id: int, guild: Optional[discord.Guild]) -> str:
@@ -38,6 +39,12 @@ def resolve_message_locale(bot, user_id: int, guild: Optional[discord.Guild]) ->
 class StaffContext:
     """Transport-agnostic execution context for a staff command."""
 
+    # One context per invocation: fixed attribute set, no per-instance dict.
+    __slots__ = (
+        "bot", "command", "author", "guild", "channel", "locale", "interaction",
+        "message", "options", "raw_args", "incognito", "cog",
+    )
+
     def __init__(
         self,
         *,
@@ -113,6 +120,14 @@ class StaffContext:
         value = self.options.get(name, default)
         return default if value is None else value
 
+    def target_user_id(self, option: str = "user", raw_option: str = "user_id") -> Optional[int]:
+        """Id of the targeted user: the slash user option, else the message
+        argument parsed as a mention or raw id (``None`` if neither)."""
+        target = self.opt(option)
+        if target:
+            return target.id
+        return parse_user_id(self.opt(raw_option) or "")
+
     # --- responding --------------------------------------------------------
 
     async def send(self, view: Optional[ui.LayoutView] = None,
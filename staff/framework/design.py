@@ -58,6 +58,11 @@ KIND_EMOJIS = {
     "developer": emojis.DEV,
 }
 
+# Resolved once at import: every panel and confirmation dialog goes through
+# ``colour()``, so the kind -> Colour lookup shouldn't allocate per call.
+_KIND_ACCENTS = {kind: discord.Colour(value) for kind, value in KIND_COLOURS.items()}
+_NEUTRAL_ACCENT = _KIND_ACCENTS["neutral"]
+
 
 def colour(kind) -> discord.Colour:
     """Return a :class:`discord.Colour` for a message kind, COLORS key or hex int."""
@@ -65,8 +70,11 @@ def colour(kind) -> discord.Colour:
         return kind
     if isinstance(kind, int):
         return discord.Colour(kind)
-    value = KIND_COLOURS.get(kind) or COLORS.get(kind) or COLORS["neutral"]
-    return discord.Colour(value)
+    accent = _KIND_ACCENTS.get(kind)
+    if accent is not None:
+        return accent
+    value = COLORS.get(kind)
+    return discord.Colour(value) if value else _NEUTRAL_ACCENT
 
 
 def make_container(accent: Optional[object] = "neutral") -> ui.Container:
@@ -77,8 +85,12 @@ def make_container(accent: Optional[object] = "neutral") -> ui.Container:
     """
     if accent is None:
         return ui.Container()
-    accent_colour = accent if isinstance(accent, discord.Colour) else colour(accent)
-    return ui.Container(accent_colour=accent_colour)
+    return ui.Container(accent_colour=colour(accent))
+
+
+def truncate(text: str, limit: int) -> str:
+    """Cut ``text`` to ``limit`` characters, marking the cut with ``…``."""
+    return text if len(text) <= limit else text[:limit] + "…"
 
 
 def title_line(emoji: str, title: str) -> str:
@@ -2,26 +2,29 @@
 
 from __future__ import annotations
 
+import re
 from typing import Optional
 
+# A whole argument that is a user mention (<@id> / <@!id>) or a raw id.
+_USER_ID_RE = re.compile(r"\s*(?:<@!?(\d+)>|(\d+))\s*")
+
 
 def parse_user_id(args: str) -> Optional[int]:
     """Parse a user id from a mention (``<@123>`` / ``<@!123>``) or raw id."""
     if not args:
         return None
-    args = args.strip()
-    if args.startswith("<@") and args.endswith(">"):
-        inner = args[2:-1]
-        if inner.startswith("!"):
-            inner = inner[1:]
-        try:
-            return int(inner)
-        except ValueError:
-            return None
-    try:
-        return int(args)
-    except ValueError:
+    match = _USER_ID_RE.fullmatch(args)
+    if not match:
         return None
+    return int(match[1] or match[2])
+
+
+async def resolve_user(bot, user_id: int):
+    """Return a user from the gateway cache, or fetch it over HTTP if not cached.
+
+    Raises ``discord.NotFound`` like ``bot.fetch_user`` for unknown ids.
+    """
+    return bot.get_user(user_id) or await bot.fetch_user(user_id)
 
 
 def parse_guild_id(args: str) -> Optional[int]:
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 from typing import Awaitable, Callable, Optional
 
 import discord
@@ -9,16 +10,44 @@ from discord import ui
 
 from staff.framework import design
 from utils import emojis
-from utils.i18n import t
+from utils.i18n import i18n, t
+from utils.components_v2 import create_error_message
 from cogs.error_handler import BaseView
 
 
+def owner_only(attr: str):
+    """Restrict a component callback to the user id stored in ``self.<attr>``.
+
+    Anyone else gets the ephemeral "not your message" notice and the callback
+    is not run. Used by persistent DynamicItems, whose owner is encoded in the
+    custom_id rather than checked by a live view's interaction_check.
+    """
+    def decorator(callback):
+        @functools.wraps(callback)
+        async def wrapper(self, interaction: discord.Interaction):
+            if interaction.user.id != getattr(self, attr):
+                locale = i18n.get_user_locale(interaction)
+                await interaction.response.send_message(
+                    view=create_error_message(
+                        t("errors.not_your_message.title", locale=locale),
+                        t("errors.not_your_message.description", locale=locale),
+                    ),
+                    ephemeral=True,
+                )
+                return
+            await callback(self, interaction)
+        return wrapper
+    return decorator
+
+
 class ConfirmView(BaseView):
     """A standardized confirm/cancel prompt for destructive staff actions.
 
     ``on_confirm`` is an async callable ``(interaction) -> BaseView`` that
     performs the action and returns the result panel to display. Author-checked
-    and short-lived.
+    and short-lived: the view stops itself as soon as it is resolved, so its
+    callbacks and timeout task are released instead of lingering in the view
+    store until the timeout fires.
     """
 
     def __init__(self, *, bot, author_id: int, locale: str, title: str, description: str,
@@ -59,6 +88,8 @@ class ConfirmView(BaseView):
     async def _confirm(self, interaction: discord.Interaction):
         if not await self._guard(interaction):
             return
+        # Stop before running the action so a double click can't run it twice.
+        self.stop()
         await interaction.response.defer()
         view = await self.on_confirm(interaction)
         await interaction.edit_original_response(view=view)
@@ -66,6 +97,7 @@ class ConfirmView(BaseView):
     async def _cancel(self, interaction: discord.Interaction):
         if not await self._guard(interaction):
             return
+        self.stop()
         await interaction.response.edit_message(view=design.info(
             t("staff.common.cancelled", locale=self.locale),
             t("staff.common.cancelled_desc", locale=self.locale),
@@ -14,7 +14,7 @@ import re
 from utils.staff_permissions import staff_permissions, CommandType
 from database import db
 from config import COLORS
-from utils.components_v2 import create_error_message, create_info_message, create_success_message
+from utils.components_v2 import create_info_message, create_success_message
 from utils.emojis import (
     EMOJIS, SUPPORT, PREMIUM, BALANCE, RED_STATUS, WARNING,
     DOWNLOAD, INFO, DONE, UNDONE, GREEN_STATUS, YELLOW_STATUS
@@ -24,12 +24,20 @@ from staff.base import StaffCommandsCog
 
 logger = logging.getLogger('moddy.support_commands')
 
+# User mention (<@id> / <@!id>) in command arguments
+_MENTION_RE = re.compile(r'<@!?(\d+)>')
+
 
 class SupportCommands(StaffCommandsCog):
     """Support commands (sup. prefix)"""
 
     def __init__(self, bot):
         super().__init__(bot)
+        # command name -> handler, built once instead of an if/elif chain
+        self._handlers = {
+            "help": self.handle_help_command,
+            "subscription": self.handle_subscription_command,
+        }
 
     @commands.Cog.listener()
     async def on_message(self, message: discord.Message):
@@ -49,25 +57,26 @@ class SupportCommands(StaffCommandsCog):
         if command_type != CommandType.SUPPORT:
             return
 
+        if not self.first_delivery(message):
+            return
+
         allowed, reason = await staff_permissions.check_command_permission(
             message.author.id, command_type, command_name
         )
 
         if not allowed:
-            view = create_error_message("Permission Denied", reason)
-            await self.reply_with_tracking(message, view)
+            await self.reply_error(message, "Permission Denied", reason)
             return
 
-        if command_name == "help":
-            await self.handle_help_command(message, args)
-        elif command_name == "subscription":
-            await self.handle_subscription_command(message, args)
+        handler = self._handlers.get(command_name)
+        if handler:
+            await handler(message, args)
         else:
-            view = create_error_message(
+            await self.reply_error(
+                message,
                 "Unknown Command",
                 f"Support command `{command_name}` not found.\n\nUse `sup.help` to see available commands."
             )
-            await self.reply_with_tracking(message, view)
 
     async def handle_help_command(self, message: discord.Message, args: str):
         """
@@ -112,13 +121,14 @@ class SupportCommands(StaffCommandsCog):
         if not args:
             return None
 
-        args = args.replace(f"<@{self.bot.user.id}>", "").strip()
+        args = args.replace(f"<@{self.bot.user.id}>", "")
 
-        user_match = re.search(r'<@!?(\d+)>', args)
+        user_match = _MENTION_RE.search(args)
         if user_match:
             return int(user_match.group(1))
 
-        parts = args.split()
+        # Only the first token is needed: stop after one split
+        parts = args.split(maxsplit=1)
         if parts:
             try:
                 return int(parts[0])
@@ -135,12 +145,12 @@ class SupportCommands(StaffCommandsCog):
         """
         user_id = self._extract_user_id(args, message)
         if not user_id:
-            view = create_error_message(
+            await self.reply_error(
+                message,
                 "Invalid User",
                 "Please mention a user or provide a valid user ID.\n\n"
                 "**Usage:** `sup.subscription @user` or `sup.subscription [user_id]`"
             )
-            await self.reply_with_tracking(message, view)
             return
 
         if staff_logger:
@@ -150,15 +160,13 @@ class SupportCommands(StaffCommandsCog):
             try:
                 user = await self.bot.fetch_user(user_id)
             except discord.NotFound:
-                view = create_error_message("User Not Found", f"User with ID `{user_id}` not found on Discord.")
-                await self.reply_with_tracking(message, view)
+                await self.reply_error(message, "User Not Found", f"User with ID `{user_id}` not found on Discord.")
                 return
 
             # Read Premium status and stripe_customer_id directly from DB
             bot_db = self.bot.db
             if not bot_db:
-                view = create_error_message("Database Unavailable", "Cannot access database at this time.")
-                await self.reply_with_tracking(message, view)
+                await self.reply_error(message, "Database Unavailable", "Cannot access database at this time.")
                 return
 
             is_premium = await bot_db.has_attribute('user', user_id, 'PREMIUM')
@@ -189,9 +197,8 @@ class SupportCommands(StaffCommandsCog):
             await self.reply_with_tracking(message, view)
 
         except Exception as e:
-            logger.error(f"Unexpected error in sup.subscription: {e}", exc_info=True)
-            view = create_error_message("Error", "An unexpected error occurred.")
-            await self.reply_with_tracking(message, view)
+            logger.error("Unexpected error in sup.subscription: %s", e, exc_info=True)
+            await self.reply_error(message, "Error", "An unexpected error occurred.")
             if staff_logger:
                 await staff_logger.log_command(
                     "sup", "subscription", message.author,
@@ -38,6 +38,14 @@ class TestBasics:
         assert "a" in c
         assert "b" not in c
 
+    def test_discard(self):
+        c = LruTtlCache(max_entries=8)
+        c.set("a", 1)
+        c.discard("a")
+        c.discard("missing")
+        assert c.get("a") is MISS
+        assert len(c) == 0
+
 
 class TestLruEviction:
     def test_evicts_least_recently_used(self):
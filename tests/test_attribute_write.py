@@ -0,0 +1,122 @@
+"""Tests for ``AttributeRepository._write_attribute``: the previous value must
+reach the audit row and the caller (and thus the ``on_attribute_change`` hook).
+
+The Postgres round-trip only runs when ``MODDY_TEST_DATABASE_URL`` points to a
+disposable database; the tables are created in a temporary schema.
+"""
+
+import os
+import uuid
+
+import pytest
+
+from db.repositories.attributes import AttributeRepository
+
+DATABASE_URL = os.environ.get("MODDY_TEST_DATABASE_URL")
+
+
+@pytest.fixture
+async def conn():
+    if not DATABASE_URL:
+        pytest.skip("MODDY_TEST_DATABASE_URL not set")
+    asyncpg = pytest.importorskip("asyncpg")
+
+    schema = f"test_attributes_{uuid.uuid4().hex[:8]}"
+    connection = await asyncpg.connect(DATABASE_URL)
+    try:
+        await connection.execute(f"CREATE SCHEMA {schema}")
+        await connection.execute(f"SET search_path TO {schema}")
+        await connection.execute("""
+            CREATE TABLE users (
+                user_id BIGINT PRIMARY KEY,
+                attributes JSONB DEFAULT '{}'::jsonb,
+                updated_at TIMESTAMPTZ DEFAULT NOW()
+            )
+        """)
+        await connection.execute("""
+            CREATE TABLE attribute_changes (
+                id SERIAL PRIMARY KEY,
+                entity_type VARCHAR(10),
+                entity_id BIGINT NOT NULL,
+                attribute_name VARCHAR(50),
+                old_value TEXT,
+                new_value TEXT,
+                changed_by BIGINT,
+                reason TEXT
+            )
+        """)
+        yield connection
+    finally:
+        await connection.execute(f"DROP SCHEMA IF EXISTS {schema} CASCADE")
+        await connection.close()
+
+
+async def _audit(conn):
+    return [
+        (row["old_value"], row["new_value"])
+        for row in await conn.fetch(
+            "SELECT old_value, new_value FROM attribute_changes ORDER BY id"
+        )
+    ]
+
+
+async def test_old_value_round_trips(conn):
+    repo = AttributeRepository()
+
+    assert await repo._write_attribute(conn, "user", 1, "LANG", "FR", 0) is None
+    assert await repo._write_attribute(conn, "user", 1, "LANG", "EN", 0) == "FR"
+    assert await repo._write_attribute(conn, "user", 1, "LANG", None, 0) == "EN"
+
+    assert await _audit(conn) == [(None, "FR"), ("FR", "EN"), ("EN", None)]
+    attributes = await conn.fetchval("SELECT attributes FROM users WHERE user_id = 1")
+    assert attributes == "{}"
+
+
+async def test_old_value_round_trips_inside_outer_transaction(conn):
+    repo = AttributeRepository()
+
+    async with conn.transaction():
+        await repo._write_attribute(conn, "user", 2, "TEAM", True, 0)
+        assert await repo._write_attribute(conn, "user", 2, "TEAM", False, 0) is True
+
+    assert await _audit(conn) == [(None, "True"), ("True", "False")]
+
+
+class _FakeTransaction:
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+class _FakeConn:
+    """Records the statements; the locked read returns ``stored``."""
+
+    def __init__(self, stored):
+        self.stored = stored
+        self.statements = []
+
+    def transaction(self):
+        return _FakeTransaction()
+
+    async def fetchval(self, query, *args):
+        self.statements.append((" ".join(query.split()), args))
+        return self.stored
+
+    async def execute(self, query, *args):
+        self.statements.append((" ".join(query.split()), args))
+
+
+async def test_old_value_is_read_locked_before_the_upsert():
+    fake = _FakeConn('"FR"')
+
+    old = await AttributeRepository()._write_attribute(fake, "user", 1, "LANG", "EN", 0)
+
+    assert old == "FR"
+    (read, _), (upsert, _), (audit, audit_args) = fake.statements
+    assert read.startswith("SELECT attributes -> $2::text FROM users")
+    assert read.endswith("FOR UPDATE")
+    assert upsert.startswith("INSERT INTO users")
+    assert "attribute_changes" in audit
+    assert audit_args[3:5] == ("FR", "EN")
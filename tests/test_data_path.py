@@ -0,0 +1,34 @@
+"""Tests for ``db.repositories._utils.split_data_path`` and ``nested_set_sql``."""
+
+import pytest
+
+from db.repositories._utils import nested_set_sql, split_data_path
+
+
+def test_accepts_dotted_paths():
+    assert split_data_path("config.prefix") == ["config", "prefix"]
+    assert split_data_path("123456789.settings") == ["123456789", "settings"]
+    assert split_data_path("auto-role") == ["auto-role"]
+
+
+@pytest.mark.parametrize("path", [
+    "", "a..b", ".a", "a.", "a b", "{a}", "a,b", "'a'", '"a"', "a\n", None,
+])
+def test_rejects_malformed_paths(path):
+    with pytest.raises(ValueError):
+        split_data_path(path)
+
+
+def test_nested_set_sql_depth_1():
+    assert nested_set_sql("data", 1, "$2", "$3::jsonb") == (
+        "(COALESCE(data, '{}'::jsonb) || jsonb_build_object(($2)[1], $3::jsonb))"
+    )
+
+
+def test_nested_set_sql_depth_2():
+    assert nested_set_sql("data", 2, "$2", "$3::jsonb") == (
+        "(COALESCE(data, '{}'::jsonb) || jsonb_build_object(($2)[1], "
+        "((CASE WHEN jsonb_typeof(data #> ($2)[1:1]) = 'object' "
+        "THEN data #> ($2)[1:1] ELSE '{}'::jsonb END) "
+        "|| jsonb_build_object(($2)[2], $3::jsonb))))"
+    )
@@ -0,0 +1,19 @@
+"""Tests for ``staff.framework.parsing.parse_user_id``."""
+
+from staff.framework.parsing import parse_user_id
+
+
+def test_mentions_and_raw_ids():
+    assert parse_user_id("<@123>") == 123
+    assert parse_user_id(" <@!45> ") == 45
+    assert parse_user_id("12") == 12
+
+
+def test_invalid_input():
+    assert parse_user_id("<@12") is None
+    assert parse_user_id("abc") is None
+    assert parse_user_id("") is None
+    assert parse_user_id(None) is None
+    assert parse_user_id("+12") is None
+    assert parse_user_id("-12") is None
+    assert parse_user_id("1_2") is None
@@ -0,0 +1,16 @@
+"""Tests for ``utils.uptime.format_uptime``."""
+
+from utils.uptime import format_uptime
+
+
+def test_zero_shows_seconds():
+    assert format_uptime(0) == "0s"
+
+
+def test_omits_zero_units():
+    assert format_uptime(3600) == "1h"
+    assert format_uptime(86400 + 61) == "1d 1m 1s"
+
+
+def test_all_units():
+    assert format_uptime(2 * 86400 + 3 * 3600 + 4 * 60 + 5) == "2d 3h 4m 5s"
@@ -66,6 +66,8 @@ VERIFIED_ORG_MEMBER = "<:verified:1495533349266264230>"  # same visual as VERIFI
 MINI_VERIFIED = "<:miniverified:1439667456737280021>"
 NOTE = "<:note:1519790932663468184>"
 MESSAGE = "<:message:1519790643784843416>"
+SERVER = "<:server:1519788576420921476>"
+DATA_OBJECT = "<:data_object:1519795407453159474>"
 GROUPS = "<:groups:1519789805456724049>"
 WAVING_HAND = "<:waving_hand:1519789691711393982>"
 FLAG = "<:flag:1519789496181461183>"
@@ -214,6 +216,8 @@ EMOJIS = {
     "back": BACK,
     "note": NOTE,
     "message": MESSAGE,
+    "server": SERVER,
+    "data_object": DATA_OBJECT,
     "search": SEARCH,
     "save": SAVE,
     "reply": REPLY,
@@ -69,6 +69,9 @@ class I18n:
     _translations: Dict[str, Dict[str, Any]] = {}
     _default_locale = Locale.EN_US
     _supported_locales = set()
+    # (locale, key) -> resolved template (None when missing), English
+    # fallback included; cleared whenever translations are (re)loaded.
+    _templates: Dict[tuple, Any] = {}
 
     def __new__(cls):
         if cls._instance is None:
@@ -84,6 +87,7 @@ class I18n:
     def load_translations(self):
         """Charge toutes les traductions depuis les fichiers JSON"""
         translations_dir = Path(__file__).parent.parent / 'locales'
+        self._templates.clear()
 
         if not translations_dir.exists():
             logger.warning(f"⚠️ Dossier de traductions non trouvé : {translations_dir}")
@@ -168,15 +172,14 @@ class I18n:
         else:
             target_locale = self._default_locale.value
 
-        # Récupérer la traduction
-        text = self._get_nested_key(self._translations.get(target_locale, {}), key)
-
-        # Si pas trouvé, essayer en anglais
-        if text is None and target_locale != self._default_locale.value:
-            text = self._get_nested_key(
-                self._translations.get(self._default_locale.value, {}),
-                key
-            )
+        # Récupérer la traduction (résolution mise en cache : la même clé est
+        # demandée à chaque rendu de vue)
+        cache_key = (target_locale, key)
+        try:
+            text = self._templates[cache_key]
+        except KeyError:
+            text = self._resolve_template(target_locale, key)
+            self._templates[cache_key] = text
 
         # Si toujours pas trouvé, retourner la clé
         if text is None:
@@ -192,6 +195,18 @@ class I18n:
 
         return text
 
+    def _resolve_template(self, locale: str, key: str) -> Optional[str]:
+        """Cherche la clé dans la locale demandée, puis en anglais"""
+        text = self._get_nested_key(self._translations.get(locale, {}), key)
+
+        # Si pas trouvé, essayer en anglais
+        if text is None and locale != self._default_locale.value:
+            text = self._get_nested_key(
+                self._translations.get(self._default_locale.value, {}),
+                key
+            )
+        return text
+
     def _get_nested_key(self, data: dict, key: str) -> Optional[str]:
         """
         Récupère une valeur dans un dictionnaire avec des clés imbriquées
@@ -264,7 +279,7 @@ class I18n:
                         try:
                             name = name.format(**kwargs)
                             value = value.format(**kwargs)
-                        except:
+                        except Exception:
                             pass
 
                     embed.add_field(name=name, value=value, inline=inline)
@@ -26,17 +26,17 @@ class StaffLogger:
         try:
             guild = self.bot.get_guild(self.log_server_id)
             if not guild:
-                logger.warning(f"Staff log guild not found: {self.log_server_id}")
+                logger.warning("Staff log guild not found: %s", self.log_server_id)
                 return None
 
             channel = guild.get_channel(self.log_channel_id)
             if not channel:
-                logger.warning(f"Staff log channel not found: {self.log_channel_id}")
+                logger.warning("Staff log channel not found: %s", self.log_channel_id)
                 return None
 
             return channel
         except Exception as e:
-            logger.error(f"Error getting staff log channel: {e}")
+            logger.error("Error getting staff log channel: %s", e)
             return None
 
     async def log_command(
@@ -76,7 +76,7 @@ class StaffLogger:
                 guild=target_server,
                 success=success,
             )
-            logger.info(f"Logged staff command: {command_type}.{command_name} by {executor.id}")
+            logger.info("Logged staff command: %s.%s by %s", command_type, command_name, executor.id)
 
     async def log_action(
         self,
@@ -157,10 +157,10 @@ class StaffLogger:
                     )
 
             await channel.send(embed=embed)
-            logger.info(f"Logged staff action: {action} by {executor.id}")
+            logger.info("Logged staff action: %s by %s", action, executor.id)
 
         except Exception as e:
-            logger.error(f"Error logging staff action: {e}")
+            logger.error("Error logging staff action: %s", e)
 
 
 # Global instance (will be initialized by the bot)
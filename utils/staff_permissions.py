@@ -3,10 +3,13 @@ Staff Permissions System for MODDY
 Handles role hierarchy, permissions, and command access control
 """
 
+import asyncio
 from enum import Enum
 from typing import List, Optional, Set
 import logging
 
+from automod.cache import LruTtlCache, MISS
+
 logger = logging.getLogger('moddy.staff_permissions')
 
 
@@ -51,10 +54,13 @@ ROLE_HIERARCHY = {
     StaffRole.DEV: 1000  # Dev is apart from hierarchy
 }
 
+# Stored role value -> StaffRole (plain dict lookup, no Enum call)
+ROLE_BY_VALUE = {role.value: role for role in StaffRole}
+
 
-# Command type to required roles mapping
+# Command type to required roles mapping (frozensets: membership tests only)
 COMMAND_TYPE_ROLES = {
-    CommandType.TEAM: [
+    CommandType.TEAM: frozenset({
         StaffRole.MANAGER,
         StaffRole.SUPERVISOR_MOD,
         StaffRole.SUPERVISOR_COM,
@@ -63,24 +69,24 @@ COMMAND_TYPE_ROLES = {
         StaffRole.COMMUNICATION,
         StaffRole.SUPPORT,
         StaffRole.DEV
-    ],
-    CommandType.DEV: [StaffRole.DEV],
-    CommandType.MANAGEMENT: [StaffRole.MANAGER],
-    CommandType.MODERATOR: [
+    }),
+    CommandType.DEV: frozenset({StaffRole.DEV}),
+    CommandType.MANAGEMENT: frozenset({StaffRole.MANAGER}),
+    CommandType.MODERATOR: frozenset({
         StaffRole.MANAGER,
         StaffRole.SUPERVISOR_MOD,
         StaffRole.MODERATOR
-    ],
-    CommandType.SUPPORT: [
+    }),
+    CommandType.SUPPORT: frozenset({
         StaffRole.MANAGER,
         StaffRole.SUPERVISOR_SUP,
         StaffRole.SUPPORT
-    ],
-    CommandType.COMMUNICATION: [
+    }),
+    CommandType.COMMUNICATION: frozenset({
         StaffRole.MANAGER,
         StaffRole.SUPERVISOR_COM,
         StaffRole.COMMUNICATION
-    ]
+    })
 }
 
 
@@ -95,6 +101,45 @@ class StaffPermissionManager:
 
     def __init__(self, bot):
         self.bot = bot
+        # staff_permissions rows, read on every staff command and role check.
+        # Invalidated by the DB on each staff write; the TTL only bounds writes
+        # that bypass the repository (raw SQL).
+        self._perms_cache = LruTtlCache(max_entries=1024, ttl_seconds=30)
+        # TEAM attribute per user, same lifetime and invalidation
+        self._team_cache = LruTtlCache(max_entries=1024, ttl_seconds=30)
+
+    async def get_staff_record(self, user_id: int) -> dict:
+        """Cached staff_permissions record for a user"""
+        perms = self._perms_cache.get(user_id)
+        if perms is MISS:
+            perms = await self.bot.db.get_staff_permissions(user_id)
+            self._perms_cache.set(user_id, perms)
+        return perms
+
+    async def is_team_member(self, user_id: int) -> bool:
+        """Cached TEAM attribute check for a user"""
+        is_team = self._team_cache.get(user_id)
+        if is_team is MISS:
+            user_data = await self.bot.db.get_user(user_id)
+            is_team = bool(user_data['attributes'].get('TEAM'))
+            self._team_cache.set(user_id, is_team)
+        return is_team
+
+    async def get_staff_member(self, user_id: int) -> dict:
+        """TEAM flag and staff record for a user, read in one query
+
+        Primes both caches, so permission checks on the same user that
+        follow (can_modify_user, check_command_permission) stay in memory.
+        """
+        member = await self.bot.db.get_staff_member(user_id)
+        self._team_cache.set(user_id, member['is_team'])
+        self._perms_cache.set(user_id, member['permissions'])
+        return member
+
+    def invalidate(self, user_id: int):
+        """Drop a user's cached record (called after any staff permissions or TEAM write)"""
+        self._perms_cache.discard(user_id)
+        self._team_cache.discard(user_id)
 
     async def get_user_roles(self, user_id: int) -> List[StaffRole]:
         """Get all roles for a user"""
@@ -110,16 +155,16 @@ class StaffPermissionManager:
             return [StaffRole.MANAGER, StaffRole.DEV]
 
         # Get from database
-        perms = await self.bot.db.get_staff_permissions(user_id)
+        perms = await self.get_staff_record(user_id)
         roles = []
 
         for role_str in perms['roles']:
-            try:
-                # Convert string to StaffRole enum
-                role = StaffRole(role_str)
+            # Convert string to StaffRole enum
+            role = ROLE_BY_VALUE.get(role_str)
+            if role is None:
+                logger.warning("Invalid role in database: %s", role_str)
+            else:
                 roles.append(role)
-            except ValueError:
-                logger.warning(f"Invalid role in database: {role_str}")
 
         return roles
 
@@ -133,7 +178,7 @@ class StaffPermissionManager:
         if not self.bot.db:
             return []
 
-        perms = await self.bot.db.get_staff_permissions(user_id)
+        perms = await self.get_staff_record(user_id)
         return perms['denied_commands']
 
     async def is_command_denied(self, user_id: int, command_name: str) -> bool:
@@ -141,17 +186,18 @@ class StaffPermissionManager:
         denied = await self.get_denied_commands(user_id)
         return command_name in denied
 
-    async def can_use_command_type(self, user_id: int, command_type: CommandType) -> bool:
-        """Check if user can use a command type based on their roles"""
-        user_roles = await self.get_user_roles(user_id)
-        required_roles = COMMAND_TYPE_ROLES.get(command_type, [])
+    async def can_use_command_type(self, user_id: int, command_type: CommandType,
+                                   roles: Optional[List[StaffRole]] = None) -> bool:
+        """Check if user can use a command type based on their roles
 
-        # Check if user has any of the required roles
-        for role in user_roles:
-            if role in required_roles:
-                return True
+        ``roles``: the user's roles if the caller already resolved them
+        (one lookup reused across several checks).
+        """
+        user_roles = roles if roles is not None else await self.get_user_roles(user_id)
+        required_roles = COMMAND_TYPE_ROLES.get(command_type, frozenset())
 
-        return False
+        # Check if user has any of the required roles
+        return not required_roles.isdisjoint(user_roles)
 
     async def can_use_command(self, user_id: int, command_type: CommandType, command_name: str) -> bool:
         """Check if user can use a specific command"""
@@ -184,19 +230,20 @@ class StaffPermissionManager:
         if modifier_id == target_id:
             return False
 
-        # Get roles
-        modifier_roles = await self.get_user_roles(modifier_id)
-        target_roles = await self.get_user_roles(target_id)
-
         # Can't modify dev team members
         if self.bot.is_developer(target_id):
             return False
 
+        # Get roles (both usually cached; otherwise the two reads overlap)
+        modifier_roles, target_roles = await asyncio.gather(
+            self.get_user_roles(modifier_id), self.get_user_roles(target_id)
+        )
+
         # Get highest level of modifier
-        modifier_level = max([self.get_role_level(r) for r in modifier_roles], default=0)
+        modifier_level = max(map(self.get_role_level, modifier_roles), default=0)
 
         # Get highest level of target
-        target_level = max([self.get_role_level(r) for r in target_roles], default=0)
+        target_level = max(map(self.get_role_level, target_roles), default=0)
 
         # Can only modify if modifier level is strictly higher
         return modifier_level > target_level
@@ -249,13 +296,13 @@ class StaffPermissionManager:
         # Split into parts
         parts = content.split(maxsplit=1)
         if not parts:
-            logger.debug(f"❌ Parse failed: No command after prefix")
+            logger.debug("❌ Parse failed: No command after prefix")
             return None
 
         # Parse type.command
         command_part = parts[0]
         if '.' not in command_part:
-            logger.debug(f"❌ Parse failed: No '.' in command part: {command_part}")
+            logger.debug("❌ Parse failed: No '.' in command part: %s", command_part)
             return None
 
         type_str, command_name = command_part.split('.', 1)
@@ -267,20 +314,23 @@ class StaffPermissionManager:
         try:
             command_type = CommandType(type_str)
         except ValueError:
-            logger.debug(f"❌ Parse failed: Invalid command type: {type_str}")
+            logger.debug("❌ Parse failed: Invalid command type: %s", type_str)
             return None
 
-        logger.debug(f"✅ Parsed: {command_type.value}.{command_name} with args: {args[:50]}")
+        logger.debug("✅ Parsed: %s.%s with args: %.50s", command_type.value, command_name, args)
         return (command_type, command_name, args)
 
-    async def check_command_permission(self, user_id: int, command_type: CommandType, command_name: str) -> tuple:
+    async def check_command_permission(self, user_id: int, command_type: CommandType, command_name: str,
+                                       roles: Optional[List[StaffRole]] = None) -> tuple:
         """
         Check if user has permission to use a command
         Returns: (allowed: bool, reason: str)
+
+        ``roles``: the user's roles, when already resolved by the caller
         """
         # Super admin bypasses all checks
         if user_id == self.SUPER_ADMIN_ID:
-            logger.debug(f"✅ Super admin {user_id} granted access to {command_type.value}.{command_name}")
+            logger.debug("✅ Super admin %s granted access to %s.%s", user_id, command_type.value, command_name)
             return (True, "")
 
         # Developers bypass most checks
@@ -290,38 +340,37 @@ class StaffPermissionManager:
         if not self.bot.db:
             # If db is not available, only allow super admin and devs
             if is_dev:
-                logger.debug(f"✅ Developer {user_id} granted access (database unavailable)")
+                logger.debug("✅ Developer %s granted access (database unavailable)", user_id)
                 return (True, "")
-            logger.error(f"❌ Permission check failed: Database not available")
+            logger.error("❌ Permission check failed: Database not available")
             return (False, "Database not available")
 
-        user_data = await self.bot.db.get_user(user_id)
-        has_team_attr = user_data['attributes'].get('TEAM')
+        has_team_attr = await self.is_team_member(user_id)
 
-        logger.debug(f"🔍 Checking permissions for user {user_id}:")
-        logger.debug(f"   TEAM attribute: {has_team_attr}")
-        logger.debug(f"   Is developer: {is_dev}")
+        logger.debug("🔍 Checking permissions for user %s: TEAM attribute: %s, is developer: %s",
+                     user_id, has_team_attr, is_dev)
 
         if not has_team_attr and not is_dev:
-            logger.warning(f"❌ User {user_id} is not a staff member (no TEAM attribute and not in dev team)")
+            logger.warning("❌ User %s is not a staff member (no TEAM attribute and not in dev team)", user_id)
             return (False, "You are not a staff member")
 
-        # Get user roles for debugging
-        user_roles = await self.get_user_roles(user_id)
-        logger.debug(f"   User roles: {[r.value for r in user_roles]}")
+        # User roles, for debugging only
+        if logger.isEnabledFor(logging.DEBUG):
+            user_roles = roles if roles is not None else await self.get_user_roles(user_id)
+            logger.debug("   User roles: %s", [r.value for r in user_roles])
 
         # Check command type permission
-        if not await self.can_use_command_type(user_id, command_type):
-            logger.warning(f"❌ User {user_id} cannot use {command_type.value} commands (missing required role)")
+        if not await self.can_use_command_type(user_id, command_type, roles):
+            logger.warning("❌ User %s cannot use %s commands (missing required role)", user_id, command_type.value)
             return (False, f"You don't have permission to use {command_type.value}. commands")
 
         # Check if command is specifically denied
         full_command = f"{command_type.value}.{command_name}"
         if await self.is_command_denied(user_id, full_command):
-            logger.warning(f"❌ Command {full_command} is specifically denied for user {user_id}")
+            logger.warning("❌ Command %s is specifically denied for user %s", full_command, user_id)
             return (False, f"You don't have permission to use this specific command")
 
-        logger.debug(f"✅ Permission granted for user {user_id} to use {full_command}")
+        logger.debug("✅ Permission granted for user %s to use %s", user_id, full_command)
         return (True, "")
 
 
@@ -333,5 +382,7 @@ def setup_staff_permissions(bot):
     """Initialize staff permissions system"""
     global staff_permissions
     staff_permissions = StaffPermissionManager(bot)
+    if bot.db:
+        bot.db.on_staff_permissions_change = staff_permissions.invalidate
     logger.info("✅ Staff permissions system initialized")
     return staff_permissions
@@ -84,67 +84,72 @@ ROLE_PERMISSIONS_MAP: Dict[str, List[str]] = {
     "Manager": MANAGER_PERMISSIONS,
 }
 
+# Human-readable labels, built once (the lookups run per option on every
+# staff panel rebuild)
+PERMISSION_LABELS = {
+    # Common
+    "flex": "Flex (Team Verification)",
+    "invite": "Server Invites",
+    "serverinfo": "Server Information",
+
+    # Moderator (Case Management)
+    "case_create": "Create Moderation Cases",
+    "case_view": "View Moderation Cases",
+    "case_list": "List Moderation Cases",
+    "case_edit": "Edit Case Reason",
+    "case_close": "Close / Reopen Cases",
+    "case_note": "Comment / Note on Cases",
+    "case_sanction": "Add / Revoke Sanctions",
+    "interserver_info": "Inter-Server Message Info",
+    "interserver_delete": "Delete Inter-Server Messages",
+
+    # Support
+    "ticket_view": "View Tickets",
+    "ticket_close": "Close Tickets",
+    "ticket_create": "Create Tickets",
+    "subscription_view": "View User Subscriptions",
+    "subscription_manage": "Manage Subscriptions (Refunds)",
+
+    # Communication
+    "announce": "Send Announcements",
+    "broadcast": "Broadcast Messages",
+
+    # Supervisor specific
+    "manage_mod": "Manage Moderators",
+    "manage_sup": "Manage Support Agents",
+    "manage_com": "Manage Communication Team",
+
+    # Manager
+    "rank": "Add Staff Members",
+    "unrank": "Remove Staff Members",
+    "setstaff": "Manage Staff Permissions",
+    "stafflist": "View Staff List",
+    "staffinfo": "View Staff Information",
+    "badge_manage": "Manage User Verification Badges",
+
+    # Operations / platform
+    "redirect_manage": "Manage Redirect Links",
+    "banner_manage": "Manage Site Banners",
+    "stripe_manage": "Manage Stripe / Billing",
+    "official_manage": "Manage Official Servers",
+}
+
+ROLE_DISPLAY_NAMES = {
+    "Moderator": "Moderator",
+    "Support": "Support Agent",
+    "Communication": "Communication",
+    "Supervisor_Mod": "Moderation Supervisor",
+    "Supervisor_Sup": "Support Supervisor",
+    "Supervisor_Com": "Communication Supervisor",
+    "Manager": "Manager",
+    "Dev": "Developer",
+}
+
 def get_permission_label(permission: str) -> str:
     """Get human-readable label for a permission"""
-    labels = {
-        # Common
-        "flex": "Flex (Team Verification)",
-        "invite": "Server Invites",
-        "serverinfo": "Server Information",
-
-        # Moderator (Case Management)
-        "case_create": "Create Moderation Cases",
-        "case_view": "View Moderation Cases",
-        "case_list": "List Moderation Cases",
-        "case_edit": "Edit Case Reason",
-        "case_close": "Close / Reopen Cases",
-        "case_note": "Comment / Note on Cases",
-        "case_sanction": "Add / Revoke Sanctions",
-        "interserver_info": "Inter-Server Message Info",
-        "interserver_delete": "Delete Inter-Server Messages",
-
-        # Support
-        "ticket_view": "View Tickets",
-        "ticket_close": "Close Tickets",
-        "ticket_create": "Create Tickets",
-        "subscription_view": "View User Subscriptions",
-        "subscription_manage": "Manage Subscriptions (Refunds)",
-
-        # Communication
-        "announce": "Send Announcements",
-        "broadcast": "Broadcast Messages",
-
-        # Supervisor specific
-        "manage_mod": "Manage Moderators",
-        "manage_sup": "Manage Support Agents",
-        "manage_com": "Manage Communication Team",
-
-        # Manager
-        "rank": "Add Staff Members",
-        "unrank": "Remove Staff Members",
-        "setstaff": "Manage Staff Permissions",
-        "stafflist": "View Staff List",
-        "staffinfo": "View Staff Information",
-        "badge_manage": "Manage User Verification Badges",
-
-        # Operations / platform
-        "redirect_manage": "Manage Redirect Links",
-        "banner_manage": "Manage Site Banners",
-        "stripe_manage": "Manage Stripe / Billing",
-        "official_manage": "Manage Official Servers",
-    }
-    return labels.get(permission, permission.replace("_", " ").title())
+    label = PERMISSION_LABELS.get(permission)
+    return label if label is not None else permission.replace("_", " ").title()
 
 def get_role_display_name(role: str) -> str:
     """Get human-readable display name for a role"""
-    names = {
-        "Moderator": "Moderator",
-        "Support": "Support Agent",
-        "Communication": "Communication",
-        "Supervisor_Mod": "Moderation Supervisor",
-        "Supervisor_Sup": "Support Supervisor",
-        "Supervisor_Com": "Communication Supervisor",
-        "Manager": "Manager",
-        "Dev": "Developer",
-    }
-    return names.get(role, role)
+    return ROLE_DISPLAY_NAMES.get(role, role)
@@ -21,7 +21,6 @@ from __future__ import annotations
 
 import asyncio
 import io
-import json
 import logging
 import time
 from datetime import datetime, timezone
@@ -29,6 +28,7 @@ from typing import Any, Optional
 
 import aiohttp
 import discord
+import orjson
 from discord import ui, SeparatorSpacing
 
 from config import LOG_WEBHOOKS, LOG_WEBHOOK_DEFAULT, ENV_MODE
@@ -188,8 +188,11 @@ class TechLogger:
 
     async def log_guild_join(self, guild: discord.Guild):
         try:
-            humans = sum(1 for m in guild.members if not m.bot) if guild.members else None
-            bots = sum(1 for m in guild.members if m.bot) if guild.members else None
+            # guild.members builds a new list on each access: read it once,
+            # count bots in one pass and derive humans from the total
+            cached_members = guild.members
+            bots = sum(1 for m in cached_members if m.bot) if cached_members else None
+            humans = len(cached_members) - bots if cached_members else None
             members = guild.member_count or 0
             owner = f"`{guild.owner}`" if guild.owner else "unknown"
 
@@ -504,6 +507,15 @@ class TechLogger:
     # we cap well under that to keep the feed snappy.
     _MAX_FILE_CHARS = 200_000
 
+    @staticmethod
+    def _dump_json(data: Any) -> str:
+        """Pretty-print a payload for the attached files. orjson writes UTF-8
+        directly (no ensure_ascii pass) and is several times faster than the
+        stdlib on the multi-KB prompts/responses this feed carries."""
+        return orjson.dumps(
+            data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS, default=str,
+        ).decode()
+
     @staticmethod
     def _format_request(payload: Any) -> str:
         """Render the request payload (the prompt sent) as readable text."""
@@ -519,9 +531,9 @@ class TechLogger:
                 extra = {k: v for k, v in payload.items() if k != "messages"}
                 if extra:
                     parts.append("===== PARAMS =====\n"
-                                 + json.dumps(extra, ensure_ascii=False, indent=2))
+                                 + TechLogger._dump_json(extra))
                 return "\n\n".join(parts)
-            return json.dumps(payload, ensure_ascii=False, indent=2)
+            return TechLogger._dump_json(payload)
         return str(payload)
 
     @staticmethod
@@ -532,7 +544,7 @@ class TechLogger:
         if isinstance(data, str):
             return data
         if isinstance(data, dict):
-            return json.dumps(data, ensure_ascii=False, indent=2)
+            return TechLogger._dump_json(data)
         if isinstance(data, list):
             # Embedding responses: list of float vectors. Dumping 1536 floats is
             # useless noise, but a bare "(vectors omitted)" hides the real
@@ -549,7 +561,7 @@ class TechLogger:
                 if len(data) > 8:
                     lines.append(f"… (+{len(data) - 8} more vectors)")
                 return "\n".join(lines)
-            return json.dumps(data, ensure_ascii=False, indent=2)
+            return TechLogger._dump_json(data)
         return str(data)
 
     def _make_file(self, text: str, filename: str) -> Optional[discord.File]:
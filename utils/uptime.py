@@ -0,0 +1,15 @@
+"""
+Uptime formatting shared by /ping and /dev stats
+"""
+
+
+def format_uptime(seconds: int) -> str:
+    """Formats a duration as "2d 3h 4m 5s", omitting zero units (integer math only)"""
+    days, remainder = divmod(int(seconds), 86400)
+    hours, remainder = divmod(remainder, 3600)
+    minutes, secs = divmod(remainder, 60)
+
+    parts = [f"{value}{unit}" for value, unit in ((days, "d"), (hours, "h"), (minutes, "m")) if value]
+    if secs or not parts:
+        parts.append(f"{secs}s")
+    return " ".join(parts)